@@ -1,3 +1,5 @@
+import asyncio
+
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 
 from app.agents.models.output import IntentOutput, IntentType, IntentSlots, InputType
@@ -6,6 +8,53 @@ from app.agents.models.state import TravelState
 from app.core.llm_factory import LLMFactory
 from app.agents.models.output import CategoryType
 from app.utils.geocoder import LANDMARK_DESC, normalize_location
+from app.utils.config import (
+    ENABLE_SPECULATIVE_RETRIEVAL, ENABLE_INTENT_FAST_PATH, ENABLE_INTENT_LOG, INTENT_LOG_PATH,
+    ENABLE_LANDMARK_PRESELECT, ENABLE_LANDMARK_EMBEDDING_MATCH, INTENT_FAST_PATH_MAX_SUMMARY_LAG,
+)
+from app.agents.intent_classifier import IntentClassifier, append_intent_log, build_fast_intent
+from app.core.retrieval.place import PlaceRetriever
+from app.agents.retriever import build_speculative_request
+from app.agents.speculative import cancel_speculative_search, start_speculative_search
+from app.agents.landmark_candidates import build_landmark_desc
+
+async def _try_fast_intent(user_input: str, state: TravelState) -> IntentOutput | None:
+    """로컬 intent 분류기가 확신하면 LLM 없이 IntentOutput 반환. 아니면 None."""
+    classifier = IntentClassifier.get_instance()
+    # 이미지 첨부 턴은 IMAGE_SIMILAR 판단이 필요하므로 항상 LLM
+    if classifier is None or state.get("input_image"):
+        return None
+    # fast path 턴은 요약을 갱신하지 않으므로 연속 횟수 상한 도달 시 LLM으로 요약 갱신
+    if (state.get("summary_lag_turns") or 0) >= INTENT_FAST_PATH_MAX_SUMMARY_LAG:
+        print(f"[Intent] fast path skipped (summary lag={state.get('summary_lag_turns')})")
+        return None
+    try:
+        vector = await PlaceRetriever.get_instance().aencode_query(user_input)
+    except Exception as e:
+        print(f"[WARN] intent fast path encode failed: {e}")
+        return None
+    label, prob = classifier.confident_intent(vector)
+    if label is None:
+        print(f"[Intent] fast path skipped (p={prob:.2f})")
+        return None
+    print(f"[Intent] fast path: {label} (p={prob:.2f})")
+    return build_fast_intent(user_input, label, state)
+
+
+async def _landmark_desc_for_prompt(user_input: str, messages: list) -> str:
+    """intent 프롬프트에 넣을 표준 장소 목록. 후보 선별이 켜져 있으면 관련 장소 상위 N개만."""
+    if not ENABLE_LANDMARK_PRESELECT:
+        return LANDMARK_DESC
+    retriever = None
+    if ENABLE_LANDMARK_EMBEDDING_MATCH:
+        try:
+            retriever = PlaceRetriever.get_instance()
+        except Exception as e:
+            print(f"[WARN] landmark embedding match unavailable: {e}")
+    landmark_desc, selected = await build_landmark_desc(user_input, messages, retriever)
+    print(f"[Intent] landmark candidates: {selected}")
+    return landmark_desc
+
 
 async def intent_node(state: TravelState):
     """
@@ -33,14 +82,16 @@ async def intent_node(state: TravelState):
                 "slots": IntentSlots(input_type=InputType.IMAGE),
                 "summary_title": "이미지 검색",
                 "summary_message": "이미지 기반 장소 검색 요청",
+                "speculative_search_id": None,
              }
         return {
             "intents": [IntentType.GENERAL],
             "primary_intent": IntentType.GENERAL,
         }
 
-    # 최근 10개 메시지만 사용
-    messages = state.get("messages", [])[-10:]
+    # 최근 10개 메시지만 사용 (직전 fast path 턴들이 요약에 반영되지 않았으면 그만큼 더 포함)
+    summary_lag = state.get("summary_lag_turns") or 0
+    messages = state.get("messages", [])[-(10 + 2 * summary_lag):]
 
     # LLM 및 Structured Output 설정
     llm = LLMFactory.get_llm()
@@ -54,18 +105,38 @@ async def intent_node(state: TravelState):
 
     chain = prompt | structured_llm
 
+    # intent LLM 호출 동안 원문 + 추정 slot으로 검색을 미리 시작 (retriever_node에서 slot이 같으면 재사용)
+    speculative_id = None
+    if ENABLE_SPECULATIVE_RETRIEVAL:
+        speculative_id = start_speculative_search(lambda: build_speculative_request(state))
+
     print(f"[Intent] Prefs info from state: {prefs_info}")
-    result = await chain.ainvoke({
-            "messages": messages,
-            "user_input": user_input,
-            "prefs_info": prefs_info,
-            "category_desc": CategoryType.description(),
-            "summary_title": summary_title,
-            "summary_message": summary_message,
-            "landmark_desc": LANDMARK_DESC,
-        })
+    try:
+        # 명확한 요청은 로컬 분류기 + 규칙 slot으로 처리 (LLM 호출 생략)
+        result = await _try_fast_intent(user_input, state) if ENABLE_INTENT_FAST_PATH else None
+        source = "fast_path" if result is not None else "llm"
+        if result is None:
+            landmark_desc = await _landmark_desc_for_prompt(user_input, messages)
+            result = await chain.ainvoke({
+                    "messages": messages,
+                    "user_input": user_input,
+                    "prefs_info": prefs_info,
+                    "category_desc": CategoryType.description(),
+                    "summary_title": summary_title,
+                    "summary_message": summary_message,
+                    "landmark_desc": landmark_desc,
+                })
+    except BaseException:
+        cancel_speculative_search(speculative_id)
+        raise
 
     print("Intent Result : ", result)
+    if ENABLE_INTENT_LOG:
+        await asyncio.to_thread(append_intent_log, INTENT_LOG_PATH, user_input, result, source)
+    if result.primary_intent in (IntentType.GENERAL, IntentType.TRIP_PLANNING):
+        # retriever_node 일반 검색을 거치지 않는 경로 → 추측 검색 폐기
+        cancel_speculative_search(speculative_id)
+        speculative_id = None
 
     # --- 표준 장소 후처리: LLM 반환 location을 서버에서 최종 정규화 ---
     slots = result.slots
@@ -92,6 +163,9 @@ async def intent_node(state: TravelState):
         "summary_title": result.summary_title,
         "summary_message": result.summary_message,
         "prefs_info": prefs_info,
+        "speculative_search_id": speculative_id,
+        # 요약을 갱신하지 않은 연속 fast path 턴 수 (LLM 턴이면 0)
+        "summary_lag_turns": summary_lag + 1 if source == "fast_path" else 0,
         "candidates": [],
         "candidate_pool": [],
         "selected_ids": [],
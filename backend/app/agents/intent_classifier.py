@@ -0,0 +1,224 @@
+"""
+intent_classifier.py — 로컬 intent 분류기 (intent LLM 호출 생략용 fast path)
+
+intent_node는 매 턴 INTENT_PROMPT + 표준 장소 목록 + 카테고리 설명을 담아 OpenAI structured output을 호출한다.
+인사말이나 "홍대 근처 맛집" 같은 명확한 요청은 로컬에서 처리한다.
+- 입력: 검색에서도 쓰는 BGE-M3 query 임베딩 (embedding 캐시 공유)
+- 분류: numpy softmax 선형 head (evaluation/train_intent_classifier.py로 intent 로그에서 학습)
+- slot: 규칙 기반 추정(guess_slots: 표준 장소명 / 카테고리 키워드)
+- 학습 label: LLM이 질문을 재작성했거나(update_user_input) 규칙 slot이 LLM slot과 다르면 FALLBACK_LABEL
+  → 분류기가 확신하는 경우 = 규칙 slot으로 충분한 경우. 확신이 낮거나 FALLBACK이면 LLM 호출.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Iterable
+
+import numpy as np
+
+from app.agents.models.output import IntentOutput, IntentSlots, IntentType
+from app.agents.speculative import guess_slots
+from app.utils.config import (
+    INTENT_CLASSIFIER_PATH,
+    INTENT_FAST_PATH_INTENTS,
+    INTENT_FAST_PATH_THRESHOLD,
+    INTENT_LOG_BACKUP_COUNT,
+    INTENT_LOG_MAX_BYTES,
+)
+from app.utils.geocoder import normalize_location
+
+FALLBACK_LABEL = "_LLM"
+
+
+def _category_values(categories: Iterable[Any] | None) -> set[str]:
+    return {str(getattr(c, "value", c)) for c in (categories or [])}
+
+
+def _location_name(slots: dict[str, Any] | None) -> str | None:
+    location = (slots or {}).get("location") or {}
+    name = location.get("name") if isinstance(location, dict) else getattr(location, "name", None)
+    if not name:
+        return None
+    norm = normalize_location(name)
+    return norm.normalized_location if norm.canonical_matched else name
+
+
+def rule_slots_agree(text: str, llm_slots: dict[str, Any] | None) -> bool:
+    """규칙 slot(guess_slots)이 LLM slot의 categories / location과 같은지."""
+    guessed = guess_slots(text)
+    guessed_location = guessed.location.name if guessed.location else None
+    return (
+        _category_values(guessed.categories) == _category_values((llm_slots or {}).get("categories"))
+        and guessed_location == _location_name(llm_slots)
+    )
+
+
+def training_label(record: dict[str, Any]) -> str:
+    """intent 로그 1건 → 학습 label (primary_intent 또는 FALLBACK_LABEL)."""
+    primary = str(record.get("primary_intent") or "")
+    if record.get("update_user_input") or primary not in INTENT_FAST_PATH_INTENTS:
+        return FALLBACK_LABEL
+    # GENERAL은 검색을 하지 않으므로 slot 비교 불필요
+    if primary != IntentType.GENERAL.value and not rule_slots_agree(record.get("user_input") or "", record.get("slots")):
+        return FALLBACK_LABEL
+    return primary
+
+
+def _normalize_rows(x: np.ndarray) -> np.ndarray:
+    x = np.asarray(x, dtype=np.float32)
+    if x.ndim == 1:
+        x = x[None, :]
+    return x / np.maximum(np.linalg.norm(x, axis=1, keepdims=True), 1e-12)
+
+
+class IntentClassifier:
+    """임베딩 → intent label softmax 선형 분류기."""
+
+    _instance = None
+    _loaded = False
+
+    @classmethod
+    def get_instance(cls) -> "IntentClassifier | None":
+        """INTENT_CLASSIFIER_PATH 모델 1회 로드. 파일이 없거나 로드 실패면 None (fast path 비활성)."""
+        if not cls._loaded:
+            cls._loaded = True
+            if os.path.exists(INTENT_CLASSIFIER_PATH):
+                try:
+                    cls._instance = cls.load(INTENT_CLASSIFIER_PATH)
+                    print(f"[INFO] intent classifier loaded: {INTENT_CLASSIFIER_PATH} classes={cls._instance.classes}")
+                except Exception as e:
+                    print(f"[WARN] intent classifier load failed: {e}")
+        return cls._instance
+
+    def __init__(self, classes: list[str], weights: np.ndarray, bias: np.ndarray, threshold: float = INTENT_FAST_PATH_THRESHOLD):
+        self.classes = list(classes)
+        self.weights = np.asarray(weights, dtype=np.float32)
+        self.bias = np.asarray(bias, dtype=np.float32)
+        self.threshold = float(threshold)
+
+    @classmethod
+    def fit(
+        cls,
+        x: np.ndarray,
+        labels: list[str],
+        epochs: int = 300,
+        lr: float = 0.5,
+        l2: float = 1e-4,
+        threshold: float = INTENT_FAST_PATH_THRESHOLD,
+    ) -> "IntentClassifier":
+        """full-batch gradient descent softmax 회귀 (cross entropy + L2)."""
+        x = _normalize_rows(x)
+        classes = sorted(set(labels))
+        index = {label: i for i, label in enumerate(classes)}
+        y = np.zeros((len(labels), len(classes)), dtype=np.float32)
+        y[np.arange(len(labels)), [index[label] for label in labels]] = 1.0
+
+        weights = np.zeros((x.shape[1], len(classes)), dtype=np.float32)
+        bias = np.zeros(len(classes), dtype=np.float32)
+        for _ in range(epochs):
+            probs = cls._softmax(x @ weights + bias)
+            grad = (probs - y) / len(labels)
+            weights -= lr * (x.T @ grad + l2 * weights)
+            bias -= lr * grad.sum(axis=0)
+        return cls(classes, weights, bias, threshold)
+
+    @staticmethod
+    def _softmax(logits: np.ndarray) -> np.ndarray:
+        logits = logits - logits.max(axis=1, keepdims=True)
+        exp = np.exp(logits)
+        return exp / exp.sum(axis=1, keepdims=True)
+
+    def predict_proba(self, x: np.ndarray) -> np.ndarray:
+        return self._softmax(_normalize_rows(x) @ self.weights + self.bias)
+
+    def predict(self, vector: np.ndarray) -> tuple[str, float]:
+        probs = self.predict_proba(vector)[0]
+        best = int(np.argmax(probs))
+        return self.classes[best], float(probs[best])
+
+    def confident_intent(self, vector: np.ndarray) -> tuple[str | None, float]:
+        """threshold 이상이고 fast path 대상 intent면 label, 아니면 None."""
+        label, prob = self.predict(vector)
+        if prob < self.threshold or label == FALLBACK_LABEL or label not in INTENT_FAST_PATH_INTENTS:
+            return None, prob
+        return label, prob
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        np.savez(path, classes=np.array(self.classes), weights=self.weights, bias=self.bias, threshold=self.threshold)
+
+    @classmethod
+    def load(cls, path: str) -> "IntentClassifier":
+        data = np.load(path, allow_pickle=False)
+        return cls([str(c) for c in data["classes"]], data["weights"], data["bias"], float(data["threshold"]))
+
+
+def build_fast_intent(text: str, label: str, state: dict[str, Any]) -> IntentOutput:
+    """
+    분류 결과 + 규칙 slot으로 IntentOutput 구성.
+    대화 요약은 갱신하지 않는다: summary_message는 이전 값 유지, summary_title은 None(채팅방 제목 변경 없음).
+    밀린 요약은 다음 LLM 턴이 건너뛴 메시지까지 포함해 갱신 (intent_node의 summary_lag_turns).
+    """
+    intent = IntentType(label)
+    slots = guess_slots(text) if intent != IntentType.GENERAL else IntentSlots()
+    return IntentOutput(
+        update_user_input=None,
+        intents=[intent],
+        primary_intent=intent,
+        slots=slots,
+        summary_title=None,
+        summary_message=state.get("summary_message") or "",
+    )
+
+
+_log_lock = threading.Lock()
+
+
+def intent_log_files(path: str, backup_count: int = INTENT_LOG_BACKUP_COUNT) -> list[str]:
+    """회전된 로그 포함, 존재하는 파일을 오래된 순서로. (path.N, ..., path.1, path)"""
+    candidates = [f"{path}.{i}" for i in range(backup_count, 0, -1)] + [path]
+    return [p for p in candidates if os.path.exists(p)]
+
+
+def _rotate_intent_log(path: str, backup_count: int) -> None:
+    if backup_count <= 0:
+        os.remove(path)
+        return
+    oldest = f"{path}.{backup_count}"
+    if os.path.exists(oldest):
+        os.remove(oldest)
+    for i in range(backup_count - 1, 0, -1):
+        if os.path.exists(f"{path}.{i}"):
+            os.replace(f"{path}.{i}", f"{path}.{i + 1}")
+    os.replace(path, f"{path}.1")
+
+
+def append_intent_log(
+    path: str,
+    user_input: str,
+    result: IntentOutput,
+    source: str,
+    max_bytes: int = INTENT_LOG_MAX_BYTES,
+    backup_count: int = INTENT_LOG_BACKUP_COUNT,
+) -> None:
+    """
+    intent 결과 1건을 JSONL로 누적. (분류기 학습 / 평가용, 실패해도 턴 진행)
+    파일이 max_bytes 이상이면 먼저 회전 (backup_count개까지 보관, 초과분 삭제).
+    """
+    record = {
+        "ts": time.time(),
+        "source": source,
+        "user_input": user_input,
+        **json.loads(result.model_dump_json(include={"update_user_input", "intents", "primary_intent", "slots"})),
+    }
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with _log_lock:
+            if max_bytes > 0 and os.path.exists(path) and os.path.getsize(path) >= max_bytes:
+                _rotate_intent_log(path, backup_count)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    except Exception as e:
+        print(f"[WARN] intent log write failed: {e}")
@@ -0,0 +1,162 @@
+"""
+landmark_candidates.py — intent 프롬프트용 표준 장소 후보 선별
+
+intent_node는 매 턴 LANDMARK_DESC(사전 전체 표준명 + 별칭)를 INTENT_PROMPT에 넣어 왔다.
+user_input / 최근 메시지와 관련 있는 장소만 골라 상위 N개만 주입한다.
+- 문자열 매칭: 표준명·별칭 언급(find_landmarks) = 1.0, 부분 일치(첫 bigram 일치 + bigram 포함률 ≥ 0.5) = 포함률 × 0.8
+- 최근 메시지는 오래될수록 가중치 감쇠 (user_input 1.0 → 0.5 → 0.25 ...)
+- 임베딩 매칭(선택): BGE-M3 user_input 벡터 ↔ 장소 설명 벡터 cosine (표기가 달라도 "석촌호수 근처" → 송리단길)
+- 후보가 없으면 빈 목록. LLM이 목록 밖 장소명을 그대로 반환해도 retriever의 normalize_location이 표준명으로 정규화.
+"""
+
+import asyncio
+from typing import Any, Iterable
+
+import numpy as np
+
+from app.utils.config import (
+    ENABLE_LANDMARK_EMBEDDING_MATCH,
+    LANDMARK_CONTEXT_MESSAGES,
+    LANDMARK_EMBEDDING_MIN_SIM,
+    LANDMARK_PROMPT_TOP_N,
+)
+# _match_key: alias 역색인 / Aho-Corasick 자동기계와 같은 키 정규화를 공유해야 문자열 매칭 결과가 일치
+from app.utils.geocoder import LANDMARK_DICTIONARY, _match_key, find_landmarks, format_landmark_desc
+
+EMPTY_LANDMARK_DESC = "(관련 표준 장소 없음)"
+
+_PARTIAL_MIN_COVERAGE = 0.5
+_PARTIAL_WEIGHT = 0.8
+_CONTEXT_DECAY = 0.5
+
+
+def _bigrams(text: str) -> set[str]:
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+# 표준명별 매칭 키(공백 제거 + 소문자)의 (첫 bigram, bigram 집합) — 모듈 로드 시 1회 생성
+_LANDMARK_BIGRAMS: dict[str, list[tuple[str, set[str]]]] = {
+    canonical: [
+        (key[:2], _bigrams(key))
+        for key in (_match_key(name) for name in (canonical, *entry.get("aliases", [])))
+        if len(key) >= 2
+    ]
+    for canonical, entry in LANDMARK_DICTIONARY.items()
+}
+
+
+def _message_text(message: Any) -> str:
+    content = message.get("content") if isinstance(message, dict) else getattr(message, "content", message)
+    return content if isinstance(content, str) else ""
+
+
+def string_scores(text: str) -> dict[str, float]:
+    """텍스트 1건 → {표준명: 문자열 매칭 점수}."""
+    scores = {mention.canonical: 1.0 for mention in find_landmarks(text)}
+    grams = _bigrams(_match_key(text or ""))
+    if not grams:
+        return scores
+    for canonical, key_grams in _LANDMARK_BIGRAMS.items():
+        if canonical in scores:
+            continue
+        # 첫 bigram이 일치해야 부분 일치로 인정 ("홍대입구" ↛ "건대입구", "석촌호수" → "석촌호수 맛집")
+        coverage = max((len(g & grams) / len(g) for head, g in key_grams if head in grams), default=0.0)
+        if coverage >= _PARTIAL_MIN_COVERAGE:
+            scores[canonical] = coverage * _PARTIAL_WEIGHT
+    return scores
+
+
+def score_landmarks(
+    user_input: str,
+    messages: Iterable[Any] = (),
+    query_vector: np.ndarray | None = None,
+    landmark_vectors: dict[str, np.ndarray] | None = None,
+    context_messages: int = LANDMARK_CONTEXT_MESSAGES,
+    min_similarity: float = LANDMARK_EMBEDDING_MIN_SIM,
+) -> dict[str, float]:
+    """
+    표준명별 관련도 점수 (0이면 제외).
+    user_input 점수 + 최근 메시지 점수(감쇠) 중 최댓값, 임베딩 cosine이 min_similarity 이상이면 그 값과도 비교.
+    """
+    texts = [(user_input, 1.0)]
+    recent = [_message_text(m) for m in list(messages)[-context_messages:]] if context_messages > 0 else []
+    weight = 1.0
+    for text in reversed(recent):
+        weight *= _CONTEXT_DECAY
+        texts.append((text, weight))
+
+    scores: dict[str, float] = {}
+    for text, w in texts:
+        if not text:
+            continue
+        for canonical, score in string_scores(text).items():
+            scores[canonical] = max(scores.get(canonical, 0.0), score * w)
+
+    if query_vector is not None and landmark_vectors:
+        q = np.asarray(query_vector, dtype=np.float32).ravel()
+        q = q / max(float(np.linalg.norm(q)), 1e-12)
+        for canonical, vec in landmark_vectors.items():
+            sim = float(q @ vec)
+            if sim >= min_similarity:
+                scores[canonical] = max(scores.get(canonical, 0.0), sim)
+    return scores
+
+
+def select_landmarks(scores: dict[str, float], top_n: int = LANDMARK_PROMPT_TOP_N) -> list[str]:
+    """점수 내림차순 상위 top_n 표준명 (동점이면 사전 순서)."""
+    order = {canonical: i for i, canonical in enumerate(LANDMARK_DICTIONARY)}
+    ranked = sorted((c for c, s in scores.items() if s > 0), key=lambda c: (-scores[c], order.get(c, len(order))))
+    return ranked[:top_n]
+
+
+def landmark_embedding_text(canonical: str) -> str:
+    entry = LANDMARK_DICTIONARY[canonical]
+    return " ".join([canonical, *entry.get("aliases", []), entry.get("description", "")]).strip()
+
+
+_landmark_vectors: dict[str, np.ndarray] | None = None
+_landmark_vectors_lock: asyncio.Lock | None = None
+_lock_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _vectors_lock() -> asyncio.Lock:
+    """현재 event loop에 묶인 lock. (다른 loop — 테스트 / 스크립트 — 에서 호출되면 새로 생성)"""
+    global _landmark_vectors_lock, _lock_loop
+    loop = asyncio.get_running_loop()
+    if _lock_loop is not loop or _landmark_vectors_lock is None:
+        _landmark_vectors_lock = asyncio.Lock()
+        _lock_loop = loop
+    return _landmark_vectors_lock
+
+
+async def get_landmark_vectors(retriever) -> dict[str, np.ndarray]:
+    """표준 장소 설명 BGE-M3 임베딩 (정규화). 프로세스당 1회 계산 후 재사용."""
+    global _landmark_vectors
+    if _landmark_vectors is None:
+        async with _vectors_lock():
+            if _landmark_vectors is None:
+                canonicals = list(LANDMARK_DICTIONARY)
+                vectors = await asyncio.gather(*(retriever.aencode_query(landmark_embedding_text(c)) for c in canonicals))
+                _landmark_vectors = {
+                    c: np.asarray(v, dtype=np.float32).ravel() / max(float(np.linalg.norm(v)), 1e-12)
+                    for c, v in zip(canonicals, vectors)
+                }
+    return _landmark_vectors
+
+
+async def build_landmark_desc(user_input: str, messages: Iterable[Any] = (), retriever=None) -> tuple[str, list[str]]:
+    """
+    intent 프롬프트 {landmark_desc}에 넣을 후보 목록 문자열과 선택된 표준명.
+    retriever가 주어지고 ENABLE_LANDMARK_EMBEDDING_MATCH면 임베딩 매칭 포함 (실패 시 문자열 매칭만).
+    """
+    query_vector = landmark_vectors = None
+    if retriever is not None and ENABLE_LANDMARK_EMBEDDING_MATCH:
+        try:
+            query_vector, landmark_vectors = await asyncio.gather(
+                retriever.aencode_query(user_input), get_landmark_vectors(retriever)
+            )
+        except Exception as e:
+            print(f"[WARN] landmark embedding match skipped: {e}")
+            query_vector = landmark_vectors = None
+    selected = select_landmarks(score_landmarks(user_input, messages, query_vector, landmark_vectors))
+    return (format_landmark_desc(selected) if selected else EMPTY_LANDMARK_DESC), selected
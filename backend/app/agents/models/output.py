@@ -33,18 +33,21 @@ class CategoryType(str, Enum):
     @classmethod
     def description(cls) -> str:
         """카테고리 값과 대표 키워드 예시를 LLM에 전달하기 위한 설명 문자열."""
-        hints = {
-            "관광지":      "관광명소, 유적지, 테마파크, 해수욕장, 섬, 자연경관, 궁",
-            "문화시설":    "박물관, 미술관, 도서관, 공연장, 전시관, 영화관",
-            "축제공연행사": "축제, 공연, 콘서트, 이벤트, 전시회, 페스티벌",
-            "레포츠":      "스포츠, 등산, 서핑, 수영, 캠핑, 번지점프, 패러글라이딩, 야외 레저",
-            "숙박":        "호텔, 펜션, 게스트하우스, 리조트, 모텔, 에어비앤비",
-            "음식점":      "음식점, 카페, 식당, 레스토랑, 맛집, 한식, 양식, 일식, 비빔밥, 분식, 치킨, 피자",
-            "팝업스토어":  "팝업스토어, 브랜드 팝업, 한정판 전시 매장, 굿즈",
-        }
-        lines = [f"- {item.value}: {hints.get(item.value, item.name)}" for item in cls]
+        lines = [f"- {item.value}: {CATEGORY_HINTS.get(item.value, item.name)}" for item in cls]
         return "\n".join(lines)
 
+
+# 카테고리별 대표 키워드 (intent 프롬프트 설명 / LLM 없는 카테고리 추정에 공용)
+CATEGORY_HINTS = {
+    "관광지":      "관광명소, 유적지, 테마파크, 해수욕장, 섬, 자연경관, 궁",
+    "문화시설":    "박물관, 미술관, 도서관, 공연장, 전시관, 영화관",
+    "축제공연행사": "축제, 공연, 콘서트, 이벤트, 전시회, 페스티벌",
+    "레포츠":      "스포츠, 등산, 서핑, 수영, 캠핑, 번지점프, 패러글라이딩, 야외 레저",
+    "숙박":        "호텔, 펜션, 게스트하우스, 리조트, 모텔, 에어비앤비",
+    "음식점":      "음식점, 카페, 식당, 레스토랑, 맛집, 한식, 양식, 일식, 비빔밥, 분식, 치킨, 피자",
+    "팝업스토어":  "팝업스토어, 브랜드 팝업, 한정판 전시 매장, 굿즈",
+}
+
 class PlannerNeedType(str, Enum): # 계획 필수 타입 
     DATES = "여행 날짜"
     PARTY_SIZE = "여행 인원"
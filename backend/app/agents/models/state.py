@@ -27,6 +27,8 @@ class TravelState(TypedDict, total=False):
     summary_message: str
     user_preferences: Dict[str, Any]           # 선호도 조사
     prefs_info: str
+    speculative_search_id: str | None          # intent LLM 호출과 병렬로 시작한 추측 검색 id (app.agents.speculative)
+    summary_lag_turns: int                     # 대화 요약 없이 처리된 연속 intent fast path 턴 수
     
     # planner
     itinerary: List[Dict[str, Any]]         # 시간순/일차별 정렬된 데이터
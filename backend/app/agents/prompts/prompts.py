@@ -72,7 +72,7 @@ INTENT_PROMPT = """
 {category_desc}
 
 ### location 추출 규칙
-아래 표준 장소 목록을 참고하여 location을 추출하십시오.
+아래 표준 장소 목록(대화와 관련된 후보만 포함)을 참고하여 location을 추출하십시오.
 형식: `표준명: 별칭1, 별칭2, ...`
 
 {landmark_desc}
@@ -1,16 +1,23 @@
-import asyncio
 import random
+import threading
+import time
+from collections import OrderedDict
 from typing import Dict, Any, List
 
 from app.agents.models.state import TravelState, get_effective_user_input
 from app.agents.models.output import IntentType, InputType
-from app.core.retrieval.place import PlaceRetriever
+from app.core.retrieval.place import PlaceRetriever, HybridSearchRequest
 from app.utils.geocoder import GeoCoder, LANDMARK_DICTIONARY, normalize_location
-from app.utils.vision import describe_image
 from app.utils.common import getattr_safe
 from app.utils.place_id import get_candidate_point_id, get_place_id
+from app.agents.speculative import guess_slots, take_speculative_result
 
-from app.utils.config import get_retrieval_params
+from app.utils.config import (
+    get_retrieval_params,
+    REVERSE_GEOCODE_CACHE_MAX_SIZE,
+    REVERSE_GEOCODE_CACHE_TTL_S,
+    REVERSE_GEOCODE_GRID_DEG,
+)
 
 
 def _candidate_category(candidate: Dict[str, Any]) -> str:
@@ -144,68 +151,112 @@ async def _search_for_trip_planning(
     if not itinerary:
         return []
 
-    # Semaphore(3) : 병렬로 최대한 몇개 장소 검색할것인지? 10개라고 하면 최대 3개씩 병렬 검색
-    semaphore = asyncio.Semaphore(3)
-
-    async def search_item(item):
-        async with semaphore:
-            search_query = item.get("search_query", "") or item.get("activity", "")
-            print("[Retriever - search planning] query: ", search_query)
-            if not search_query:
-                return []
-
-            try:
-                item_category = item.get("category")
-                # itinerary 항목별 검색은 전체 K를 쓰지 않고 상위 일부만 취합
-                return await retriever.search_hybrid(
-                    query=search_query,
-                    image_url=image_path,
-                    limit=max(10, candidate_k // 3),
-                    candidate_k=max(10, candidate_k // 3),
-                    categories=[item_category] if item_category else None,
-                    emotional_text=emotional_text,
-                    user_latitude=state.get("input_lat"),
-                    user_longitude=state.get("input_long"),
-                    preferred_location=getattr_safe(state.get("slots"), "location").name if getattr_safe(state.get("slots"), "location") else None,
-                    enable_bm25=True,
-                    enable_rerank=True,
-                    rerank_top_k=min(rerank_max_k, max(10, candidate_k // 3)),
-                    search_scope="place_only",
-                )
-            except Exception as e:
-                print(f"[Retriever] Search error for '{search_query}': {e}")
-                return []
-
-    all_results_lists = await asyncio.gather(*[search_item(item) for item in itinerary])
+    # itinerary 전체를 search_hybrid_many 1회로 검색.
+    # query encode는 모델별 batch 1회, rerank는 전체 (query, 후보) 쌍을 predict 1회로 처리한다.
+    location_obj = getattr_safe(state.get("slots"), "location")
+    preferred_location = location_obj.name if location_obj else None
+    # itinerary 항목별 검색은 전체 K를 쓰지 않고 상위 일부만 취합
+    item_k = max(10, candidate_k // 3)
+    requests = []
+    for item in itinerary:
+        search_query = item.get("search_query", "") or item.get("activity", "")
+        print("[Retriever - search planning] query: ", search_query)
+        if not search_query:
+            continue
+        item_category = item.get("category")
+        requests.append(
+            HybridSearchRequest(
+                query=search_query,
+                image_url=image_path,
+                limit=item_k,
+                candidate_k=item_k,
+                categories=[item_category] if item_category else None,
+                emotional_text=emotional_text,
+                user_latitude=state.get("input_lat"),
+                user_longitude=state.get("input_long"),
+                preferred_location=preferred_location,
+                enable_bm25=True,
+                enable_rerank=True,
+                rerank_top_k=min(rerank_max_k, item_k),
+                search_scope="place_only",
+            )
+        )
+
+    if not requests:
+        return []
+    try:
+        all_results_lists = await retriever.search_hybrid_many(requests)
+    except Exception as e:
+        print(f"[Retriever] Trip planning search error: {e}")
+        return []
     return [res for sublist in all_results_lists for res in sublist]
 
 
-async def _search_for_general(
+_road_cache: "OrderedDict[tuple[float, float], tuple[float, str]]" = OrderedDict()
+_road_cache_lock = threading.Lock()
+
+
+def _snap_coordinate(value: float) -> float:
+    if REVERSE_GEOCODE_GRID_DEG <= 0:
+        return round(float(value), 6)
+    return round(round(float(value) / REVERSE_GEOCODE_GRID_DEG) * REVERSE_GEOCODE_GRID_DEG, 6)
+
+
+def _reverse_geocode_road(latitude: float, longitude: float) -> str:
+    """
+    사용자 좌표 → 도로명 주소. (speculative 검색과 retriever가 같은 좌표를 중복 조회하지 않도록 TTL 캐시)
+    좌표는 격자로 스냅한 값으로 조회·캐싱하고, 조회 실패(None)는 캐싱하지 않아 다음 턴에 재시도한다.
+    """
+    key = (_snap_coordinate(latitude), _snap_coordinate(longitude))
+    now = time.monotonic()
+    with _road_cache_lock:
+        cached = _road_cache.get(key)
+        if cached is not None and cached[0] > now:
+            _road_cache.move_to_end(key)
+            return cached[1]
+
+    geocode_data = GeoCoder().reverse_geocoder(*key)
+    if not geocode_data:
+        return ""
+    road = (geocode_data.get("road_address") or "").strip()
+    with _road_cache_lock:
+        _road_cache[key] = (now + REVERSE_GEOCODE_CACHE_TTL_S, road)
+        _road_cache.move_to_end(key)
+        while len(_road_cache) > REVERSE_GEOCODE_CACHE_MAX_SIZE:
+            _road_cache.popitem(last=False)
+    return road
+
+
+def resolve_retrieval_sizes(state: TravelState) -> tuple[int, int, int]:
+    """state / serving 프로파일 기준 (candidate_k, final_k, rerank_max_k)."""
+    serving_params = get_retrieval_params("serving")
+    candidate_k = int(state.get("candidate_k") or serving_params["candidate_k"])
+    final_k = int(state.get("final_k") or serving_params["top_k"])
+    rerank_max_k = int(state.get("rerank_max_k") or serving_params["rerank_max_k"])
+    return max(candidate_k, 1), max(final_k, 1), max(rerank_max_k, 1)
+
+
+def build_general_request(
     state: TravelState,
+    slots: Any,
     emotional_text: str | None = None,
     candidate_k: int = 20,
     rerank_max_k: int = 8,
     search_scope: str = "place_only",
-) -> List[Dict[str, Any]]:
-    """일반 검색: 텍스트/이미지/위치 기반 하이브리드 후보 풀 검색."""
-    retriever = PlaceRetriever.get_instance()
-
+) -> HybridSearchRequest:
+    """일반 검색 요청 생성. (retriever_node / intent 단계 speculative 검색 공용 → 같은 입력이면 같은 요청)"""
     user_input = get_effective_user_input(state)
     image_path = state.get("input_image")
     latitude = state.get("input_lat")
     longitude = state.get("input_long")
-    slots = state.get("slots")
 
     print(f"[Retriever:general] user_input={repr(user_input)} slots={repr(slots)}")
     query = user_input
     if latitude and longitude:
         try:
-            geocoder = GeoCoder()
-            geocode_data = geocoder.reverse_geocoder(latitude, longitude)
-            if geocode_data:
-                road = (geocode_data.get("road_address") or "").strip()
-                if road:
-                    query += f"\n현재 내 위치 주소: {road}"
+            road = _reverse_geocode_road(latitude, longitude)
+            if road:
+                query += f"\n현재 내 위치 주소: {road}"
         except Exception as e:
             print(f"[Retriever] Geocoding error: {e}")
 
@@ -235,25 +286,69 @@ async def _search_for_general(
             anchor_radius_m = norm.radius_m
             print(f"[Retriever] landmark anchor (fallback normalize): {raw_location!r} → {norm.normalized_location!r}")
 
+    return HybridSearchRequest(
+        query=query,
+        image_url=image_path,
+        limit=candidate_k,
+        candidate_k=candidate_k,
+        categories=categories,
+        emotional_text=emotional_text,
+        user_latitude=latitude,
+        user_longitude=longitude,
+        preferred_location=raw_location,
+        enable_bm25=True,
+        enable_rerank=True,
+        rerank_top_k=min(rerank_max_k, candidate_k),
+        search_scope=search_scope,
+        location_anchor_lat=anchor_lat,
+        location_anchor_lon=anchor_lon,
+        location_radius_m=anchor_radius_m,
+    )
+
+
+def build_speculative_request(state: TravelState) -> HybridSearchRequest:
+    """
+    intent 결과 없이 원문 user_input + 추정 slot으로 만든 일반 검색 요청.
+    retriever_node와 같은 생성 경로를 쓰므로 intent slot이 추정과 같으면 실제 요청과 동일해진다.
+    """
+    # 이전 턴의 update_user_input은 무시 (이번 턴 재작성 여부는 intent 결과로만 알 수 있음)
+    raw_state: TravelState = {**state, "update_user_input": None}
+    slots = guess_slots(state.get("user_input") or "")
+    candidate_k, _, rerank_max_k = resolve_retrieval_sizes(raw_state)
+    return build_general_request(
+        raw_state,
+        slots,
+        candidate_k=candidate_k,
+        rerank_max_k=rerank_max_k,
+        search_scope=_resolve_search_scope(None, slots, state.get("input_image")),
+    )
+
+
+async def _search_for_general(
+    state: TravelState,
+    emotional_text: str | None = None,
+    candidate_k: int = 20,
+    rerank_max_k: int = 8,
+    search_scope: str = "place_only",
+) -> List[Dict[str, Any]]:
+    """일반 검색: 텍스트/이미지/위치 기반 하이브리드 후보 풀 검색."""
+    retriever = PlaceRetriever.get_instance()
+    request = build_general_request(
+        state,
+        state.get("slots"),
+        emotional_text=emotional_text,
+        candidate_k=candidate_k,
+        rerank_max_k=rerank_max_k,
+        search_scope=search_scope,
+    )
+
+    # intent 단계에서 같은 요청으로 미리 띄운 검색이 있으면 그 결과 사용 (요청이 다르면 취소됨)
+    speculative = await take_speculative_result(state.get("speculative_search_id"), request)
+    if speculative is not None:
+        return speculative
+
     try:
-        return await retriever.search_hybrid(
-            query=query,
-            image_url=image_path,
-            limit=candidate_k,
-            candidate_k=candidate_k,
-            categories=categories,
-            emotional_text=emotional_text,
-            user_latitude=latitude,
-            user_longitude=longitude,
-            preferred_location=raw_location,
-            enable_bm25=True,
-            enable_rerank=True,
-            rerank_top_k=min(rerank_max_k, candidate_k),
-            search_scope=search_scope,
-            location_anchor_lat=anchor_lat,
-            location_anchor_lon=anchor_lon,
-            location_radius_m=anchor_radius_m,
-        )
+        return (await retriever.search_hybrid_many([request]))[0]
     except Exception as e:
         print(f"[Retriever] Hybrid search error: {e}")
         return []
@@ -287,14 +382,8 @@ async def retriever_node(state: TravelState):
     """장소 검색 Agent: 후보 풀 생성 + 최종 노출 후보 선택."""
     print("--- Retriever Agent ---")
 
-    serving_params = get_retrieval_params("serving")
     user_input = get_effective_user_input(state)
-    candidate_k = int(state.get("candidate_k") or serving_params["candidate_k"])
-    final_k = int(state.get("final_k") or serving_params["top_k"])
-    rerank_max_k = int(state.get("rerank_max_k") or serving_params["rerank_max_k"])
-    candidate_k = max(candidate_k, 1)
-    final_k = max(final_k, 1)
-    rerank_max_k = max(rerank_max_k, 1)
+    candidate_k, final_k, rerank_max_k = resolve_retrieval_sizes(state)
     selection_mode = "deterministic"
     selection_seed = 42
 
@@ -302,10 +391,9 @@ async def retriever_node(state: TravelState):
     print(f"[Retriever] primary_intent={primary_intent} itinerary_len={len(state.get('itinerary', []))} user_input={repr(user_input)}")
 
     image_path = state.get("input_image")
+    # 이미지 설명(vision LLM)은 미리 기다리지 않는다.
+    # search_hybrid가 CLIP / text 채널과 동시에 시작하고 deadline 안에 오면 image_emotional 채널로 융합.
     emotional_text = None
-    if image_path:
-        print("[Retriever] Image detected. Fetching description once...")
-        emotional_text = await describe_image(image_path)
 
     search_scope = _resolve_search_scope(
         primary_intent=primary_intent,
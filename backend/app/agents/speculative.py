@@ -0,0 +1,160 @@
+"""
+speculative.py — intent LLM 호출과 병렬로 실행하는 추측(speculative) 검색
+
+intent_node의 LLM structured output(수 초)이 끝난 뒤에야 retriever_node가 search_hybrid를 시작하던 것을,
+턴 시작 시점에 원문 user_input + LLM 없이 추정한 slot으로 먼저 띄운다.
+- slot 추정: 표준 장소명 언급 추출(find_landmarks) / 카테고리 대표 키워드(CATEGORY_HINTS) 부분 문자열 매칭
+- retriever_node가 intent 결과로 만든 요청과 추측 요청이 같으면(query / categories / location / scope) 결과 재사용
+- 다르거나 retriever를 거치지 않는 intent면 취소
+- asyncio.Task는 checkpointer state에 넣을 수 없으므로 모듈 registry에 보관하고 state에는 id만 저장
+"""
+
+import asyncio
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable
+
+from app.agents.models.output import CATEGORY_HINTS, CategoryType, IntentLocation, IntentSlots
+from app.core.retrieval.place import HybridSearchRequest, PlaceRetriever
+from app.utils.config import SPECULATIVE_SEARCH_TTL_S
+from app.utils.geocoder import find_landmarks
+
+# 카테고리 추정 키워드 (한 글자 키워드는 오탐이 많아 제외: "궁" ⊂ "궁금")
+_CATEGORY_KEYWORDS: list[tuple[CategoryType, tuple[str, ...]]] = [
+    (category, tuple(kw for kw in (k.strip() for k in CATEGORY_HINTS.get(category.value, "").split(",")) if len(kw) >= 2))
+    for category in CategoryType
+]
+
+
+def guess_slots(text: str) -> IntentSlots:
+    """LLM 없이 원문에서 표준 장소명 / 카테고리를 추정. (추측 검색 요청용)"""
+    text = str(text or "")
+    # 원문 첫 번째 표준 장소 언급 (Aho-Corasick 1회 스캔)
+    mentions = find_landmarks(text)
+    location = mentions[0].canonical if mentions else None
+
+    categories = [
+        category for category, keywords in _CATEGORY_KEYWORDS
+        if any(kw in text for kw in keywords)
+    ]
+    return IntentSlots(
+        location=IntentLocation(name=location) if location else None,
+        categories=categories or None,
+    )
+
+
+def request_signature(request: HybridSearchRequest) -> dict[str, Any]:
+    """추측 요청 재사용 판정용 비교 키. categories는 순서 무관."""
+    signature = asdict(request)
+    signature["categories"] = sorted(str(getattr(c, "value", c)) for c in (request.categories or []))
+    return signature
+
+
+@dataclass
+class _Speculation:
+    task: asyncio.Task
+    request: asyncio.Future  # 요청 생성(역지오코딩 포함) 완료 시 HybridSearchRequest
+    created_at: float = field(default_factory=time.monotonic)
+
+
+_lock = threading.Lock()
+_pending: dict[str, _Speculation] = {}
+_stats = {"started": 0, "hits": 0, "mismatches": 0, "cancelled": 0, "failed": 0}
+
+
+def _discard(spec_id: str | None, reason: str) -> None:
+    with _lock:
+        speculation = _pending.pop(spec_id, None) if spec_id else None
+        if speculation is not None:
+            _stats[reason] += 1
+    if speculation is not None and not speculation.task.done():
+        speculation.task.cancel()
+
+
+def start_speculative_search(build_request: Callable[[], HybridSearchRequest]) -> str:
+    """
+    추측 검색 시작 → registry id 반환.
+    build_request는 동기 함수(역지오코딩 포함)이므로 스레드에서 실행한다.
+    """
+    now = time.monotonic()
+    with _lock:
+        expired = [sid for sid, s in _pending.items() if now - s.created_at > SPECULATIVE_SEARCH_TTL_S]
+    for sid in expired:
+        _discard(sid, "cancelled")
+
+    spec_id = uuid.uuid4().hex
+    request_future: asyncio.Future = asyncio.get_running_loop().create_future()
+    # 요청 생성 실패 / 취소 시 예외 미회수 경고 방지
+    request_future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+    async def run() -> list[dict]:
+        try:
+            request = await asyncio.to_thread(build_request)
+        except asyncio.CancelledError:
+            request_future.cancel()
+            raise
+        except Exception as e:
+            request_future.set_exception(e)
+            raise
+        request_future.set_result(request)
+        print(f"[INFO] speculative search start query='{(request.query or '')[:80]}' categories={request.categories} location={request.preferred_location!r}")
+        return (await PlaceRetriever.get_instance().search_hybrid_many([request]))[0]
+
+    speculation = _Speculation(task=asyncio.ensure_future(run()), request=request_future)
+    # 소비되지 않고 실패한 추측 검색의 예외 미회수 경고 방지
+    speculation.task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    # 실행 전에 취소된 경우에도 요청 대기자가 멈추지 않도록
+    speculation.task.add_done_callback(lambda _: request_future.done() or request_future.cancel())
+    with _lock:
+        _pending[spec_id] = speculation
+        _stats["started"] += 1
+    return spec_id
+
+
+def cancel_speculative_search(spec_id: str | None) -> None:
+    """retriever를 거치지 않는 intent / intent 실패 시 추측 검색 취소."""
+    _discard(spec_id, "cancelled")
+
+
+async def take_speculative_result(spec_id: str | None, request: HybridSearchRequest) -> list[dict] | None:
+    """
+    실제 요청과 같은 추측 검색이면 그 결과(진행 중이면 완료까지 대기), 아니면 취소 후 None.
+    추측 요청 생성(역지오코딩)이 아직 진행 중이면 완료까지 기다린 뒤 비교한다. (fast path 턴은 intent가 먼저 끝남)
+    추측 검색이 실패했으면 None → 호출자가 일반 검색 수행.
+    """
+    with _lock:
+        speculation = _pending.get(spec_id) if spec_id else None
+    if speculation is None:
+        return None
+    try:
+        built = await asyncio.shield(speculation.request)
+    except asyncio.CancelledError:
+        if not speculation.request.cancelled():
+            raise  # 호출자 취소
+        return None  # TTL 정리 등으로 이미 취소된 추측 검색
+    except Exception as e:
+        print(f"[WARN] speculative request build failed: {e}")
+        _discard(spec_id, "failed")
+        return None
+    if request_signature(built) != request_signature(request):
+        print("[INFO] speculative search mismatch with intent slots, cancelled")
+        _discard(spec_id, "mismatches")
+        return None
+
+    with _lock:
+        _pending.pop(spec_id, None)
+        _stats["hits"] += 1
+    try:
+        results = await speculation.task
+    except Exception as e:
+        print(f"[WARN] speculative search failed: {e}")
+        return None
+    print(f"[INFO] speculative search reused: {len(results)} candidates")
+    return results
+
+
+def speculation_stats() -> dict[str, int]:
+    with _lock:
+        return {**_stats, "pending": len(_pending)}
@@ -2,8 +2,10 @@ from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 from typing import List, Dict, Optional
 import random
+import asyncio
 
 from app.core.retrieval.place import PlaceRetriever
+from app.agents.models.output import CategoryType
 from app.utils.config import PLACES_COLLECTION, PHOTOS_COLLECTION
 from app.utils.common import to_client_image_url
 from qdrant_client.models import Filter, FieldCondition, MatchValue, IsEmptyCondition, PayloadField
@@ -246,6 +248,10 @@ class CategoryPlacesRequest(BaseModel):
 
 
 SEARCH_CATEGORIES = ["관광지", "음식점", "숙박", "레포츠", "문화시설", "축제공연행사", "팝업스토어"]
+# 카테고리 추천 카드에 쓰는 payload 필드만 조회 (llm_text 등 긴 필드 제외)
+EXPLORE_PAYLOAD_FIELDS = [
+    "title", "addr", "address", "road_address", "image", "firstimage", "description", "start_date", "end_date",
+]
 
 
 @router.post("/category-places", response_model=Dict[str, List[PlaceExploreItem]])
@@ -256,19 +262,19 @@ async def get_category_places(request: CategoryPlacesRequest):
     """
     retriever = PlaceRetriever.get_instance()
 
-    results: Dict[str, List[PlaceExploreItem]] = {}
-
     from datetime import date
     today = date.today().isoformat()
 
-    for cat in SEARCH_CATEGORIES:
+    # 카테고리별 검색을 동시에 실행 (query encode는 캐시/배치로 1회, Qdrant 조회는 batch query로 묶임)
+    async def search_category(cat: str) -> List[PlaceExploreItem]:
         try:
             # 매번 동일한 결과가 나오지 않도록 검색 범위를 넓히고 (limit=20)
-            search_results = retriever.search_text(
+            search_results = await retriever.asearch_text(
                 query=request.user_prefs,
                 limit=20,
-                category=cat,
-                has_image=True
+                categories=[CategoryType(cat)],
+                has_image=True,
+                with_payload=EXPLORE_PAYLOAD_FIELDS,
             )
 
             items = []
@@ -303,11 +309,13 @@ async def get_category_places(request: CategoryPlacesRequest):
                 )
 
             # 결과 중 3개를 무작위로 샘플링
-            results[cat] = random.sample(items, min(3, len(items)))
+            return random.sample(items, min(3, len(items)))
 
         except Exception as e:
             print(f"[WARN] Category '{cat}' search failed: {e}")
-            results[cat] = []
+            return []
 
+    category_items = await asyncio.gather(*[search_category(cat) for cat in SEARCH_CATEGORIES])
+    results: Dict[str, List[PlaceExploreItem]] = dict(zip(SEARCH_CATEGORIES, category_items))
     return results
 
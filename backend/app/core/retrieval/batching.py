@@ -0,0 +1,140 @@
+"""
+batching.py — 요청 간 dynamic micro-batching
+
+동시에 들어온 여러 coroutine의 단건 encode/predict 요청을 모아 한 번의 batch 호출로 처리한다.
+- 첫 요청 도착 후 max_wait_ms 동안 모으거나, max_batch_size가 차면 즉시 flush
+- batch 실행 중 도착한 요청은 다음 batch로 바로 묶임 (추가 대기 없음)
+- 모델별 batcher당 batch 실행은 1개씩 → torch intra-op 스레드 풀 경합 제거
+  (Qdrant batch query처럼 서버가 병렬 처리하는 경우 max_in_flight로 동시 batch 수 확장,
+  실행 중 batch task는 참조를 유지하고 aclose에서 완료까지 대기)
+- batch_fn이 coroutine 함수면 event loop에서 직접 await (AsyncQdrantClient 등),
+  동기 함수면 asyncio.to_thread로 실행
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Sequence
+
+
+class MicroBatcher:
+    """단건 요청을 batch_fn(list) 1회 호출로 묶어 실행하고 결과를 요청자별로 분배한다."""
+
+    def __init__(
+        self,
+        name: str,
+        batch_fn: Callable[[list], Sequence[Any] | Awaitable[Sequence[Any]]],
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0,
+        max_in_flight: int = 1,
+    ):
+        self.name = name
+        self.batch_fn = batch_fn
+        self._is_async = asyncio.iscoroutinefunction(batch_fn)
+        self.max_batch_size = max(int(max_batch_size), 1)
+        self.max_wait_s = max(float(max_wait_ms), 0.0) / 1000.0
+        self.max_in_flight = max(int(max_in_flight), 1)
+        self.batches_run = 0
+        self.items_run = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending: list[tuple[Any, asyncio.Future]] = []
+        self._full: asyncio.Event | None = None
+        self._worker: asyncio.Task | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._batch_tasks: set[asyncio.Task] = set()
+
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        # 스크립트/평가에서 asyncio.run을 여러 번 호출해도 loop별 상태로 재초기화
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._pending = []
+            self._full = asyncio.Event()
+            self._worker = None
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+            self._batch_tasks = set()
+        return loop
+
+    async def submit(self, item: Any) -> Any:
+        results = await self.submit_many([item])
+        return results[0]
+
+    async def submit_many(self, items: list) -> list:
+        if not items:
+            return []
+        loop = self._bind_loop()
+        futures = []
+        for item in items:
+            future = loop.create_future()
+            self._pending.append((item, future))
+            futures.append(future)
+
+        if len(self._pending) >= self.max_batch_size:
+            self._full.set()
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run_worker())
+        return list(await asyncio.gather(*futures))
+
+    async def _run_worker(self) -> None:
+        # 첫 batch만 수집 window 대기. 이후 batch는 실행 중 쌓인 요청을 즉시 처리.
+        if len(self._pending) < self.max_batch_size and self.max_wait_s > 0:
+            try:
+                await asyncio.wait_for(self._full.wait(), timeout=self.max_wait_s)
+            except asyncio.TimeoutError:
+                pass
+
+        while self._pending:
+            self._full.clear()
+            batch = self._pending[: self.max_batch_size]
+            del self._pending[: self.max_batch_size]
+            # timeout 등으로 취소된 요청은 batch에서 제외
+            batch = [(item, fut) for item, fut in batch if not fut.done()]
+            if not batch:
+                continue
+            await self._slots.acquire()
+            if self.max_in_flight == 1:
+                try:
+                    await self._run_batch(batch)
+                finally:
+                    self._slots.release()
+            else:
+                task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+                self._batch_tasks.add(task)
+                task.add_done_callback(self._batch_tasks.discard)
+                task.add_done_callback(lambda _: self._slots.release())
+
+    async def _run_batch(self, batch: list[tuple[Any, asyncio.Future]]) -> None:
+        items = [item for item, _ in batch]
+        try:
+            if self._is_async:
+                outputs = await self.batch_fn(items)
+            else:
+                outputs = await asyncio.to_thread(self.batch_fn, items)
+            if len(outputs) != len(items):
+                raise RuntimeError(
+                    f"batcher '{self.name}' got {len(outputs)} outputs for {len(items)} inputs"
+                )
+            self.batches_run += 1
+            self.items_run += len(items)
+            for (_, future), output in zip(batch, outputs):
+                if not future.done():
+                    future.set_result(output)
+        except Exception as e:
+            print(f"[WARN] batcher '{self.name}' batch failed (size={len(items)}): {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+    async def aclose(self) -> None:
+        """현재 loop에서 대기 / 실행 중인 요청을 모두 처리할 때까지 대기. (서버 종료 시)"""
+        if self._loop is not asyncio.get_running_loop():
+            return  # 다른 loop의 task는 이 loop에서 await 불가 (이미 종료된 loop)
+        if self._worker is not None:
+            await asyncio.gather(self._worker, return_exceptions=True)
+        while self._batch_tasks:
+            await asyncio.gather(*list(self._batch_tasks), return_exceptions=True)
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "batches": self.batches_run,
+            "items": self.items_run,
+            "avg_batch_size": round(self.items_run / self.batches_run, 2) if self.batches_run else 0.0,
+        }
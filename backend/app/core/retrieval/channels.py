@@ -0,0 +1,104 @@
+"""
+channels.py — 검색 채널 동시 실행 엔진
+
+search_hybrid의 채널(text_semantic, qdrant_sparse, text_to_image, image_visual,
+image_emotional, bm25_lexical)을 한 번에 띄우고 채널별 timeout을 적용한다.
+
+- 채널 하나가 느리거나 실패해도 나머지 채널 결과로 턴을 진행한다. (빈 결과로 대체)
+- after=[...]로 선행 채널을 지정하면 해당 채널 결과만 기다린 뒤 실행한다.
+  (BM25는 자신이 재채점하는 PLACES 벡터 채널만 기다림)
+- 결과 병합 순서는 호출자가 고정 순서로 수행 → 완료 순서와 무관하게 결정론 보장.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterable
+
+
+@dataclass
+class ChannelResult:
+    name: str
+    points: list = field(default_factory=list)
+    status: str = "ok"  # ok | timeout | error
+    elapsed_ms: float = 0.0
+    error: str | None = None
+
+
+class ChannelRunner:
+    """채널 coroutine을 동시에 실행하고 결과를 이름으로 모아준다."""
+
+    def __init__(self, default_timeout_s: float):
+        self.default_timeout_s = default_timeout_s
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def launch(
+        self,
+        name: str,
+        factory: Callable[..., Awaitable[Iterable[Any] | None]],
+        timeout_s: float | None = None,
+        after: Iterable[str] = (),
+    ) -> None:
+        """
+        채널 실행 예약.
+        - factory: 인자 없는 coroutine factory. after가 있으면 {채널명: ChannelResult}를 인자로 받음.
+        - timeout_s: 채널 자체 실행 시간 상한 (선행 채널 대기 시간은 제외)
+        """
+        if name in self._tasks:
+            raise ValueError(f"channel already launched: {name}")
+        deps = tuple(after)
+        timeout = self.default_timeout_s if timeout_s is None else timeout_s
+        self._tasks[name] = asyncio.create_task(self._run(name, factory, timeout, deps))
+
+    def launched(self, name: str) -> bool:
+        return name in self._tasks
+
+    async def _run(
+        self,
+        name: str,
+        factory: Callable[..., Awaitable[Iterable[Any] | None]],
+        timeout_s: float,
+        deps: tuple[str, ...],
+    ) -> ChannelResult:
+        dep_results: dict[str, ChannelResult] = {}
+        for dep in deps:
+            task = self._tasks.get(dep)
+            if task is not None:
+                dep_results[dep] = await task
+
+        started = time.perf_counter()
+        try:
+            coro = factory(dep_results) if deps else factory()
+            points = await asyncio.wait_for(coro, timeout=timeout_s)
+            return ChannelResult(
+                name=name,
+                points=list(points or []),
+                elapsed_ms=(time.perf_counter() - started) * 1000.0,
+            )
+        except asyncio.TimeoutError:
+            print(f"[WARN] channel '{name}' timed out after {timeout_s:.2f}s, dropped")
+            return ChannelResult(
+                name=name,
+                status="timeout",
+                elapsed_ms=(time.perf_counter() - started) * 1000.0,
+            )
+        except Exception as e:
+            print(f"[WARN] channel '{name}' failed: {e}")
+            return ChannelResult(
+                name=name,
+                status="error",
+                elapsed_ms=(time.perf_counter() - started) * 1000.0,
+                error=str(e),
+            )
+
+    async def gather(self) -> dict[str, ChannelResult]:
+        """예약된 모든 채널 완료까지 대기. 반환 dict는 launch 순서를 유지한다."""
+        if not self._tasks:
+            return {}
+        names = list(self._tasks.keys())
+        results = await asyncio.gather(*self._tasks.values())
+        summary = " ".join(
+            f"{r.name}={len(r.points)}({r.status},{r.elapsed_ms:.0f}ms)" for r in results
+        )
+        print(f"[INFO] channels done {summary}")
+        return dict(zip(names, results))
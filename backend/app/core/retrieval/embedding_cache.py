@@ -0,0 +1,88 @@
+"""
+embedding_cache.py — query embedding 캐시
+
+BGE-M3 / CLIP text encode 결과를 정규화된 query 문자열 기준으로 캐싱한다.
+- namespace(모델)별 분리: 같은 문자열이라도 text / clip_text 임베딩은 별도 보관
+- LRU + TTL 퇴출, namespace별 hit/miss 카운터
+- encode는 asyncio.to_thread에서 실행되므로 lock으로 보호
+"""
+
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Callable
+
+import numpy as np
+
+
+def normalize_query_key(text: str) -> str:
+    """캐시 키 정규화: 유니코드 NFC + 앞뒤 공백 제거 + 연속 공백 1칸.
+
+    대소문자는 유지한다. (BGE-M3 / CLIP tokenizer가 대소문자를 구분하므로 임베딩이 달라짐)
+    """
+    text = unicodedata.normalize("NFC", str(text or ""))
+    return re.sub(r"\s+", " ", text).strip()
+
+
+class EmbeddingCache:
+    """namespace별 LRU + TTL embedding 캐시 (thread-safe)."""
+
+    def __init__(self, max_size: int = 2048, ttl_s: float = 3600.0):
+        self.max_size = max(int(max_size), 1)
+        self.ttl_s = float(ttl_s)
+        self._entries: dict[str, OrderedDict[str, tuple[float, np.ndarray]]] = {}
+        self._hits: dict[str, int] = {}
+        self._misses: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str, text: str) -> np.ndarray | None:
+        key = normalize_query_key(text)
+        now = time.monotonic()
+        with self._lock:
+            entries = self._entries.setdefault(namespace, OrderedDict())
+            item = entries.get(key)
+            if item is not None and (self.ttl_s <= 0 or now - item[0] <= self.ttl_s):
+                entries.move_to_end(key)
+                self._hits[namespace] = self._hits.get(namespace, 0) + 1
+                return item[1]
+            if item is not None:
+                del entries[key]
+            self._misses[namespace] = self._misses.get(namespace, 0) + 1
+            return None
+
+    def put(self, namespace: str, text: str, vector: Any) -> np.ndarray:
+        """float32 read-only 배열로 저장 후 반환. (호출자 간 공유되므로 수정 불가)"""
+        key = normalize_query_key(text)
+        vec = np.array(vector, dtype=np.float32, copy=True)
+        vec.setflags(write=False)
+        with self._lock:
+            entries = self._entries.setdefault(namespace, OrderedDict())
+            entries[key] = (time.monotonic(), vec)
+            entries.move_to_end(key)
+            while len(entries) > self.max_size:
+                entries.popitem(last=False)
+        return vec
+
+    def get_or_compute(self, namespace: str, text: str, compute: Callable[[str], Any]) -> np.ndarray:
+        cached = self.get(namespace, text)
+        if cached is not None:
+            return cached
+        return self.put(namespace, text, compute(text))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            namespaces = set(self._entries) | set(self._hits) | set(self._misses)
+            return {
+                ns: {
+                    "size": len(self._entries.get(ns, ())),
+                    "hits": self._hits.get(ns, 0),
+                    "misses": self._misses.get(ns, 0),
+                }
+                for ns in sorted(namespaces)
+            }
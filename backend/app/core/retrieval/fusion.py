@@ -0,0 +1,153 @@
+"""
+fusion.py — columnar RRF 누적 + boost 결합 단계
+
+search_hybrid 채널 결과를 후보 배열(columnar)로 모아
+RRF 누적 / geo 거리 보너스(vectorized haversine) / boost 합산 / 정규화 / 정렬을 numpy 연산으로 처리한다.
+
+순위와 출력 필드는 기존 후보별 Python 루프와 동일하게 유지한다.
+- RRF 누적: np.add.at은 입력 순서대로 더하므로 채널 병합 순서의 부동소수 합 순서가 같음
+- 정렬: 안정 정렬(kind="stable")로 동점 후보의 기존 순서 유지
+- 반올림: 출력 점수는 Python round() 사용 (np.round와 경계값 결과가 다를 수 있음)
+"""
+
+from typing import Any, Iterable
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371
+
+
+class CandidatePool:
+    """채널별 순위 결과를 place id 기준으로 모으는 RRF 후보 풀."""
+
+    def __init__(self, rrf_k: int = 60):
+        self.rrf_k = rrf_k
+        self._index: dict[int, int] = {}
+        self.ids: list[int] = []
+        self.payloads: list[dict] = []
+        self.matches: list[set[str]] = []
+        self._rows: list[np.ndarray] = []
+        self._contribs: list[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add_ranked(
+        self,
+        ids: Iterable[int | None],
+        payloads: Iterable[dict | None],
+        weight: float,
+        match_type: str,
+        payload_mode: str = "keep",
+    ) -> None:
+        """
+        한 채널의 순위 결과 추가 (rank는 1부터, id가 None인 항목도 rank는 소비).
+        payload_mode (이미 있는 후보의 payload 처리):
+          - replace: 새 payload가 있으면 교체 (places 채널 payload 우선)
+          - keep   : 기존 유지 (photos 채널)
+          - fill   : 기존 payload가 비어 있을 때만 채움 (bm25)
+        """
+        rows: list[int] = []
+        ranks: list[int] = []
+        for rank, (pid, payload) in enumerate(zip(ids, payloads), start=1):
+            if pid is None:
+                continue
+            row = self._index.get(pid)
+            if row is None:
+                row = len(self.ids)
+                self._index[pid] = row
+                self.ids.append(pid)
+                self.payloads.append(payload or {})
+                self.matches.append(set())
+            elif payload and (payload_mode == "replace" or (payload_mode == "fill" and not self.payloads[row])):
+                self.payloads[row] = payload
+            self.matches[row].add(match_type)
+            rows.append(row)
+            ranks.append(rank)
+
+        if rows:
+            # 채널 간 점수 분포 차이를 줄이기 위해 RRF로 rank 기반 결합
+            self._rows.append(np.asarray(rows, dtype=np.int64))
+            self._contribs.append(weight * (1.0 / (self.rrf_k + np.asarray(ranks, dtype=np.float64))))
+
+    def rrf_scores(self) -> np.ndarray:
+        scores = np.zeros(len(self.ids), dtype=np.float64)
+        if self._rows:
+            np.add.at(scores, np.concatenate(self._rows), np.concatenate(self._contribs))
+        return scores
+
+
+def haversine_km(lat1: float, lon1: float, lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+    """(lat1, lon1) 기준 후보 좌표 배열까지 거리(km). PlaceScorer._haversine과 같은 식."""
+    dlat = np.radians(lat2 - lat1)
+    dlon = np.radians(lon2 - lon1)
+    a = (np.sin(dlat / 2) ** 2
+         + np.cos(np.radians(lat1)) * np.cos(np.radians(lat2)) * np.sin(dlon / 2) ** 2)
+    return EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def geo_proximity_bonus(
+    lats: np.ndarray,
+    lngs: np.ndarray,
+    anchor_lat: float | None,
+    anchor_lng: float | None,
+    radius_km: float = 20.0,
+    max_boost: float = 0.20,
+) -> np.ndarray:
+    """PlaceScorer._geo_proximity_bonus의 배열 버전. 좌표 없음(NaN) / 반경 밖은 0."""
+    bonus = np.zeros(lats.shape[0], dtype=np.float64)
+    if anchor_lat in (None, 0, 0.0) or anchor_lng in (None, 0, 0.0):
+        return bonus
+    valid = ~(np.isnan(lats) | np.isnan(lngs))
+    dist = haversine_km(anchor_lat, anchor_lng, lats[valid], lngs[valid])
+    inside = dist <= radius_km
+    normalized = np.maximum(0.0, 1.0 - (dist / radius_km))
+    bonus[valid] = np.where(inside, max_boost * normalized, 0.0)
+    return bonus
+
+
+def rank_fused_candidates(
+    pool: CandidatePool,
+    keyword: np.ndarray,
+    location_text: np.ndarray,
+    geo_proximity: np.ndarray,
+    addr_sparse: np.ndarray,
+    boost_weight: float,
+    fused_score_max: float,
+    rrf_score_max: float,
+    max_boost_sum: float,
+) -> list[dict[str, Any]]:
+    """boost 합산 → 최종 점수 정렬 → 기존 search_hybrid 후보 dict 형식으로 변환."""
+    if not len(pool):
+        return []
+    rrf = pool.rrf_scores()
+    boost = keyword + location_text + geo_proximity + addr_sparse
+    # BOOST_WEIGHT로 스케일 보정: RRF first_stage_score(0.01~0.05) 대비 boost 합계 스케일 불균형 완화
+    final = rrf + boost_weight * boost
+    order = np.argsort(-final, kind="stable")
+
+    # 모든 점수를 [0.0, 1.0] 범위로 정규화 (반올림은 Python round로 기존 출력과 동일하게)
+    score_norm = np.minimum(1.0, final / fused_score_max)[order].tolist()
+    rrf_norm = np.minimum(1.0, rrf / rrf_score_max)[order].tolist()
+    boost_norm = np.minimum(1.0, boost / max_boost_sum)[order].tolist()
+    keyword_l = keyword[order].tolist()
+    location_l = location_text[order].tolist()
+    geo_l = geo_proximity[order].tolist()
+    addr_l = addr_sparse[order].tolist()
+
+    results = []
+    for idx, row in enumerate(order.tolist()):
+        results.append({
+            "id": pool.ids[row],
+            "score":             round(score_norm[idx], 4),
+            "first_stage_score": round(rrf_norm[idx], 4),
+            "first_stage_rank": idx + 1,
+            "payload": pool.payloads[row],
+            "match_types": sorted(pool.matches[row]),
+            "keyword_match_boost":  keyword_l[idx],
+            "location_text_boost":  location_l[idx],
+            "geo_proximity_boost":  geo_l[idx],
+            "addr_sparse_boost":    addr_l[idx],
+            "score_boost_total":    round(boost_norm[idx], 4),
+        })
+    return results
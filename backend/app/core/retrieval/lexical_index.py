@@ -0,0 +1,339 @@
+"""
+lexical_index.py — places 전체 코퍼스 한국어 lexical 역색인 (BM25)
+
+vector 채널 pool(≤100)만 재채점하던 pool-local BM25 대신, places 컬렉션 전체에 대해
+title / category / 주소 토큰 / 한글 2-gram 역색인을 만들어 독립 first-stage 채널로 사용한다.
+- IDF는 코퍼스 전체 기준 (pool 기준 IDF 아님)
+- BM25 tf 성분(k1, b, 문서 길이 정규화)은 빌드 시 미리 계산 → 검색 시 idf * weight 합산만 수행
+- CSR 배열(.npy)로 저장하고 np.load(mmap_mode="r")로 로드 → 프로세스 간 page cache 공유
+- category / geo 조건은 문서별 배열로 numpy mask 처리 (Qdrant places filter와 동일 의미)
+
+디렉토리 구성:
+  meta.json        문서 수, avgdl, category 목록, BM25 파라미터, 소스 points_count / 컬렉션 버전
+  vocab.json       term → term id
+  doc_ids.npy      int64 [N]   place id (contentid)
+  doc_category.npy int16 [N]   category 코드 (-1: 없음)
+  doc_lat.npy / doc_lon.npy    float32 [N] (NaN: geo 없음)
+  idf.npy          float32 [V]
+  offsets.npy      int64 [V+1] term별 postings 구간
+  postings.npy     int32 [nnz] 문서 index
+  weights.npy      float32 [nnz] BM25 tf 성분
+"""
+
+import json
+import math
+import os
+import re
+import shutil
+import tempfile
+from typing import Any, Iterable
+
+import numpy as np
+
+from app.scripts.preprocess_data import build_addr_tokens
+from app.utils.collection_version import get_collection_versions
+from app.utils.place_id import get_place_id_from_point
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+_WORD_RE = re.compile(r"[가-힣a-z0-9]+")
+_HANGUL_RE = re.compile(r"[가-힣]")
+_ARRAY_FILES = (
+    "doc_ids", "doc_category", "doc_lat", "doc_lon",
+    "idf", "offsets", "postings", "weights",
+)
+
+
+def analyze(text: str) -> list[str]:
+    """
+    query / 문서 공용 분석기.
+    - 단어 토큰 (한글/영문 소문자/숫자)
+    - 한글 포함 토큰의 문자 2-gram ("#" prefix) → 띄어쓰기 차이("남산 서울타워" vs "남산서울타워") 흡수
+    """
+    terms: list[str] = []
+    for token in _WORD_RE.findall(str(text or "").lower()):
+        terms.append(token)
+        if len(token) >= 2 and _HANGUL_RE.search(token):
+            terms.extend(f"#{token[i:i + 2]}" for i in range(len(token) - 1))
+    return terms
+
+
+def _document_terms(payload: dict[str, Any]) -> list[str]:
+    title = str(payload.get("title") or payload.get("name") or "")
+    category = str(payload.get("contenttypeid") or payload.get("category") or "")
+    addr = str(payload.get("addr") or payload.get("address") or payload.get("road_address") or "")
+    addr_tokens = payload.get("addr_tokens")
+    if not isinstance(addr_tokens, list):
+        addr_tokens = build_addr_tokens(payload)
+    # 주소 토큰은 analyze 결과와 별도로 그대로 추가 (stem 토큰 포함)
+    return analyze(" ".join([title, category, addr])) + [str(t).strip().lower() for t in addr_tokens if str(t).strip()]
+
+
+def _payload_category(payload: dict[str, Any]) -> str:
+    return str(payload.get("contenttypeid") or payload.get("category") or "").strip()
+
+
+def _payload_geo(payload: dict[str, Any]) -> tuple[float, float]:
+    # Qdrant geo filter와 같은 필드(geo)만 사용
+    geo = payload.get("geo")
+    if isinstance(geo, dict):
+        try:
+            return float(geo.get("lat")), float(geo.get("lon"))
+        except (TypeError, ValueError):
+            pass
+    return float("nan"), float("nan")
+
+
+class LexicalIndex:
+    """places 코퍼스 BM25 역색인 (CSR, 읽기 전용)."""
+
+    def __init__(self, meta: dict, vocab: dict[str, int], arrays: dict[str, np.ndarray]):
+        self.meta = meta
+        self.vocab = vocab
+        self.doc_ids = arrays["doc_ids"]
+        self.doc_category = arrays["doc_category"]
+        self.doc_lat = arrays["doc_lat"]
+        self.doc_lon = arrays["doc_lon"]
+        self.idf = arrays["idf"]
+        self.offsets = arrays["offsets"]
+        self.postings = arrays["postings"]
+        self.weights = arrays["weights"]
+        self.categories: list[str] = list(meta.get("categories", []))
+        self._category_codes = {name: code for code, name in enumerate(self.categories)}
+
+    @property
+    def num_docs(self) -> int:
+        return int(self.doc_ids.shape[0])
+
+    # ------------------------------------------------------------------
+    # 빌드 / 저장 / 로드
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(
+        cls,
+        records: Iterable[tuple[int, dict[str, Any]]],
+        source_points_count: int | None = None,
+        source_version: str | None = None,
+    ) -> "LexicalIndex":
+        """(place_id, payload) 목록으로 역색인 생성. source_version: 빌드 시점 컬렉션 버전 스탬프 (stale 판정용)."""
+        doc_ids: list[int] = []
+        doc_terms: list[dict[str, int]] = []
+        doc_lens: list[int] = []
+        categories: dict[str, int] = {}
+        doc_category: list[int] = []
+        doc_lat: list[float] = []
+        doc_lon: list[float] = []
+
+        for pid, payload in records:
+            payload = payload or {}
+            terms = _document_terms(payload)
+            tf: dict[str, int] = {}
+            for term in terms:
+                tf[term] = tf.get(term, 0) + 1
+            doc_ids.append(int(pid))
+            doc_terms.append(tf)
+            doc_lens.append(len(terms))
+            category = _payload_category(payload)
+            doc_category.append(categories.setdefault(category, len(categories)) if category else -1)
+            lat, lon = _payload_geo(payload)
+            doc_lat.append(lat)
+            doc_lon.append(lon)
+
+        num_docs = len(doc_ids)
+        avgdl = (sum(doc_lens) / num_docs) if num_docs else 0.0
+
+        # term → [(doc index, tf 성분)]
+        postings: dict[str, list[tuple[int, float]]] = {}
+        for doc_idx, (tf, doc_len) in enumerate(zip(doc_terms, doc_lens)):
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * (doc_len / avgdl if avgdl else 0.0))
+            for term, count in tf.items():
+                weight = ((BM25_K1 + 1) * count) / (count + norm)
+                postings.setdefault(term, []).append((doc_idx, weight))
+
+        vocab = {term: tid for tid, term in enumerate(sorted(postings))}
+        offsets = np.zeros(len(vocab) + 1, dtype=np.int64)
+        idf = np.zeros(len(vocab), dtype=np.float32)
+        for term, tid in vocab.items():
+            df = len(postings[term])
+            offsets[tid + 1] = df
+            # Robertson smoothed IDF (코퍼스 전체 기준)
+            idf[tid] = math.log((num_docs - df + 0.5) / (df + 0.5) + 1)
+        np.cumsum(offsets, out=offsets)
+
+        nnz = int(offsets[-1])
+        posting_docs = np.zeros(nnz, dtype=np.int32)
+        posting_weights = np.zeros(nnz, dtype=np.float32)
+        for term, tid in vocab.items():
+            start = offsets[tid]
+            items = postings[term]
+            posting_docs[start:start + len(items)] = [doc_idx for doc_idx, _ in items]
+            posting_weights[start:start + len(items)] = [w for _, w in items]
+
+        meta = {
+            "num_docs": num_docs,
+            "avgdl": avgdl,
+            "k1": BM25_K1,
+            "b": BM25_B,
+            "categories": list(categories),
+            "source_points_count": source_points_count if source_points_count is not None else num_docs,
+            "source_version": source_version,
+        }
+        arrays = {
+            "doc_ids": np.asarray(doc_ids, dtype=np.int64),
+            "doc_category": np.asarray(doc_category, dtype=np.int16),
+            "doc_lat": np.asarray(doc_lat, dtype=np.float32),
+            "doc_lon": np.asarray(doc_lon, dtype=np.float32),
+            "idf": idf,
+            "offsets": offsets,
+            "postings": posting_docs,
+            "weights": posting_weights,
+        }
+        return cls(meta, vocab, arrays)
+
+    def save(self, index_dir: str) -> None:
+        """
+        임시 디렉토리에 기록 후 rename으로 교체.
+        (다른 프로세스가 mmap 중인 기존 파일을 덮어쓰지 않음 → 재빌드 중에도 기존 인덱스로 검색 가능)
+        여러 worker가 동시에 저장해도 임시 디렉토리는 worker마다 고유하고, 다른 worker가 먼저 교체했으면 그 결과를 사용.
+        """
+        index_dir = os.path.abspath(index_dir)
+        parent, name = os.path.split(index_dir)
+        os.makedirs(parent, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(prefix=f".{name}.tmp-", dir=parent)
+        try:
+            for array_name in _ARRAY_FILES:
+                np.save(os.path.join(tmp_dir, f"{array_name}.npy"), np.asarray(getattr(self, array_name)))
+            with open(os.path.join(tmp_dir, "vocab.json"), "w", encoding="utf-8") as f:
+                json.dump(self.vocab, f, ensure_ascii=False)
+            with open(os.path.join(tmp_dir, "meta.json"), "w", encoding="utf-8") as f:
+                json.dump(self.meta, f, ensure_ascii=False, indent=2)
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+        old_dir = f"{tmp_dir}.old"
+        try:
+            try:
+                os.rename(index_dir, old_dir)
+            except FileNotFoundError:
+                pass  # 기존 인덱스 없음 (또는 다른 worker가 먼저 옮김)
+            try:
+                os.rename(tmp_dir, index_dir)
+            except OSError:
+                # 그 사이 다른 worker가 새 인덱스를 먼저 설치 → 그 결과를 사용
+                if not os.path.exists(os.path.join(index_dir, "meta.json")):
+                    raise
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                print(f"[INFO] lexical index already saved by another worker: {index_dir}")
+                return
+        finally:
+            shutil.rmtree(old_dir, ignore_errors=True)
+        print(f"[INFO] lexical index saved: {index_dir} docs={self.num_docs} terms={len(self.vocab)}")
+
+    @classmethod
+    def load(cls, index_dir: str, mmap: bool = True) -> "LexicalIndex | None":
+        """저장된 인덱스 로드. 없거나 불완전하면 None."""
+        meta_path = os.path.join(index_dir, "meta.json")
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(os.path.join(index_dir, "vocab.json"), "r", encoding="utf-8") as f:
+            vocab = json.load(f)
+        arrays = {
+            name: np.load(os.path.join(index_dir, f"{name}.npy"), mmap_mode="r" if mmap else None)
+            for name in _ARRAY_FILES
+        }
+        return cls(meta, vocab, arrays)
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        query: str,
+        limit: int,
+        categories: list[str] | None = None,
+        anchor_lat: float | None = None,
+        anchor_lon: float | None = None,
+        radius_m: float | None = None,
+    ) -> list[tuple[int, float]]:
+        """
+        BM25 top-k 검색. 반환: [(place_id, score)] (score는 1 - exp(-bm25)로 [0, 1) 정규화)
+        categories: CategoryType value 목록 (payload contenttypeid/category와 일치해야 통과)
+        """
+        if self.num_docs == 0 or limit <= 0:
+            return []
+        term_ids = {self.vocab[t] for t in analyze(query) if t in self.vocab}
+        if not term_ids:
+            return []
+
+        # 질의 term별 postings를 이어붙여 bincount 1회로 문서 점수 누적
+        doc_parts, weight_parts = [], []
+        for tid in term_ids:
+            start, end = self.offsets[tid], self.offsets[tid + 1]
+            doc_parts.append(self.postings[start:end])
+            weight_parts.append(self.weights[start:end] * self.idf[tid])
+        scores = np.bincount(
+            np.concatenate(doc_parts),
+            weights=np.concatenate(weight_parts),
+            minlength=self.num_docs,
+        )
+
+        if categories:
+            codes = [self._category_codes[c] for c in categories if c in self._category_codes]
+            if not codes:
+                return []
+            scores[~np.isin(self.doc_category, codes)] = 0.0
+
+        if anchor_lat is not None and anchor_lon is not None and radius_m is not None:
+            scores[self._outside_radius(float(anchor_lat), float(anchor_lon), float(radius_m))] = 0.0
+
+        hit_count = int(np.count_nonzero(scores > 0))
+        if hit_count == 0:
+            return []
+        k = min(int(limit), hit_count)
+        top = np.argpartition(-scores, k - 1)[:k]
+        # 동점은 문서 index 순 (결정론)
+        top = top[np.lexsort((top, -scores[top]))]
+        return [(int(self.doc_ids[i]), float(1 - math.exp(-scores[i]))) for i in top]
+
+    def _outside_radius(self, lat: float, lon: float, radius_m: float) -> np.ndarray:
+        lat1 = np.radians(lat)
+        lat2 = np.radians(self.doc_lat.astype(np.float64))
+        dlat = lat2 - lat1
+        dlon = np.radians(self.doc_lon.astype(np.float64) - lon)
+        a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+        dist_m = 6371000.0 * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+        # NaN(geo 없음)은 비교 결과 False → ~(dist <= r)로 반경 밖 처리
+        return ~(dist_m <= radius_m)
+
+
+def build_from_qdrant(client, collection_name: str, scroll_limit: int = 1000) -> LexicalIndex:
+    """
+    동기 QdrantClient로 컬렉션 전체를 scroll해서 역색인 생성. (startup / 적재 스크립트용)
+    scroll 전 컬렉션 버전 스탬프를 meta에 기록 → 문서 수가 같아도 재적재되면 stale로 판정.
+    """
+    source_version = get_collection_versions().get(collection_name)
+    points_count = client.count(collection_name=collection_name, exact=True).count
+    records: list[tuple[int, dict]] = []
+    offset = None
+    while True:
+        points, offset = client.scroll(
+            collection_name=collection_name,
+            limit=scroll_limit,
+            offset=offset,
+            with_payload=True,
+            with_vectors=False,
+        )
+        for point in points:
+            pid = get_place_id_from_point(point, prefer_payload=False, fallback_to_point_id=True)
+            if not pid.isdigit() or int(pid) <= 0:
+                continue
+            records.append((int(pid), point.payload or {}))
+        if offset is None:
+            break
+    print(f"[INFO] lexical index build: collection={collection_name} points={points_count} docs={len(records)}")
+    return LexicalIndex.build(records, source_points_count=points_count, source_version=source_version)
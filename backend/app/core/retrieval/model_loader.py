@@ -0,0 +1,102 @@
+"""
+model_loader.py — embedder / reranker 추론 backend 선택
+
+config(INFERENCE_BACKEND 등)에 따라 같은 모델을 다른 backend로 로드한다.
+- torch     : SentenceTransformer / CrossEncoder 기본 PyTorch fp32
+- onnx      : sentence-transformers backend="onnx" (ONNX Runtime fp32)
+- onnx-int8 : ONNX export 후 dynamic int8 양자화 파일을 ONNX_MODEL_CACHE_DIR에 캐시해서 로드
+
+CLIP(clip-ViT-L-14)은 sentence-transformers ONNX backend를 지원하지 않으므로
+onnx → torch fp32, onnx-int8 → torch dynamic int8(nn.Linear, CPU 전용)로 대체한다.
+반환 객체의 encode / predict 인터페이스는 backend와 무관하게 동일하다.
+"""
+
+import os
+import re
+
+import torch
+from sentence_transformers import CrossEncoder, SentenceTransformer
+
+from app.utils.config import DEVICE, ONNX_MODEL_CACHE_DIR, ONNX_QUANTIZATION_CONFIG
+
+INFERENCE_BACKENDS = ("torch", "onnx", "onnx-int8")
+
+
+def _normalize_backend(backend: str | None) -> str:
+    backend = (backend or "torch").strip().lower()
+    if backend not in INFERENCE_BACKENDS:
+        print(f"[WARN] unknown inference backend '{backend}', fallback to torch")
+        return "torch"
+    return backend
+
+
+def _quantized_dir(model_name: str) -> str:
+    return os.path.join(ONNX_MODEL_CACHE_DIR, re.sub(r"[^0-9A-Za-z._-]+", "__", model_name))
+
+
+def _quantized_file_name() -> str:
+    return f"onnx/model_qint8_{ONNX_QUANTIZATION_CONFIG}.onnx"
+
+
+def _load_onnx_int8(model_cls, model_name: str, **kwargs):
+    """
+    int8 양자화 ONNX 모델 로드. 캐시에 없으면 fp32 ONNX export → dynamic 양자화 → 저장 후 로드.
+    (최초 1회만 export 비용 발생)
+    """
+    from sentence_transformers import export_dynamic_quantized_onnx_model
+
+    save_dir = _quantized_dir(model_name)
+    file_name = _quantized_file_name()
+    if not os.path.exists(os.path.join(save_dir, file_name)):
+        print(f"[INFO] exporting int8 ONNX model: {model_name} -> {save_dir}")
+        fp32_model = model_cls(model_name, backend="onnx", **kwargs)
+        fp32_model.save_pretrained(save_dir)
+        export_dynamic_quantized_onnx_model(
+            fp32_model,
+            quantization_config=ONNX_QUANTIZATION_CONFIG,
+            model_name_or_path=save_dir,
+        )
+    return model_cls(save_dir, backend="onnx", model_kwargs={"file_name": file_name}, **kwargs)
+
+
+def _quantize_torch_int8(model):
+    """ONNX 미지원 모델(CLIP)의 int8 대체: nn.Linear dynamic 양자화 (CPU 전용)."""
+    if DEVICE != "cpu":
+        print(f"[WARN] torch dynamic int8 requires cpu (device={DEVICE}), keep fp32")
+        return model
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def load_sentence_model(model_name: str, backend: str | None = None, onnx_supported: bool = True) -> SentenceTransformer:
+    """
+    SentenceTransformer 로드.
+    onnx_supported=False인 모델(CLIP)은 onnx → torch fp32, onnx-int8 → torch dynamic int8로 로드.
+    onnx 계열 로드 실패 시 torch fp32로 fallback.
+    """
+    backend = _normalize_backend(backend)
+    print(f"[INFO] loading sentence model {model_name} backend={backend}")
+    if backend != "torch":
+        try:
+            if not onnx_supported:
+                model = SentenceTransformer(model_name, device=DEVICE)
+                return _quantize_torch_int8(model) if backend == "onnx-int8" else model
+            if backend == "onnx":
+                return SentenceTransformer(model_name, device=DEVICE, backend="onnx")
+            return _load_onnx_int8(SentenceTransformer, model_name, device=DEVICE)
+        except Exception as e:
+            print(f"[WARN] {backend} backend unavailable for {model_name}, fallback to torch: {e}")
+    return SentenceTransformer(model_name, device=DEVICE)
+
+
+def load_cross_encoder(model_name: str, backend: str | None = None) -> CrossEncoder:
+    """CrossEncoder 로드. onnx 계열 로드 실패 시 torch fp32로 fallback."""
+    backend = _normalize_backend(backend)
+    print(f"[INFO] loading cross encoder {model_name} backend={backend}")
+    if backend != "torch":
+        try:
+            if backend == "onnx":
+                return CrossEncoder(model_name, device=DEVICE, backend="onnx")
+            return _load_onnx_int8(CrossEncoder, model_name, device=DEVICE)
+        except Exception as e:
+            print(f"[WARN] {backend} backend unavailable for {model_name}, fallback to torch: {e}")
+    return CrossEncoder(model_name, device=DEVICE)
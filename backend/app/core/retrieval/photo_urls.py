@@ -0,0 +1,87 @@
+"""
+photo_urls.py — contentid → 대표 사진 URL in-memory 색인
+
+retrieval_place가 매 턴 photos 컬렉션을 contentid should filter로 scroll하던 방식 대신,
+적재 시 places payload에 저장한 대표 사진 URL 목록(photo_urls)을 startup에 한 번 읽어 dict로 보관한다.
+- 조회: 결과 k개에 대해 dict 조회 O(k)
+- 갱신: 최종 결과 전체 payload 보강(late hydration) 때 받은 photo_urls로 upsert
+"""
+
+import threading
+from typing import Any, Iterable
+
+PHOTO_URLS_FIELD = "photo_urls"
+# payload에 저장하지 않는 URL (base64 data URL 등 큰 값)
+PHOTO_URL_MAX_LENGTH = 2048
+
+
+def select_photo_urls(urls: Iterable[Any], max_urls: int) -> list[str]:
+    """적재용 대표 사진 URL 목록: 순서 유지 중복 제거, data URL / 과도하게 긴 값 제외, 최대 max_urls개."""
+    selected: list[str] = []
+    for url in urls:
+        text = str(url or "").strip()
+        if not text or text.startswith("data:") or len(text) > PHOTO_URL_MAX_LENGTH or text in selected:
+            continue
+        selected.append(text)
+        if len(selected) >= max_urls:
+            break
+    return selected
+
+
+class PhotoUrlIndex:
+    """contentid(str) → 대표 사진 URL tuple. thread-safe."""
+
+    def __init__(self, items: Iterable[tuple[Any, Iterable[str]]] = ()):
+        self._lock = threading.Lock()
+        self._urls: dict[str, tuple[str, ...]] = {}
+        self.update_many(items)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._urls)
+
+    def update_many(self, items: Iterable[tuple[Any, Iterable[str] | None]]) -> None:
+        rows = [(str(cid).strip(), tuple(urls)) for cid, urls in items if cid is not None and urls]
+        with self._lock:
+            self._urls.update((cid, urls) for cid, urls in rows if cid)
+
+    def update_from_payloads(self, items: Iterable[tuple[Any, dict[str, Any] | None]]) -> None:
+        """(place id, places payload) → photo_urls 필드가 있는 장소만 반영."""
+        self.update_many(
+            (pid, payload.get(PHOTO_URLS_FIELD))
+            for pid, payload in items
+            if payload and isinstance(payload.get(PHOTO_URLS_FIELD), list)
+        )
+
+    def get_many(self, content_ids: Iterable[Any], per_place: int = 3) -> dict[str, list[str]]:
+        """요청한 contentid마다 최대 per_place개 URL (색인에 없으면 빈 리스트)."""
+        with self._lock:
+            return {
+                cid: list(self._urls.get(cid, ())[:per_place])
+                for cid in (str(c).strip() for c in content_ids if c is not None)
+                if cid
+            }
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"places": len(self._urls), "urls": sum(len(urls) for urls in self._urls.values())}
+
+
+def build_from_qdrant(client, collection_name: str, scroll_limit: int = 1000) -> PhotoUrlIndex:
+    """동기 QdrantClient로 places의 photo_urls 필드만 scroll해서 색인 생성. (startup용)"""
+    items: list[tuple[Any, list[str]]] = []
+    offset = None
+    while True:
+        points, offset = client.scroll(
+            collection_name=collection_name,
+            limit=scroll_limit,
+            offset=offset,
+            with_payload=[PHOTO_URLS_FIELD],
+            with_vectors=False,
+        )
+        items.extend((point.id, (point.payload or {}).get(PHOTO_URLS_FIELD)) for point in points)
+        if offset is None:
+            break
+    index = PhotoUrlIndex(items)
+    print(f"[INFO] photo url index build: collection={collection_name} points={len(items)} indexed={len(index)}")
+    return index
@@ -1,35 +1,147 @@
 import os
+import time
+import random
+import threading
 import numpy as np
 import asyncio
+import httpx
+from dataclasses import dataclass, replace
 
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.models import (
-    Filter, FieldCondition, MatchValue, MatchAny, SparseVector
+    Filter, FieldCondition, MatchValue, MatchAny, SparseVector, QueryRequest
 )
-from sentence_transformers import SentenceTransformer
 
 from app.utils.config import (
     PLACES_COLLECTION, PHOTOS_COLLECTION, DEVICE,
+    PLACE_IMAGE_VECTOR_NAME, ENABLE_PLACE_IMAGE_VECTOR,
     TEXT_MODEL, VISION_MODEL, TEXT_VECTOR_SIZE, VISION_VECTOR_SIZE,
     BM25_POOL_LIMIT, BM25_ENABLE_THRESHOLD, BM25_ENABLE_SCORE_THRESHOLD,
     ENABLE_ADDR_SPARSE_BOOST, ENABLE_GEO_FILTER,
     ENABLE_QDRANT_SPARSE,
-    BOOST_WEIGHT,
     CANDIDATE_LIMIT_MULTIPLIER,
-    GEO_PROXIMITY_RADIUS_KM,
-    RRF_SCORE_MAX, FUSED_SCORE_MAX, MAX_BOOST_SUM,
+    CHANNEL_TIMEOUT_S, IMAGE_EMOTIONAL_CHANNEL_TIMEOUT_S, IMAGE_DESCRIPTION_DEADLINE_S,
+    EMBEDDING_CACHE_MAX_SIZE, EMBEDDING_CACHE_TTL_S,
+    ENABLE_ENCODE_BATCHING, ENCODE_BATCH_MAX_SIZE, ENCODE_BATCH_MAX_WAIT_MS, RERANK_BATCH_MAX_SIZE,
+    ENABLE_QDRANT_BATCH_QUERY, QDRANT_BATCH_MAX_SIZE, QDRANT_BATCH_MAX_WAIT_MS, QDRANT_BATCH_MAX_IN_FLIGHT,
+    QDRANT_PREFER_GRPC, QDRANT_GRPC_PORT, QDRANT_TIMEOUT_S,
+    QDRANT_POOL_MAX_CONNECTIONS, QDRANT_POOL_MAX_KEEPALIVE,
+    TEXT_INFERENCE_BACKEND, VISION_INFERENCE_BACKEND,
+    ENABLE_LEXICAL_INDEX, LEXICAL_INDEX_BUILD_ON_STARTUP, LEXICAL_INDEX_DIR,
+    PLACE_FEATURE_CACHE_MAX_SIZE, PLACE_PAYLOAD_CACHE_MAX_SIZE, ENABLE_PAYLOAD_PROJECTION,
+    ENABLE_PHOTO_URL_INDEX,
+    ENABLE_SPATIAL_INDEX, SPATIAL_INDEX_REFRESH_S,
+    GEO_RADIUS_LADDER, GEO_LADDER_CITY_RADIUS_M, GEO_LADDER_MIN_CANDIDATES,
+    ENABLE_SEARCH_RESULT_CACHE, SEARCH_RESULT_CACHE_MAX_SIZE, SEARCH_RESULT_CACHE_TTL_S, SEARCH_CACHE_GRID_DEG,
+    ENABLE_SEMANTIC_CACHE, SEMANTIC_CACHE_MAX_SIZE, SEMANTIC_CACHE_THRESHOLD, SEMANTIC_CACHE_TTL_S,
+    SEMANTIC_CACHE_AUDIT_RATE, SEMANTIC_CACHE_MIN_NDCG, SEMANTIC_CACHE_MIN_AUDITS, SEMANTIC_CACHE_DISABLE_COOLDOWN_S,
     get_retrieval_params,
 )
 from app.schemas.chat import ChatMessageCreate
-from app.scripts.preprocess_data import download_image, build_sparse_vector
+from app.scripts.preprocess_data import build_sparse_vector
 from app.utils.geocoder import GeoCoder
 from app.utils.vision import describe_image
-from app.core.retrieval.place_score import PlaceScorer, _extract_place_id, _to_positive_int
+from app.utils.image_loader import ImageLoader
+from app.utils.collection_version import get_collection_versions
+from app.core.retrieval.place_score import PlaceScorer, _extract_place_features, _extract_place_id, _to_positive_int
+from app.core.retrieval.place_features import PlaceFeatureStore
+from app.core.retrieval.place_payloads import FIRST_STAGE_PAYLOAD_FIELDS, PlacePayloadCache, is_place_payload
+from app.core.retrieval.photo_urls import PhotoUrlIndex, build_from_qdrant as build_photo_url_index
+from app.core.retrieval.fusion import CandidatePool
+from app.core.retrieval.channels import ChannelRunner
+from app.core.retrieval.embedding_cache import EmbeddingCache
+from app.core.retrieval.result_cache import SearchResultCache, _snap, build_search_key
+from app.core.retrieval.semantic_cache import SemanticQueryCache
+from app.core.retrieval.batching import MicroBatcher
+from app.core.retrieval.model_loader import load_sentence_model
+from app.core.retrieval.lexical_index import LexicalIndex, build_from_qdrant
+from app.core.retrieval.spatial_index import SpatialIndex, build_from_qdrant as build_spatial_index
 from app.agents.models.output import CategoryType
 
 
+# 벡터 채널 병합 순서 (name, RRF 가중치, source collection)
+# 동시 실행 후에도 이 순서로 collect_hits → payload 선택/점수 누적이 결정론적으로 유지됨
+# text_to_image는 places.img_vec_agg가 있으면 PLACES에서 조회 (PlaceRetriever.text_to_image_collection)
+VECTOR_CHANNEL_SPECS = (
+    ("text_semantic", 1.0, PLACES_COLLECTION),
+    ("qdrant_sparse", 0.85, PLACES_COLLECTION),
+    ("text_to_image", 0.5, PHOTOS_COLLECTION),
+    ("image_visual", 1.0, PHOTOS_COLLECTION),
+    ("image_emotional", 0.8, PLACES_COLLECTION),
+)
+# first stage 채널 조회 payload (projection 사용 시 필드 목록, 아니면 전체 payload)
+FIRST_STAGE_WITH_PAYLOAD: bool | list[str] = list(FIRST_STAGE_PAYLOAD_FIELDS) if ENABLE_PAYLOAD_PROJECTION else True
+# BM25가 재채점하는 PLACES 벡터 채널
+PLACE_VECTOR_CHANNELS = ("text_semantic", "qdrant_sparse", "image_emotional")
+# geo filter가 적용되는 채널 → geo 반경 단계별로 실행
+GEO_LADDER_CHANNELS = (*PLACE_VECTOR_CHANNELS, "bm25_lexical")
+
+
+def _geo_radius_ladder(radius_m: float) -> list[float | None]:
+    """
+    landmark anchor 반경 단계 [r * GEO_RADIUS_LADDER..., GEO_LADDER_CITY_RADIUS_M, None(geo 없음)].
+    시 단위 반경 이상인 배수 단계는 생략. 마지막 None은 기존 0결과 fallback(geo 제거)과 같은 의미.
+    """
+    radii: list[float | None] = []
+    for multiplier in GEO_RADIUS_LADDER:
+        radius = float(radius_m) * multiplier
+        if GEO_LADDER_CITY_RADIUS_M and radius >= GEO_LADDER_CITY_RADIUS_M:
+            break
+        if not radii or radius > radii[-1]:
+            radii.append(radius)
+    if GEO_LADDER_CITY_RADIUS_M and (not radii or GEO_LADDER_CITY_RADIUS_M > radii[-1]):
+        radii.append(GEO_LADDER_CITY_RADIUS_M)
+    radii.append(None)
+    return radii
+
+
+def _normalize_search_scope(search_scope: str | None) -> str:
+    scope = (search_scope or "auto").strip().lower()
+    return scope if scope in {"auto", "place_only", "photo_only"} else "auto"
+
+
+@dataclass
+class HybridSearchRequest:
+    """search_hybrid 인자 묶음 — search_hybrid_many 입력 단위. (필드 의미는 search_hybrid와 동일)"""
+    query: str
+    image_url: str | None = None
+    limit: int = 5
+    categories: list[CategoryType] | None = None
+    emotional_text: str | None = None
+    user_latitude: float | None = None
+    user_longitude: float | None = None
+    preferred_location: str | None = None
+    candidate_k: int | None = None
+    enable_bm25: bool = True
+    enable_rerank: bool = True
+    rerank_top_k: int | None = None
+    search_scope: str = "auto"
+    location_anchor_lat: float | None = None
+    location_anchor_lon: float | None = None
+    location_radius_m: float | None = None
+
+
+@dataclass
+class _FirstStage:
+    """요청 1건의 first stage(fusion) 결과 — rerank 전 단계."""
+    candidates: list[dict]
+    emotional_text: str | None
+    rerank_top_k: int
+    pool_size: int
+    # 이미지 설명이 deadline 내에 오지 않아 emotional 채널 없이 융합됨 (결과 캐시 제외)
+    description_dropped: bool = False
+    # 채널 1개 이상이 timeout / 오류로 빠진 채 융합됨 (결과 캐시 제외)
+    degraded: bool = False
+
+
 class PlaceRetriever(PlaceScorer):
     _instance = None
+    # text_to_image 채널 조회 대상 (places.img_vec_agg 확인 후 PLACES로 전환)
+    text_to_image_collection = PHOTOS_COLLECTION
+    # photos 경량 payload 후보 보강용 장소 payload 캐시 (None이면 보강 생략)
+    place_payloads: PlacePayloadCache | None = None
+    # contentid → 대표 사진 URL 색인 (None이면 photos scroll 조회)
+    photo_url_index: PhotoUrlIndex | None = None
 
     @classmethod
     def get_instance(cls):
@@ -41,17 +153,356 @@ class PlaceRetriever(PlaceScorer):
     def __init__(self):
         host = os.getenv('QDRANT_HOST', "localhost")
         port = os.getenv('QDRANT_PORT', 6333)
-        print(f"[INFO] Connecting to Qdrant at {host}:{port}")
+        print(f"[INFO] Connecting to Qdrant at {host}:{port} (grpc={'yes' if QDRANT_PREFER_GRPC else 'no'})")
+        # 동기 client: 스크립트/평가 및 동기 API(search_text, search_nearby)용
         self.client = QdrantClient(host=host, port=port)
+        # 비동기 client: 서버 검색 경로용. event loop별로 생성 (self.aclient 참고)
+        self._qdrant_host = host
+        self._qdrant_port = int(port)
+        self._aclient: AsyncQdrantClient | None = None
+        self._aclient_loop: asyncio.AbstractEventLoop | None = None
 
         print(f"[INFO] Loading models: Text={TEXT_MODEL}, Vision={VISION_MODEL}")
-        self.text_model = SentenceTransformer(TEXT_MODEL, device=DEVICE)
-        self.vision_model = SentenceTransformer(VISION_MODEL, device=DEVICE)
+        self.text_model = load_sentence_model(TEXT_MODEL, TEXT_INFERENCE_BACKEND)
+        self.vision_model = load_sentence_model(VISION_MODEL, VISION_INFERENCE_BACKEND, onnx_supported=False)
         self._reranker = None
         self._reranker_load_attempted = False
+        # query embedding 캐시 (namespace: "text"=BGE-M3, "clip_text"=CLIP text encoder)
+        self.embedding_cache = EmbeddingCache(
+            max_size=EMBEDDING_CACHE_MAX_SIZE,
+            ttl_s=EMBEDDING_CACHE_TTL_S,
+        )
+        # 요청 간 micro-batching: 동시 요청의 단건 encode/predict를 모델별 batch 1회로 묶음
+        # CLIP은 text/image 입력을 한 batch에 섞어 encode 가능 → 모델 단위로 batcher 1개
+        self._text_batcher = None
+        self._clip_batcher = None
+        self._rerank_batcher = None
+        if ENABLE_ENCODE_BATCHING:
+            self._text_batcher = MicroBatcher(
+                "text",
+                lambda items: self.text_model.encode(items, batch_size=len(items)),
+                max_batch_size=ENCODE_BATCH_MAX_SIZE,
+                max_wait_ms=ENCODE_BATCH_MAX_WAIT_MS,
+            )
+            self._clip_batcher = MicroBatcher(
+                "clip",
+                lambda items: self.vision_model.encode(items, batch_size=len(items)),
+                max_batch_size=ENCODE_BATCH_MAX_SIZE,
+                max_wait_ms=ENCODE_BATCH_MAX_WAIT_MS,
+            )
+            self._rerank_batcher = MicroBatcher(
+                "rerank",
+                lambda pairs: self._reranker.predict(pairs, batch_size=len(pairs)),
+                max_batch_size=RERANK_BATCH_MAX_SIZE,
+                max_wait_ms=ENCODE_BATCH_MAX_WAIT_MS,
+            )
+
+        # 장소별 점수 feature 캐시 (토큰 set / stem / 좌표 / compact text)
+        self.place_features = PlaceFeatureStore(_extract_place_features, max_size=PLACE_FEATURE_CACHE_MAX_SIZE)
+        self.lexical_index = self._load_lexical_index()
+        # places 좌표 공간 색인 (search_nearby / geo proximity 좌표 보강)
+        self._spatial_version: str | None = None
+        self._spatial_checked_at = time.monotonic()
+        self._spatial_refresh_lock = threading.Lock()
+        self.spatial_index = self._load_spatial_index()
+        if self._has_place_image_vector():
+            self.text_to_image_collection = PLACES_COLLECTION
+        print(f"[INFO] text_to_image channel collection={self.text_to_image_collection}")
+
+        # search_hybrid 결과 캐시 (컬렉션 버전 스탬프가 바뀌면 무효화)
+        collection_version = lambda: tuple(
+            get_collection_versions().get(name) for name in (PLACES_COLLECTION, PHOTOS_COLLECTION)
+        )
+        self.search_cache = None
+        if ENABLE_SEARCH_RESULT_CACHE:
+            self.search_cache = SearchResultCache(
+                max_size=SEARCH_RESULT_CACHE_MAX_SIZE,
+                ttl_s=SEARCH_RESULT_CACHE_TTL_S,
+                version_fn=collection_version,
+            )
+        # photos 채널 후보 late hydration용 장소 payload 캐시
+        self.place_payloads = PlacePayloadCache(max_size=PLACE_PAYLOAD_CACHE_MAX_SIZE, version_fn=collection_version)
+        self.photo_url_index = self._load_photo_url_index()
+        # 표현만 다른 유사 query 결과 캐시 (BGE-M3 query 임베딩 cosine + 필터 서명)
+        self.semantic_cache = None
+        if ENABLE_SEMANTIC_CACHE:
+            self.semantic_cache = SemanticQueryCache(
+                max_size=SEMANTIC_CACHE_MAX_SIZE,
+                threshold=SEMANTIC_CACHE_THRESHOLD,
+                ttl_s=SEMANTIC_CACHE_TTL_S,
+                min_quality=SEMANTIC_CACHE_MIN_NDCG,
+                min_audits=SEMANTIC_CACHE_MIN_AUDITS,
+                version_fn=collection_version,
+                disable_cooldown_s=SEMANTIC_CACHE_DISABLE_COOLDOWN_S,
+            )
+        self._background_tasks: set[asyncio.Task] = set()
+
+        # Qdrant batch query: 채널/쿼리별 query_points 대신 collection별 query_batch_points 1회
+        self._query_batchers: dict[str, MicroBatcher] = {}
+        if ENABLE_QDRANT_BATCH_QUERY:
+            for collection_name in (PLACES_COLLECTION, PHOTOS_COLLECTION):
+                async def query_batch(requests, name=collection_name):
+                    return await self.aclient.query_batch_points(collection_name=name, requests=requests)
+
+                self._query_batchers[collection_name] = MicroBatcher(
+                    f"qdrant:{collection_name}",
+                    query_batch,
+                    max_batch_size=QDRANT_BATCH_MAX_SIZE,
+                    max_wait_ms=QDRANT_BATCH_MAX_WAIT_MS,
+                    max_in_flight=QDRANT_BATCH_MAX_IN_FLIGHT,
+                )
 
         print(f"[INFO] PlaceRetriever ready on {DEVICE}")
 
+    @property
+    def aclient(self) -> AsyncQdrantClient:
+        """
+        AsyncQdrantClient (REST: httpx 커넥션 풀 / gRPC: QDRANT_PREFER_GRPC).
+        커넥션이 event loop에 묶이므로 loop가 바뀌면 새로 생성하고 이전 client는 닫는다. (스크립트의 반복 asyncio.run 대응)
+        """
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            if self._aclient is not None:
+                self._close_stale_aclient(self._aclient, self._aclient_loop, loop)
+            self._aclient = AsyncQdrantClient(
+                host=self._qdrant_host,
+                port=self._qdrant_port,
+                grpc_port=QDRANT_GRPC_PORT,
+                prefer_grpc=QDRANT_PREFER_GRPC,
+                timeout=QDRANT_TIMEOUT_S,
+                limits=httpx.Limits(
+                    max_connections=QDRANT_POOL_MAX_CONNECTIONS,
+                    max_keepalive_connections=QDRANT_POOL_MAX_KEEPALIVE,
+                ),
+            )
+            self._aclient_loop = loop
+        return self._aclient
+
+    def _close_stale_aclient(
+        self,
+        client: AsyncQdrantClient,
+        client_loop: asyncio.AbstractEventLoop | None,
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        """loop가 바뀌어 교체된 client 커넥션 정리 (best-effort — 실패해도 요청에는 영향 없음)."""
+        async def close() -> None:
+            try:
+                await client.close()
+            except Exception as e:
+                print(f"[WARN] stale qdrant async client close failed: {e}")
+
+        if client_loop is not None and client_loop.is_running() and not client_loop.is_closed():
+            # 다른 thread에서 아직 도는 loop → 그 loop에서 닫음
+            asyncio.run_coroutine_threadsafe(close(), client_loop)
+            return
+        task = loop.create_task(close())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def aclose(self) -> None:
+        """서버 종료 시 batcher에 남은 요청 처리 후 async client 커넥션 정리."""
+        batchers = [self._text_batcher, self._clip_batcher, self._rerank_batcher, *self._query_batchers.values()]
+        await asyncio.gather(*(batcher.aclose() for batcher in batchers if batcher is not None))
+        if self._aclient is not None:
+            await self._aclient.close()
+            self._aclient = None
+            self._aclient_loop = None
+
+    # ------------------------------------------------------------------
+    # 코퍼스 lexical 역색인
+    # ------------------------------------------------------------------
+
+    def _load_lexical_index(self) -> LexicalIndex | None:
+        """
+        LEXICAL_INDEX_DIR의 역색인을 mmap 로드.
+        없거나 places points 수 / 컬렉션 버전 스탬프가 빌드 시점과 다르면
+        (LEXICAL_INDEX_BUILD_ON_STARTUP일 때) Qdrant에서 재빌드.
+        실패 시 None → 기존 pool 재채점 BM25 사용.
+        """
+        if not ENABLE_LEXICAL_INDEX:
+            return None
+        try:
+            index = LexicalIndex.load(LEXICAL_INDEX_DIR)
+            points_count = self.client.count(collection_name=PLACES_COLLECTION, exact=True).count
+            version = get_collection_versions().get(PLACES_COLLECTION)
+            if (
+                index is not None
+                and index.meta.get("source_points_count") == points_count
+                and index.meta.get("source_version") == version
+            ):
+                print(f"[INFO] lexical index loaded docs={index.num_docs} terms={len(index.vocab)}")
+                return index
+            if not LEXICAL_INDEX_BUILD_ON_STARTUP:
+                if index is not None:
+                    print(
+                        f"[WARN] lexical index stale (index={index.meta.get('source_points_count')} places={points_count} "
+                        f"index_version={index.meta.get('source_version')} places_version={version})"
+                    )
+                return index
+            build_from_qdrant(self.client, PLACES_COLLECTION).save(LEXICAL_INDEX_DIR)
+            return LexicalIndex.load(LEXICAL_INDEX_DIR)
+        except Exception as e:
+            print(f"[WARN] lexical index unavailable, fallback to pool BM25: {e}")
+            return None
+
+    def _load_spatial_index(self) -> SpatialIndex | None:
+        """places payload 좌표로 공간 색인 생성. 실패 시 None → 기존 geo filter scroll 사용."""
+        if not ENABLE_SPATIAL_INDEX:
+            return None
+        try:
+            # 버전을 먼저 읽어야 생성 도중 bump된 변경을 다음 refresh에서 놓치지 않음
+            version = get_collection_versions().get(PLACES_COLLECTION)
+            index = build_spatial_index(self.client, PLACES_COLLECTION)
+            self._spatial_version = version
+            return index
+        except Exception as e:
+            print(f"[WARN] spatial index unavailable, fallback to geo filter scroll: {e}")
+            return None
+
+    def _load_photo_url_index(self) -> PhotoUrlIndex | None:
+        """places payload photo_urls로 대표 사진 URL 색인 생성. 비어 있거나 실패 시 None → photos scroll 조회."""
+        if not ENABLE_PHOTO_URL_INDEX:
+            return None
+        try:
+            index = build_photo_url_index(self.client, PLACES_COLLECTION)
+        except Exception as e:
+            print(f"[WARN] photo url index unavailable, fallback to photos scroll: {e}")
+            return None
+        if not len(index):
+            print("[WARN] places payload has no photo_urls, fallback to photos scroll")
+            return None
+        return index
+
+    def _has_place_image_vector(self) -> bool:
+        """places 컬렉션에 장소별 대표 이미지 벡터(img_vec_agg)가 있는지. 재생성 전 스키마면 False."""
+        if not ENABLE_PLACE_IMAGE_VECTOR:
+            return False
+        try:
+            vectors = self.client.get_collection(PLACES_COLLECTION).config.params.vectors
+        except Exception as e:
+            print(f"[WARN] places collection info unavailable, text_to_image uses photos: {e}")
+            return False
+        return isinstance(vectors, dict) and PLACE_IMAGE_VECTOR_NAME in vectors
+
+    def _maybe_refresh_spatial_index(self) -> None:
+        """
+        places 컬렉션 버전 스탬프가 색인 생성 시점과 다르면 백그라운드 스레드에서 전체 재생성 후 교체.
+        재생성 시도는 SPATIAL_INDEX_REFRESH_S마다 최대 1회, 재생성 중에도 기존 색인으로 응답.
+        (search_nearby / asearch_nearby / geo proximity 좌표 보강 경로에서 호출 — 요청을 막지 않음)
+        """
+        if self.spatial_index is None:
+            return
+        version = get_collection_versions().get(PLACES_COLLECTION)
+        if version is None or version == self._spatial_version:
+            return
+        if time.monotonic() - self._spatial_checked_at < SPATIAL_INDEX_REFRESH_S:
+            return
+        if not self._spatial_refresh_lock.acquire(blocking=False):
+            return
+        self._spatial_checked_at = time.monotonic()
+        threading.Thread(target=self._refresh_spatial_index, args=(version,), daemon=True).start()
+
+    def _refresh_spatial_index(self, version: str) -> None:
+        try:
+            print(f"[INFO] spatial index refresh: places version {self._spatial_version} -> {version}")
+            self.spatial_index = build_spatial_index(self.client, PLACES_COLLECTION)
+            self._spatial_version = version
+        except Exception as e:
+            print(f"[WARN] spatial index refresh failed, keep current index: {e}")
+        finally:
+            self._spatial_refresh_lock.release()
+
+    async def _search_lexical_index(
+        self,
+        query: str,
+        categories: list[CategoryType] | None,
+        limit: int,
+        anchor_lat: float | None = None,
+        anchor_lon: float | None = None,
+        radius_m: float | None = None,
+    ) -> list[dict]:
+        """역색인 BM25 top-k → places payload 조회. 반환 형식은 _search_bm25_lexical과 동일."""
+        hits = self.lexical_index.search(
+            query,
+            limit=limit,
+            categories=[c.value for c in (categories or [])],
+            anchor_lat=anchor_lat,
+            anchor_lon=anchor_lon,
+            radius_m=radius_m,
+        )
+        if not hits:
+            return []
+        points = await self.aclient.retrieve(
+            collection_name=PLACES_COLLECTION,
+            ids=[pid for pid, _ in hits],
+            with_payload=FIRST_STAGE_WITH_PAYLOAD,
+            with_vectors=False,
+        )
+        payloads = {_to_positive_int(p.id): p.payload or {} for p in points}
+        return [
+            {"id": pid, "payload": payloads[pid], "score": score}
+            for pid, score in hits
+            if pid in payloads
+        ]
+
+    # ------------------------------------------------------------------
+    # Query encode (embedding 캐시 경유)
+    # ------------------------------------------------------------------
+
+    def _encode_text(self, text: str) -> np.ndarray:
+        """BGE-M3 query encode (동기). 캐시 hit이면 모델 호출 없음."""
+        return self.embedding_cache.get_or_compute("text", text, self.text_model.encode)
+
+    def _encode_clip_text(self, text: str) -> np.ndarray:
+        """CLIP text encoder query encode (동기)."""
+        return self.embedding_cache.get_or_compute("clip_text", text, self.vision_model.encode)
+
+    async def _aencode_many(self, namespace: str, model, batcher: MicroBatcher | None, texts: list[str]) -> list[np.ndarray]:
+        """
+        여러 query를 캐시 확인 후 miss만 모아 encode 1회로 처리. 반환은 texts 순서.
+        (batcher 사용 시 같은 시점의 다른 요청 encode와도 함께 묶임)
+        """
+        resolved: dict[str, np.ndarray] = {}
+        misses = []
+        for text in dict.fromkeys(texts):
+            cached = self.embedding_cache.get(namespace, text)
+            if cached is not None:
+                resolved[text] = cached
+            else:
+                misses.append(text)
+        if misses:
+            if batcher is not None:
+                vecs = await batcher.submit_many(misses)
+            else:
+                vecs = await asyncio.to_thread(model.encode, misses, batch_size=len(misses))
+            for text, vec in zip(misses, vecs):
+                resolved[text] = self.embedding_cache.put(namespace, text, vec)
+        return [resolved[text] for text in texts]
+
+    async def _aencode_texts(self, texts: list[str]) -> list[np.ndarray]:
+        return await self._aencode_many("text", self.text_model, self._text_batcher, texts)
+
+    async def _aencode_clip_texts(self, texts: list[str]) -> list[np.ndarray]:
+        return await self._aencode_many("clip_text", self.vision_model, self._clip_batcher, texts)
+
+    async def _aencode_text(self, text: str) -> np.ndarray:
+        return (await self._aencode_texts([text]))[0]
+
+    async def _aencode_clip_text(self, text: str) -> np.ndarray:
+        return (await self._aencode_clip_texts([text]))[0]
+
+    async def aencode_query(self, text: str) -> np.ndarray:
+        """BGE-M3 query 임베딩 (embedding 캐시 / encode batcher 공유). intent 분류기 입력용."""
+        return await self._aencode_text(text)
+
+    async def _aencode_image(self, img) -> np.ndarray:
+        """CLIP vision encode (PIL Image)."""
+        if self._clip_batcher is not None:
+            vec = await self._clip_batcher.submit(img)
+        else:
+            vec = await asyncio.to_thread(self.vision_model.encode, img)
+        return np.asarray(vec, dtype=np.float32)
+
     def _build_query_filter(
         self,
         categories: list[CategoryType] = None,
@@ -103,13 +554,22 @@ class PlaceRetriever(PlaceScorer):
         print(f"[INFO] query_filter built: category={categories} values={category_values} geo={'yes' if anchor_lat else 'no'}")
         return built
 
-    def search_text(self, query: str, limit: int = 5, categories: list[CategoryType] = None, has_image: bool = False):
+    def search_text(
+        self,
+        query: str,
+        limit: int = 5,
+        categories: list[CategoryType] = None,
+        has_image: bool = False,
+        with_payload: bool | list[str] = True,
+    ):
         """
         Text-based search for places (Semantic).
         Uses 'text_vec' (BGE-M3) in PLACES_COLLECTION.
+        동기 버전 — 스크립트/평가용. async 코드에서는 asearch_text 사용.
+        with_payload에 필드 목록을 넘기면 해당 payload 필드만 조회.
         """
         print(f"[INFO] search_text (Semantic) start query='{query[:80]}' limit={limit} categories={categories} has_image={has_image}")
-        query_vec = self.text_model.encode(query).astype(np.float32)
+        query_vec = self._encode_text(query)
 
         query_filter = self._build_query_filter(categories, has_image)
 
@@ -117,27 +577,43 @@ class PlaceRetriever(PlaceScorer):
             collection_name=PLACES_COLLECTION,
             query=query_vec.tolist(),
             limit=limit,
-            with_payload=True,
+            with_payload=with_payload,
             query_filter=query_filter,
         )
         print(f"[INFO] search_text hits={len(response.points)}")
         return response.points
 
+    async def asearch_text(
+        self,
+        query: str,
+        limit: int = 5,
+        categories: list[CategoryType] = None,
+        has_image: bool = False,
+        with_payload: bool | list[str] = True,
+    ):
+        """search_text의 async 버전 (micro-batching encode + Qdrant batch query 경유)."""
+        print(f"[INFO] asearch_text (Semantic) start query='{query[:80]}' limit={limit} categories={categories} has_image={has_image}")
+        query_vec = await self._aencode_text(query)
+        query_filter = self._build_query_filter(categories, has_image)
+        points = await self._query_places_dense(query_vec, query_filter, limit, with_payload=with_payload)
+        print(f"[INFO] asearch_text hits={len(points)}")
+        return points
+
     def search_text_to_image(self, query: str, limit: int = 5, categories: list[CategoryType] = None):
         """
         Text-to-Image cross-modal search.
-        Uses CLIP Text Encoder to find images in 'img_vec_agg'.
+        Uses CLIP Text Encoder to find places by their aggregated photo vector ('img_vec_agg').
         """
         print(f"[INFO] search_text_to_image (Cross-modal) start query='{query[:80]}'")
         # Using CLIP to encode text for image matching
-        query_vec = self.vision_model.encode(query).astype(np.float32)
+        query_vec = self._encode_clip_text(query)
 
         query_filter = self._build_query_filter(categories)
 
         response = self.client.query_points(
             collection_name=PLACES_COLLECTION,
             query=query_vec.tolist(),
-            using="img_vec_agg",
+            using=PLACE_IMAGE_VECTOR_NAME,
             limit=limit,
             with_payload=True,
             query_filter=query_filter,
@@ -151,16 +627,12 @@ class PlaceRetriever(PlaceScorer):
         """
         print(f"[INFO] search_image (Visual) start image_url='{str(image_url)[:120]}'")
 
-        img = await asyncio.to_thread(download_image, image_url)
-        if img is None:
+        query_vec = await ImageLoader.get_instance().embedding(image_url, self._aencode_image)
+        if query_vec is None:
             return []
-
-        query_vec = await asyncio.to_thread(self.vision_model.encode, img)
-        query_vec = np.asarray(query_vec, dtype=np.float32)
         query_filter = self._build_query_filter(categories)
 
-        response = await asyncio.to_thread(
-            self.client.query_points_groups,
+        response = await self.aclient.query_points_groups(
             collection_name=PHOTOS_COLLECTION,
             query=query_vec.tolist(),
             group_by="contentid",
@@ -171,6 +643,130 @@ class PlaceRetriever(PlaceScorer):
         )
         return response.groups
 
+    # ------------------------------------------------------------------
+    # search_hybrid 채널 단위 조회 (Qdrant batch query 경유)
+    # ------------------------------------------------------------------
+
+    async def _query_points(self, collection_name: str, request: QueryRequest) -> list:
+        """
+        단건 QueryRequest를 collection별 batcher에 제출.
+        같은 시점에 제출된 채널/쿼리 요청은 query_batch_points 1회로 묶여 전송되고
+        응답은 요청 순서대로 분배된다.
+        """
+        batcher = self._query_batchers.get(collection_name)
+        if batcher is not None:
+            response = await batcher.submit(request)
+        else:
+            responses = await self.aclient.query_batch_points(
+                collection_name=collection_name,
+                requests=[request],
+            )
+            response = responses[0]
+        return response.points
+
+    async def _query_places_dense(
+        self,
+        vector: np.ndarray,
+        query_filter: Filter | None,
+        limit: int,
+        with_payload: bool | list[str] = FIRST_STAGE_WITH_PAYLOAD,
+    ) -> list:
+        """BGE-M3 dense 검색 — PLACES_COLLECTION (text_semantic / image_emotional 공용)."""
+        return await self._query_points(
+            PLACES_COLLECTION,
+            QueryRequest(query=vector.tolist(), filter=query_filter, limit=limit, with_payload=with_payload),
+        )
+
+    async def _query_places_sparse(self, query: str, query_filter: Filter | None, limit: int) -> list:
+        """Qdrant native sparse 검색 — PLACES_COLLECTION."""
+        sparse_indices, sparse_values = build_sparse_vector(query)
+        if not (sparse_indices and sparse_values):
+            return []
+        points = await self._query_points(
+            PLACES_COLLECTION,
+            QueryRequest(
+                query=SparseVector(indices=sparse_indices, values=sparse_values),
+                using="text_sparse",
+                filter=query_filter,
+                limit=limit,
+                with_payload=FIRST_STAGE_WITH_PAYLOAD,
+            ),
+        )
+        print(f"[INFO] qdrant_sparse hits={len(points)}")
+        return points
+
+    async def _query_places_image(self, vector: np.ndarray, query_filter: Filter | None, limit: int) -> list:
+        """CLIP text → 장소별 대표 이미지 벡터 검색 — PLACES_COLLECTION img_vec_agg (장소당 1 hit)."""
+        return await self._query_points(
+            PLACES_COLLECTION,
+            QueryRequest(
+                query=vector.tolist(),
+                using=PLACE_IMAGE_VECTOR_NAME,
+                filter=query_filter,
+                limit=limit,
+                with_payload=FIRST_STAGE_WITH_PAYLOAD,
+            ),
+        )
+
+    async def _query_photos_dense(self, vector: np.ndarray, query_filter: Filter | None, limit: int) -> list:
+        """CLIP 벡터 검색 — PHOTOS_COLLECTION (text_to_image / image_visual 공용, geo 없음)."""
+        return await self._query_points(
+            PHOTOS_COLLECTION,
+            QueryRequest(query=vector.tolist(), filter=query_filter, limit=limit, with_payload=FIRST_STAGE_WITH_PAYLOAD),
+        )
+
+    async def _query_photos_image(self, image_url: str, query_filter: Filter | None, limit: int) -> list:
+        """
+        CLIP vision 유사 이미지 검색 — 다운로드 → encode → PHOTOS_COLLECTION.
+        다운로드 / decode / embedding은 describe_image 및 이전 턴과 ImageLoader 캐시로 공유.
+        """
+        img_emb = await ImageLoader.get_instance().embedding(image_url, self._aencode_image)
+        if img_emb is None:
+            return []
+        return await self._query_photos_dense(img_emb, query_filter, limit)
+
+    async def _describe_image_with_deadline(self, image_url: str) -> str | None:
+        """
+        describe_image를 IMAGE_DESCRIPTION_DEADLINE_S까지만 대기. 넘기면 None.
+        LLM 호출 자체는 취소하지 않고 백그라운드에서 끝내 영속 설명 캐시에 저장 → 다음 턴 재사용.
+        """
+        task = asyncio.ensure_future(describe_image(image_url))
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout=IMAGE_DESCRIPTION_DEADLINE_S)
+        except asyncio.TimeoutError:
+            print(f"[WARN] describe_image exceeded {IMAGE_DESCRIPTION_DEADLINE_S:.1f}s deadline, dropped for this turn")
+            return None
+        finally:
+            if not task.done():
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+
+    async def _encode_query_batch(
+        self,
+        text_queries: list[str],
+        clip_queries: list[str],
+    ) -> tuple[dict[str, np.ndarray], dict[str, np.ndarray]]:
+        """
+        text 채널 공용 query 임베딩을 채널 실행 전에 모델별 batch 1회로 계산. (query → 임베딩)
+        → 이후 text 채널들의 QueryRequest가 같은 시점에 제출되어 batch query 1회로 묶임.
+        encode 실패 시 해당 모델 채널만 생략 (빈 dict 반환).
+        """
+        async def encode(encode_fn, queries):
+            return await encode_fn(queries) if queries else []
+
+        text_vecs, clip_vecs = await asyncio.gather(
+            encode(self._aencode_texts, text_queries),
+            encode(self._aencode_clip_texts, clip_queries),
+            return_exceptions=True,
+        )
+        if isinstance(text_vecs, Exception):
+            print(f"[WARN] text encode failed: {text_vecs}")
+            text_vecs = []
+        if isinstance(clip_vecs, Exception):
+            print(f"[WARN] clip text encode failed: {clip_vecs}")
+            clip_vecs = []
+        return dict(zip(text_queries, text_vecs)), dict(zip(clip_queries, clip_vecs))
+
     async def search_hybrid(
         self,
         query: str,
@@ -194,16 +790,269 @@ class PlaceRetriever(PlaceScorer):
         Refined Hybrid search combining Text (BGE-M3) and Image (CLIP-L) with Place-ID Fusion.
         1. Text Input -> BGE-M3 (Text DB) + CLIP Text (Image DB)
         2. Image Input -> CLIP Vision (Image DB) + Emotional Extraction (Text DB)
+        모든 채널은 ChannelRunner로 동시 실행되며, 채널별 timeout 초과 시 해당 채널만 제외된다.
         """
-        scope = (search_scope or "auto").strip().lower()
-        if scope not in {"auto", "place_only", "photo_only"}:
-            scope = "auto"
-        print(
-            f"[INFO] search_hybrid start query='{query[:80]}' has_image={'yes' if image_url else 'no'} "
-            f"scope={scope}"
+        request = HybridSearchRequest(
+            query=query,
+            image_url=image_url,
+            limit=limit,
+            categories=categories,
+            emotional_text=emotional_text,
+            user_latitude=user_latitude,
+            user_longitude=user_longitude,
+            preferred_location=preferred_location,
+            candidate_k=candidate_k,
+            enable_bm25=enable_bm25,
+            enable_rerank=enable_rerank,
+            rerank_top_k=rerank_top_k,
+            search_scope=search_scope,
+            location_anchor_lat=location_anchor_lat,
+            location_anchor_lon=location_anchor_lon,
+            location_radius_m=location_radius_m,
         )
+        result = (await self._run_hybrid_requests([request]))[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
 
+    async def search_hybrid_many(self, requests: list[HybridSearchRequest]) -> list[list[dict]]:
+        """
+        여러 search_hybrid 요청을 한 번에 처리. (TRIP_PLANNING 일정 항목 일괄 검색)
+        - 모든 query를 모델별(BGE-M3 / CLIP text) batch encode 1회로 처리
+        - 요청별 first stage(채널 검색 + fusion)는 동시 실행
+        - 전체 (query, 후보) 쌍을 CrossEncoder.predict 1회로 rerank
+        반환: requests 순서대로 search_hybrid와 같은 형태의 결과 리스트. 실패한 항목은 [].
+        """
+        outputs = await self._run_hybrid_requests(requests)
+        results = []
+        for request, output in zip(requests, outputs):
+            if isinstance(output, Exception):
+                print(f"[WARN] search_hybrid_many item failed query='{(request.query or '')[:80]}': {output}")
+                output = []
+            results.append(output)
+        return results
+
+    async def _run_hybrid_requests(self, requests: list[HybridSearchRequest]) -> list:
+        """
+        search_hybrid / search_hybrid_many 공용 실행부. 실패한 요청은 Exception 객체로 반환.
+        결과 캐시(exact → semantic 순) hit인 요청은 검색 없이 반환하고, miss만 모아 실행한다.
+        """
+        if not requests:
+            return []
         defaults = get_retrieval_params()
+        scopes = [_normalize_search_scope(r.search_scope) for r in requests]
+
+        keys: list[str | None] = [None] * len(requests)
+        outputs: list = [None] * len(requests)
+        if self.search_cache is not None:
+            keys = [
+                build_search_key(request, scope, defaults, SEARCH_CACHE_GRID_DEG)
+                for request, scope in zip(requests, scopes)
+            ]
+            outputs = [self.search_cache.get(key) for key in keys]
+        pending = [idx for idx, output in enumerate(outputs) if output is None]
+        if len(pending) < len(requests):
+            print(
+                f"[INFO] search_hybrid cache hit {len(requests) - len(pending)}/{len(requests)} "
+                f"search_cache={self.search_cache.stats()}"
+            )
+        if not pending:
+            return outputs
+
+        semantic_keys = await self._semantic_cache_keys(requests, scopes, defaults, pending)
+        for idx, (vector, signature) in semantic_keys.items():
+            hit = self.semantic_cache.lookup(vector, signature)
+            if hit is None:
+                continue
+            outputs[idx] = hit["results"]
+            print(
+                f"[INFO] search_hybrid semantic cache hit query='{requests[idx].query[:80]}' "
+                f"~ '{hit['query'][:80]}' sim={hit['similarity']:.3f}"
+            )
+            self._maybe_audit_semantic_hit(requests[idx], scopes[idx], defaults, hit["results"])
+        pending = [idx for idx in pending if outputs[idx] is None]
+        if not pending:
+            return outputs
+
+        started = time.perf_counter()
+        partial: set[int] = set()
+        computed = await self._execute_hybrid_requests(
+            [requests[idx] for idx in pending],
+            [scopes[idx] for idx in pending],
+            defaults,
+            partial=partial,
+        )
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        for pos, (idx, output) in enumerate(zip(pending, computed)):
+            outputs[idx] = output
+            # 실패 / 빈 결과 / 채널 timeout·오류 / 이미지 설명 deadline 초과 결과는 캐싱하지 않음
+            if not output or isinstance(output, Exception) or pos in partial:
+                continue
+            if self.search_cache is not None:
+                self.search_cache.put(keys[idx], output, elapsed_ms)
+            if idx in semantic_keys:
+                vector, signature = semantic_keys[idx]
+                self.semantic_cache.put(vector, signature, requests[idx].query, output)
+        return outputs
+
+    async def _semantic_cache_keys(
+        self,
+        requests: list[HybridSearchRequest],
+        scopes: list[str],
+        defaults: dict,
+        pending: list[int],
+    ) -> dict[int, tuple[np.ndarray, str]]:
+        """
+        semantic cache 대상 요청의 (query 임베딩, 필터 서명).
+        텍스트 query만 있는 places 검색만 대상 (이미지 query는 임베딩 유사도로 동일성 판단 불가).
+        임베딩은 EmbeddingCache에 남으므로 miss 후 실제 검색에서 재계산하지 않는다.
+        """
+        if self.semantic_cache is None:
+            return {}
+        eligible = [
+            idx for idx in pending
+            if (requests[idx].query or "").strip()
+            and not requests[idx].image_url
+            and scopes[idx] in {"auto", "place_only"}
+        ]
+        if not eligible:
+            return {}
+        try:
+            vectors = await self._aencode_texts([requests[idx].query for idx in eligible])
+        except Exception as e:
+            print(f"[WARN] semantic cache encode failed: {e}")
+            return {}
+        return {
+            # 서명 = query를 뺀 나머지 요청 필드 (categories / anchor / 좌표 / 옵션)
+            idx: (vec, build_search_key(replace(requests[idx], query=""), scopes[idx], defaults, SEARCH_CACHE_GRID_DEG))
+            for idx, vec in zip(eligible, vectors)
+        }
+
+    def _maybe_audit_semantic_hit(
+        self,
+        request: HybridSearchRequest,
+        scope: str,
+        defaults: dict,
+        cached: list[dict],
+    ) -> None:
+        """SEMANTIC_CACHE_AUDIT_RATE 비율로 hit를 background 전체 검색과 비교해 품질 guard rail에 기록."""
+        if random.random() >= SEMANTIC_CACHE_AUDIT_RATE:
+            return
+
+        async def audit():
+            fresh = (await self._execute_hybrid_requests([request], [scope], defaults))[0]
+            if isinstance(fresh, Exception):
+                return
+            score = self.semantic_cache.record_audit(
+                [str(item.get("id")) for item in cached],
+                [str(item.get("id")) for item in fresh],
+                k=request.limit,
+            )
+            print(f"[DEBUG] semantic cache audit query='{request.query[:80]}' ndcg@{request.limit}={score:.3f}")
+
+        task = asyncio.create_task(audit())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _execute_hybrid_requests(
+        self,
+        requests: list[HybridSearchRequest],
+        scopes: list[str],
+        defaults: dict,
+        partial: set[int] | None = None,
+    ) -> list:
+        """
+        캐시 miss 요청 실제 검색: batch encode → 요청별 first stage 동시 실행 → rerank 1회.
+        partial이 주어지면 채널 timeout·오류 / 이미지 설명 없이 융합된 요청 index를 담는다. (결과 캐시 제외용)
+        """
+        # --- 0. Query encode (전체 요청 공용, 모델별 batch 1회) ---
+        text_queries, clip_queries = [], []
+        for request, scope in zip(requests, scopes):
+            if not (request.query and request.query.strip()):
+                continue
+            if scope in {"auto", "place_only"}:
+                text_queries.append(request.query)
+            if scope in {"auto", "photo_only"}:
+                clip_queries.append(request.query)
+        text_vecs, clip_vecs = await self._encode_query_batch(
+            list(dict.fromkeys(text_queries)),
+            list(dict.fromkeys(clip_queries)),
+        )
+
+        stages = await asyncio.gather(
+            *(
+                self._search_first_stage(
+                    request,
+                    scope,
+                    defaults,
+                    text_emb=text_vecs.get(request.query),
+                    clip_text_emb=clip_vecs.get(request.query),
+                )
+                for request, scope in zip(requests, scopes)
+            ),
+            return_exceptions=True,
+        )
+
+        # --- D. Rerank (전체 요청의 후보를 predict 1회로) ---
+        outputs: list = list(stages)
+        jobs, job_indices = [], []
+        for idx, (request, stage) in enumerate(zip(requests, stages)):
+            if isinstance(stage, Exception):
+                continue
+            if partial is not None and (stage.description_dropped or stage.degraded):
+                partial.add(idx)
+            if request.enable_rerank:
+                # 이미지 전용 검색(query="")일 때 emotional_text를 fallback으로 사용.
+                # 둘 다 없으면 _rerank_candidates_many 내부에서 rerank를 스킵하고 score 순 유지.
+                rerank_query = (request.query or "").strip() or (stage.emotional_text or "").strip()
+                jobs.append((rerank_query, stage.candidates, stage.rerank_top_k))
+                job_indices.append(idx)
+            else:
+                outputs[idx] = self._keep_first_stage_order(stage.candidates, stage.rerank_top_k)
+        for idx, reranked in zip(job_indices, await self._rerank_candidates_many(jobs)):
+            outputs[idx] = reranked
+
+        for idx, (request, stage) in enumerate(zip(requests, stages)):
+            if isinstance(stage, Exception):
+                continue
+            reranked = outputs[idx]
+            # 기존 인터페이스 호환: limit 기준으로 반환
+            outputs[idx] = reranked[: max(int(request.limit or 0), 1)]
+            print(
+                f"[INFO] search_hybrid returning {len(outputs[idx])} candidates "
+                f"(score_map={stage.pool_size} reranked={len(reranked)}) "
+                f"embedding_cache={self.embedding_cache.stats()} place_features={self.place_features.stats()}"
+            )
+
+        # --- E. 최종 결과만 전체 payload로 보강 ---
+        await self._hydrate_final_results(outputs)
+        return outputs
+
+    async def _search_first_stage(
+        self,
+        request: HybridSearchRequest,
+        scope: str,
+        defaults: dict,
+        text_emb: np.ndarray | None,
+        clip_text_emb: np.ndarray | None,
+    ) -> _FirstStage:
+        """요청 1건의 채널 검색 + RRF fusion/boost. query 임베딩은 호출자가 미리 계산해서 전달."""
+        query = request.query
+        image_url = request.image_url
+        limit = request.limit
+        categories = request.categories
+        emotional_text = request.emotional_text
+        user_latitude = request.user_latitude
+        user_longitude = request.user_longitude
+        preferred_location = request.preferred_location
+        enable_bm25 = request.enable_bm25
+        location_anchor_lat = request.location_anchor_lat
+        location_anchor_lon = request.location_anchor_lon
+        location_radius_m = request.location_radius_m
+        print(
+            f"[INFO] search_hybrid start query='{(query or '')[:80]}' has_image={'yes' if image_url else 'no'} "
+            f"scope={scope}"
+        )
 
         # geo filter는 PLACES_COLLECTION 전용. PHOTOS_COLLECTION에는 geo 필드가 없으므로 분리.
         apply_geo = (
@@ -212,210 +1061,260 @@ class PlaceRetriever(PlaceScorer):
             and location_anchor_lon is not None
             and location_radius_m is not None
         )
-        places_filter = self._build_query_filter(
-            categories,
-            anchor_lat=location_anchor_lat if apply_geo else None,
-            anchor_lon=location_anchor_lon if apply_geo else None,
-            radius_m=location_radius_m if apply_geo else None,
-        )
+        # geo 반경 단계: anchor가 있으면 [r, 2r, 시 단위, geo 없음]을 한 번에 조회 (재검색 없음)
+        radii = _geo_radius_ladder(location_radius_m) if apply_geo else [None]
+        places_filters = [
+            self._build_query_filter(
+                categories,
+                anchor_lat=location_anchor_lat if radius_m is not None else None,
+                anchor_lon=location_anchor_lon if radius_m is not None else None,
+                radius_m=radius_m,
+            )
+            for radius_m in radii
+        ]
         photos_filter = self._build_query_filter(categories)  # geo 없이 category만
 
-        candidate_k = max(int(candidate_k or defaults["candidate_k"]), int(limit or 0), 1)
+        def rung_name(name: str, rung: int) -> str:
+            """geo filter 채널의 단계별 채널명. 단계가 1개면 기존 채널명 그대로."""
+            return name if len(radii) == 1 or name not in GEO_LADDER_CHANNELS else f"{name}@{rung}"
+
+        candidate_k = max(int(request.candidate_k or defaults["candidate_k"]), int(limit or 0), 1)
         rerank_top_k = min(
-            max(int(rerank_top_k or defaults["top_k"]), int(limit or 0), 1),
+            max(int(request.rerank_top_k or defaults["top_k"]), int(limit or 0), 1),
             min(defaults["rerank_max_k"], candidate_k),
         )
         # 채널별 Qdrant fetch 상한. *5는 과도 → *CANDIDATE_LIMIT_MULTIPLIER(기본 3)으로 축소.
         # 채널 수(최대 4)를 감안해도 candidate_k*3이면 RRF 융합에 충분한 pool 확보 가능.
         candidates_limit = max(candidate_k * CANDIDATE_LIMIT_MULTIPLIER, 20)
-        score_map = {}  # place_id -> {score, payload, matches}
-        place_vector_points = []
-        rrf_k = 60
+        pool = CandidatePool(rrf_k=60)  # place_id -> RRF 점수 / payload / matches (columnar)
 
         def collect_hits(hits, weight, match_type, source_collection):
-            for rank, h in enumerate(hits, start=1):
-                pid = _extract_place_id(h, source_collection)
-                if pid is None:
-                    continue
-
-                if pid not in score_map:
-                    score_map[pid] = {"score": 0.0, "payload": h.payload or {}, "matches": set()}
-                elif source_collection == PLACES_COLLECTION and h.payload:
-                    # photos 채널 payload보다 places payload를 우선 사용
-                    score_map[pid]["payload"] = h.payload
-
-                # 채널 간 점수 분포 차이를 줄이기 위해 RRF로 rank 기반 결합
-                score_map[pid]["score"] += weight * (1.0 / (rrf_k + rank))
-                score_map[pid]["matches"].add(match_type)
-
-        # --- A. Text Search Channel ---
-        if query and query.strip() and scope in {"auto", "place_only"}:
-            # 1. Scenario: Semantic Text Search (BGE-M3) — PLACES_COLLECTION (geo filter 적용)
-            text_emb = await asyncio.to_thread(self.text_model.encode, query)
-            text_emb = np.asarray(text_emb, dtype=np.float32)
-            t_t_resp = await asyncio.to_thread(
-                self.client.query_points,
-                collection_name=PLACES_COLLECTION,
-                query=text_emb.tolist(),
-                limit=candidates_limit,
-                with_payload=True,
-                query_filter=places_filter,
+            ids = [_extract_place_id(h, source_collection) for h in hits]
+            payloads = [h.payload for h in hits]
+            # projection 미사용 시에만 places hit payload(전체)로 캐시 채움
+            if source_collection == PLACES_COLLECTION and FIRST_STAGE_WITH_PAYLOAD is True and self.place_payloads is not None:
+                self.place_payloads.put_many(zip(ids, payloads))
+            pool.add_ranked(
+                ids,
+                payloads,
+                weight,
+                match_type,
+                # photos 채널 payload보다 places payload를 우선 사용
+                payload_mode="replace" if source_collection == PLACES_COLLECTION else "keep",
             )
-            place_vector_points.extend(t_t_resp.points)
-            print(f"[INFO] text_semantic hits={len(t_t_resp.points)} (filter={'yes' if places_filter else 'no'} geo={apply_geo})")
-            collect_hits(t_t_resp.points, 1.0, "text_semantic", PLACES_COLLECTION)
 
-        if ENABLE_QDRANT_SPARSE and query and query.strip() and scope in {"auto", "place_only"}:
-            try:
-                sparse_indices, sparse_values = build_sparse_vector(query)
-                if sparse_indices and sparse_values:
-                    sparse_resp = await asyncio.to_thread(
-                        self.client.query_points,
-                        collection_name=PLACES_COLLECTION,
-                        query=SparseVector(indices=sparse_indices, values=sparse_values),
-                        using="text_sparse",
-                        limit=candidates_limit,
-                        with_payload=True,
-                        query_filter=places_filter,  # geo filter 적용
-                    )
-                    place_vector_points.extend(sparse_resp.points)
-                    collect_hits(sparse_resp.points, 0.85, "qdrant_sparse", PLACES_COLLECTION)
-                    print(f"[INFO] qdrant_sparse hits={len(sparse_resp.points)}")
-            except Exception as e:
-                print(f"[WARN] qdrant sparse channel failed: {e}")
-
-        if query and query.strip() and scope in {"auto", "photo_only"}:
-            # 2. Scenario: Cross-modal Text-to-Image (CLIP Text) — PHOTOS_COLLECTION (geo 없음)
-            clip_text_emb = await asyncio.to_thread(self.vision_model.encode, query)
-            clip_text_emb = np.asarray(clip_text_emb, dtype=np.float32)
-            t_i_resp = await asyncio.to_thread(
-                self.client.query_points,
-                collection_name=PHOTOS_COLLECTION,
-                query=clip_text_emb.tolist(),
-                limit=candidates_limit,
-                with_payload=True,
-                query_filter=photos_filter,  # PHOTOS에는 geo 필드 없으므로 category만
-            )
-            collect_hits(t_i_resp.points, 0.5, "text_to_image", PHOTOS_COLLECTION)
+        has_query = bool(query and query.strip())
+        resolved = {"emotional_text": emotional_text}
 
-        # --- B. Image Search Channel ---
+        # --- 채널 동시 실행 ---
+        # 모든 채널을 한 번에 띄우고 채널별 timeout 적용. 병합은 아래 고정 순서로 수행.
+        # 같은 시점에 제출된 Qdrant 요청은 collection별 query_batch_points 1회로 전송됨.
+        runner = ChannelRunner(default_timeout_s=CHANNEL_TIMEOUT_S)
+
+        # --- B. Image Search Channel (다운로드/LLM 설명이 느리므로 text encode보다 먼저 시작) ---
         if image_url and scope in {"auto", "photo_only"}:
-            img = await asyncio.to_thread(download_image, image_url)
-            if img:
-                # 3. Scenario: Visual Similarity (CLIP Vision) — PHOTOS_COLLECTION (geo 없음)
-                img_emb = await asyncio.to_thread(self.vision_model.encode, img)
-                img_emb = np.asarray(img_emb, dtype=np.float32)
-                i_i_resp = await asyncio.to_thread(
-                    self.client.query_points,
-                    collection_name=PHOTOS_COLLECTION,
-                    query=img_emb.tolist(),
-                    limit=candidates_limit,
-                    with_payload=True,
-                    query_filter=photos_filter,  # geo 없음
-                )
-                collect_hits(i_i_resp.points, 1.0, "image_visual", PHOTOS_COLLECTION)
+            # 3. Scenario: Visual Similarity (CLIP Vision) — PHOTOS_COLLECTION (geo 없음)
+            runner.launch(
+                "image_visual",
+                lambda: self._query_photos_image(image_url, photos_filter, candidates_limit),
+            )
 
+        # 이미지 설명(vision LLM, 수 초)은 image_emotional 채널 / query 없는 rerank에만 필요.
+        # CLIP / text 채널과 같은 시점에 시작하고 deadline을 넘기면 이번 턴에서는 버린다.
+        description = None
+        if image_url and not resolved["emotional_text"] and (
+            scope == "auto" or (not has_query and request.enable_rerank)
+        ):
+            description = asyncio.ensure_future(self._describe_image_with_deadline(image_url))
+
+        emotional_embedding = None
         if image_url and scope == "auto":
             # 4. Scenario: Emotional Enrichment (GPT-4o-mini -> BGE-M3) — PLACES_COLLECTION (geo filter 적용)
-            if not emotional_text:
-                emotional_text = await describe_image(image_url)
-
-            if emotional_text:
-                emo_emb = await asyncio.to_thread(self.text_model.encode, emotional_text)
-                emo_emb = np.asarray(emo_emb, dtype=np.float32)
-                i_e_resp = await asyncio.to_thread(
-                    self.client.query_points,
-                    collection_name=PLACES_COLLECTION,
-                    query=emo_emb.tolist(),
-                    limit=candidates_limit,
-                    with_payload=True,
-                    query_filter=places_filter,  # geo filter 적용
+            # 이미지 설명 + encode는 1회만 수행하고 반경 단계별 채널이 공유
+            async def resolve_emotional_embedding():
+                if description is not None:
+                    resolved["emotional_text"] = await asyncio.shield(description)
+                if not resolved["emotional_text"]:
+                    return None
+                return await self._aencode_text(resolved["emotional_text"])
+
+            emotional_embedding = asyncio.ensure_future(resolve_emotional_embedding())
+
+        for rung, places_filter in enumerate(places_filters):
+            if emotional_embedding is not None:
+                async def image_emotional_channel(places_filter=places_filter):
+                    emo_emb = await asyncio.shield(emotional_embedding)
+                    if emo_emb is None:
+                        return []
+                    return await self._query_places_dense(emo_emb, places_filter, candidates_limit)
+
+                runner.launch(
+                    rung_name("image_emotional", rung),
+                    image_emotional_channel,
+                    timeout_s=IMAGE_EMOTIONAL_CHANNEL_TIMEOUT_S,
                 )
-                place_vector_points.extend(i_e_resp.points)
-                collect_hits(i_e_resp.points, 0.8, "image_emotional", PLACES_COLLECTION)
 
-        if enable_bm25 and query and query.strip() and scope in {"auto", "place_only"}:
-            try:
-                unique_points = {}
-                for point in place_vector_points:
-                    pid = point.id
-                    if pid is None:
-                        continue
-                    unique_points[pid] = point
-
-                point_pool = list(unique_points.values())
-                top_vector_score = 0.0
-                if point_pool:
-                    try:
-                        top_vector_score = max(float(getattr(p, "score", 0.0) or 0.0) for p in point_pool)
-                    except Exception:
-                        top_vector_score = 0.0
-
-                bm25_needed = (
-                    len(point_pool) < BM25_ENABLE_THRESHOLD
-                    or top_vector_score < BM25_ENABLE_SCORE_THRESHOLD
+            # --- A. Text Search Channel ---
+            if text_emb is not None:
+                # 1. Scenario: Semantic Text Search (BGE-M3) — PLACES_COLLECTION (geo filter 적용)
+                runner.launch(
+                    rung_name("text_semantic", rung),
+                    lambda places_filter=places_filter: self._query_places_dense(text_emb, places_filter, candidates_limit),
                 )
 
-                if bm25_needed and point_pool:
+            if ENABLE_QDRANT_SPARSE and has_query and scope in {"auto", "place_only"}:
+                runner.launch(
+                    rung_name("qdrant_sparse", rung),
+                    # geo filter 적용
+                    lambda places_filter=places_filter: self._query_places_sparse(query, places_filter, candidates_limit),
+                )
+
+            if enable_bm25 and has_query and scope in {"auto", "place_only"} and self.lexical_index is not None:
+                # 코퍼스 역색인 BM25: 벡터 채널과 무관한 독립 채널 (벡터가 놓친 정확한 장소명도 회수)
+                radius_m = radii[rung]
+                runner.launch(
+                    rung_name("bm25_lexical", rung),
+                    lambda radius_m=radius_m: self._search_lexical_index(
+                        query=query,
+                        categories=categories,
+                        limit=candidate_k,
+                        anchor_lat=location_anchor_lat if radius_m is not None else None,
+                        anchor_lon=location_anchor_lon if radius_m is not None else None,
+                        radius_m=radius_m,
+                    ),
+                )
+            elif enable_bm25 and has_query and scope in {"auto", "place_only"}:
+                # 역색인 미사용 시: PLACES 벡터 채널 pool 재채점 → 해당 채널만 기다린 뒤 실행 (PHOTOS 채널은 대기 안 함)
+                deps_names = {rung_name(name, rung): name for name in PLACE_VECTOR_CHANNELS}
+
+                async def bm25_channel(deps, deps_names=deps_names):
+                    unique_points = {}
+                    for dep_name in deps_names:
+                        for point in deps[dep_name].points if dep_name in deps else []:
+                            pid = point.id
+                            if pid is None:
+                                continue
+                            unique_points[pid] = point
+
+                    point_pool = list(unique_points.values())
+                    top_vector_score = 0.0
+                    if point_pool:
+                        try:
+                            top_vector_score = max(float(getattr(p, "score", 0.0) or 0.0) for p in point_pool)
+                        except Exception:
+                            top_vector_score = 0.0
+
+                    bm25_needed = (
+                        len(point_pool) < BM25_ENABLE_THRESHOLD
+                        or top_vector_score < BM25_ENABLE_SCORE_THRESHOLD
+                    )
+                    if not (bm25_needed and point_pool):
+                        print(
+                            f"[INFO] bm25 skipped vector_pool={len(point_pool)} "
+                            f"top_vector_score={top_vector_score:.4f}"
+                        )
+                        return []
+
                     # BM25는 벡터 pool 재채점이므로 반환 상한은 candidate_k에 맞춤. (#10)
                     # candidates_limit(채널 fetch 상한)이 아닌 실제 필요 후보 수 사용.
-                    lexical_hits = await self._search_bm25_lexical(
+                    return await self._search_bm25_lexical(
                         query=query,
                         categories=categories,
                         candidate_points=point_pool,
                         candidate_k=candidate_k,
                         pool_limit=BM25_POOL_LIMIT,
                     )
-                    for rank, item in enumerate(lexical_hits, start=1):
-                        pid = _to_positive_int(item.get("id"))
-                        if pid is None:
-                            continue
-                        payload = item.get("payload") or {}
-                        if pid not in score_map:
-                            score_map[pid] = {"score": 0.0, "payload": payload, "matches": set()}
-                        elif payload and not score_map[pid].get("payload"):
-                            score_map[pid]["payload"] = payload
-                        score_map[pid]["score"] += 0.7 * (1.0 / (rrf_k + rank))
-                        score_map[pid]["matches"].add("bm25_lexical")
-                else:
-                    print(
-                        f"[INFO] bm25 skipped vector_pool={len(point_pool)} "
-                        f"top_vector_score={top_vector_score:.4f}"
-                    )
-            except Exception as e:
-                print(f"[WARN] bm25 lexical channel failed: {e}")
 
-        # --- geo filter 0결과 fallback ---
-        # geo filter 적용 후 후보가 하나도 없으면 geo 없이 재시도
-        if apply_geo and not score_map:
+                runner.launch(
+                    rung_name("bm25_lexical", rung),
+                    bm25_channel,
+                    after=[name for name in deps_names if runner.launched(name)],
+                )
+
+        if clip_text_emb is not None and self.text_to_image_collection == PLACES_COLLECTION:
+            # 2. Scenario: Cross-modal Text-to-Image (CLIP Text) — places.img_vec_agg (geo 없음 → 단계와 무관하게 1회)
+            # 장소당 1 hit이므로 사진 중복 제거분을 감안한 확대 fetch 불필요 → candidate_k
+            runner.launch(
+                "text_to_image",
+                lambda: self._query_places_image(clip_text_emb, photos_filter, candidate_k),
+            )
+        elif clip_text_emb is not None:
+            # 2. Scenario: Cross-modal Text-to-Image (CLIP Text) — PHOTOS_COLLECTION (geo 없음 → 단계와 무관하게 1회)
+            runner.launch(
+                "text_to_image",
+                lambda: self._query_photos_dense(clip_text_emb, photos_filter, candidates_limit),
+            )
+
+        channel_results = await runner.gather()
+        # geo 반경 단계 선택도 전체 채널 결과에 의존 → 어느 채널이든 빠지면 degraded
+        degraded = any(result.status != "ok" for result in channel_results.values())
+        if emotional_embedding is not None and not emotional_embedding.done():
+            # 모든 image_emotional 채널이 timeout → 공유 이미지 설명 작업도 중단
+            emotional_embedding.cancel()
+        if description is not None:
+            if has_query and not description.done():
+                # 융합은 설명을 더 기다리지 않음 (image_emotional 채널이 먼저 timeout / 실패한 경우)
+                description.cancel()
+            else:
+                # query 없는 이미지 검색은 설명이 rerank query → deadline까지만 대기
+                resolved["emotional_text"] = await description
+        emotional_text = resolved["emotional_text"]
+
+        # --- geo 반경 단계 선택 ---
+        # geo filter 채널(places) 후보가 충분한 첫 단계 사용. 모두 부족하면 후보가 가장 많은 단계.
+        rung = 0
+        if len(radii) > 1:
+            def rung_candidate_count(i: int) -> int:
+                pids = set()
+                for name in PLACE_VECTOR_CHANNELS:
+                    result = channel_results.get(rung_name(name, i))
+                    pids.update(_extract_place_id(h, PLACES_COLLECTION) for h in (result.points if result else []))
+                result = channel_results.get(rung_name("bm25_lexical", i))
+                pids.update(_to_positive_int(item.get("id")) for item in (result.points if result else []))
+                pids.discard(None)
+                return len(pids)
+
+            needed = max(1, min(GEO_LADDER_MIN_CANDIDATES, int(limit or 0)))
+            counts = [rung_candidate_count(i) for i in range(len(radii))]
+            rung = next((i for i, count in enumerate(counts) if count >= needed), counts.index(max(counts)))
             print(
-                f"[INFO] search_hybrid: geo filter returned 0 candidates "
-                f"(lat={location_anchor_lat} lon={location_anchor_lon} r={location_radius_m}), "
-                f"retrying without geo filter"
+                f"[INFO] search_hybrid geo ladder (lat={location_anchor_lat} lon={location_anchor_lon}) "
+                f"radii={radii} candidates={counts} needed={needed} -> radius={radii[rung]}"
             )
-            return await self.search_hybrid(
-                query=query,
-                image_url=image_url,
-                limit=limit,
-                categories=categories,
-                emotional_text=emotional_text,
-                user_latitude=user_latitude,
-                user_longitude=user_longitude,
-                preferred_location=preferred_location,
-                candidate_k=candidate_k,
-                enable_bm25=enable_bm25,
-                enable_rerank=enable_rerank,
-                rerank_top_k=rerank_top_k,
-                search_scope=search_scope,
-                # anchor None → 재귀 방지
-                location_anchor_lat=None,
-                location_anchor_lon=None,
-                location_radius_m=None,
+            channel_names = [name for name, _, _ in VECTOR_CHANNEL_SPECS] + ["bm25_lexical"]
+            channel_results = {
+                name: channel_results[rung_name(name, rung)]
+                for name in channel_names
+                if rung_name(name, rung) in channel_results
+            }
+        places_filter = places_filters[rung]
+        apply_geo = radii[rung] is not None
+
+        # 결정론 병합: 채널 완료 순서와 무관하게 기존 채널 순서대로 RRF 누적
+        for name, weight, source_collection in VECTOR_CHANNEL_SPECS:
+            if name not in channel_results:
+                continue
+            if name == "text_to_image":
+                source_collection = self.text_to_image_collection
+            hits = channel_results[name].points
+            if name == "text_semantic":
+                print(f"[INFO] text_semantic hits={len(hits)} (filter={'yes' if places_filter else 'no'} geo={apply_geo})")
+            collect_hits(hits, weight, name, source_collection)
+
+        if "bm25_lexical" in channel_results:
+            items = channel_results["bm25_lexical"].points
+            pool.add_ranked(
+                (_to_positive_int(item.get("id")) for item in items),
+                (item.get("payload") for item in items),
+                0.7,
+                "bm25_lexical",
+                payload_mode="fill",
             )
 
+        # photos 채널로만 회수된 후보(경량 payload) → places payload로 교체
+        await self._hydrate_place_payloads(pool)
+
         # --- C. Fusion & Boosting ---
-        results = []
-        fused = []
         query_addr_tokens = self._extract_query_addr_tokens(query or "")
         # preferred_location은 _location_text_bonus가 전담 처리.
         # _addr_sparse_bonus는 query 원문 주소 토큰만 담당 → preferred_addr_tokens 불필요. (#11)
@@ -427,109 +1326,184 @@ class PlaceRetriever(PlaceScorer):
         # geo proximity boost anchor: 사용자 좌표 우선, 없으면 landmark anchor 사용
         prox_lat = user_latitude if user_latitude else location_anchor_lat
         prox_lon = user_longitude if user_longitude else location_anchor_lon
+        if prox_lat and prox_lon:
+            # geo proximity 좌표 보강에 쓰는 공간 색인도 컬렉션 변경을 따라가도록
+            self._maybe_refresh_spatial_index()
+
+        results = self._fuse_candidates(
+            pool,
+            query=query or "",
+            preferred_location=preferred_location,
+            query_addr_tokens=query_addr_tokens,
+            sparse_enabled=sparse_enabled,
+            anchor_lat=prox_lat,
+            anchor_lng=prox_lon,
+        )
 
-        for pid, data in score_map.items():
-            payload = data.get("payload") or {}
-            keyword_boost = self._keyword_match_bonus(query=query or "", payload=payload)
-            location_text_boost = self._location_text_bonus(preferred_location=preferred_location, payload=payload)
-            geo_proximity_boost = self._geo_proximity_bonus(
-                payload=payload,
-                anchor_lat=prox_lat,
-                anchor_lng=prox_lon,
-                radius_km=GEO_PROXIMITY_RADIUS_KM,  # config 기반 반경 (#9)
-            )
-            payload_addr_tokens = self._payload_addr_tokens(payload)
-            addr_sparse_boost = 0.0
-            if sparse_enabled:
-                addr_sparse_boost = self._addr_sparse_bonus(
-                    query_addr_tokens=query_addr_tokens,
-                    payload_addr_tokens=payload_addr_tokens,
-                )
-                if addr_sparse_boost > 0.0:
-                    data["matches"].add("addr_sparse")
-
-            boost = keyword_boost + location_text_boost + geo_proximity_boost + addr_sparse_boost
-            # BOOST_WEIGHT로 스케일 보정: RRF first_stage_score(0.01~0.05) 대비
-            # boost 합계(최대 0.65) 스케일 불균형 완화.
-            # 적용 후 boost 최대 기여 ≈ 0.65 * 0.3 = 0.195
-            fused.append(
-                (
-                    pid,
-                    data,
-                    float(data.get("score", 0.0)) + BOOST_WEIGHT * boost,
-                    {
-                        "keyword": keyword_boost,
-                        "location_text": location_text_boost,
-                        "geo_proximity": geo_proximity_boost,
-                        "addr_sparse": addr_sparse_boost,
-                        "total": boost,
-                    },
+        print(f"[INFO] fusion & boosting returning {len(results)} candidates")
+
+        return _FirstStage(
+            candidates=results[:candidate_k],
+            emotional_text=emotional_text,
+            description_dropped=description is not None and not emotional_text,
+            degraded=degraded,
+            rerank_top_k=min(rerank_top_k, candidate_k),
+            pool_size=len(pool),
+        )
+
+    async def _fetch_place_payloads(
+        self,
+        pids: list[int],
+        with_payload: bool | list[str] = True,
+    ) -> dict[int, dict]:
+        """
+        장소 payload 캐시에서 먼저 찾고, 없는 장소만 PLACES retrieve 1회로 가져온다.
+        캐시에는 전체 payload(with_payload=True)만 저장. 실패 시 찾은 것만 반환.
+        """
+        found = self.place_payloads.get_many(pids)
+        missing = [pid for pid in pids if pid not in found]
+        if missing:
+            try:
+                points = await self.aclient.retrieve(
+                    collection_name=PLACES_COLLECTION,
+                    ids=missing,
+                    with_payload=with_payload,
+                    with_vectors=False,
                 )
-            )
+            except Exception as e:
+                print(f"[WARN] place payload retrieve failed ids={len(missing)}: {e}")
+                points = []
+            fetched = [(_to_positive_int(p.id), p.payload or {}) for p in points]
+            if with_payload is True:
+                self.place_payloads.put_many(fetched)
+            found.update((pid, payload) for pid, payload in fetched if pid is not None and payload)
+        print(
+            f"[INFO] place payload hydration ids={len(pids)} cache_hits={len(pids) - len(missing)} "
+            f"retrieved={len(missing)} projected={'no' if with_payload is True else 'yes'}"
+        )
+        return found
 
-        fused.sort(key=lambda x: x[2], reverse=True)
-        for idx, (pid, data, final_score, boost_detail) in enumerate(fused, start=1):
-            results.append({
-                "id": pid,
-                # 모든 점수를 [0.0, 1.0] 범위로 정규화
-                "score":             round(min(1.0, final_score        / FUSED_SCORE_MAX), 4),
-                "first_stage_score": round(min(1.0, data["score"]      / RRF_SCORE_MAX),   4),
-                "first_stage_rank": idx,
-                "payload": data["payload"],
-                "match_types": sorted(list(data["matches"])),
-                "keyword_match_boost":  boost_detail["keyword"],
-                "location_text_boost":  boost_detail["location_text"],
-                "geo_proximity_boost":  boost_detail["geo_proximity"],
-                "addr_sparse_boost":    boost_detail["addr_sparse"],
-                "score_boost_total":    round(min(1.0, boost_detail["total"] / MAX_BOOST_SUM), 4),
-            })
+    async def _hydrate_place_payloads(self, pool: CandidatePool) -> None:
+        """
+        places payload가 없는 후보(photos 경량 payload / 빈 payload)를 장소 payload로 채운다.
+        fusion 단계이므로 캐시에 없는 장소는 first stage 필드만 조회. 실패 시 경량 payload 그대로 fusion.
+        """
+        if self.place_payloads is None:
+            return
+        rows = {pid: row for row, pid in enumerate(pool.ids) if not is_place_payload(pool.payloads[row])}
+        if not rows:
+            return
+        found = await self._fetch_place_payloads(list(rows), with_payload=FIRST_STAGE_WITH_PAYLOAD)
+        for pid, payload in found.items():
+            # 캐시 원본이 결과 후처리에서 수정되지 않도록 얕은 복사
+            pool.payloads[rows[pid]] = dict(payload)
+
+    async def _hydrate_final_results(self, outputs: list) -> None:
+        """
+        first stage projection payload → 최종 결과(요청별 limit개)만 전체 payload로 교체.
+        전체 요청의 결과 id를 모아 캐시 조회 + retrieve 1회.
+        """
+        if FIRST_STAGE_WITH_PAYLOAD is True or self.place_payloads is None:
+            return
+        results = [item for output in outputs if not isinstance(output, Exception) for item in output]
+        pids = list(dict.fromkeys(pid for pid in (_to_positive_int(item.get("id")) for item in results) if pid))
+        if not pids:
+            return
+        found = await self._fetch_place_payloads(pids)
+        if self.photo_url_index is not None:
+            # 색인 생성 이후 적재된 장소도 대표 사진 URL 반영
+            self.photo_url_index.update_from_payloads(found.items())
+        for item in results:
+            payload = found.get(_to_positive_int(item.get("id")))
+            if payload:
+                item["payload"] = dict(payload)
+
+    def _nearby_scan_params(
+        self, lat: float, lng: float, limit: int, radius_km: float, categories: list[CategoryType] | None = None,
+    ) -> tuple[Filter, Filter | None, int]:
+        """공간 색인이 없을 때 쓰는 scroll 방식의 (geo filter, fallback filter, scan_limit)."""
+        radius_m = max(float(radius_km), 0.1) * 1000.0
+        scan_limit = max(int(limit or 0) * 20, 50)
+        geo_filter = self._build_query_filter(categories, anchor_lat=float(lat), anchor_lon=float(lng), radius_m=radius_m)
+        return geo_filter, self._build_query_filter(categories), scan_limit
 
-        print(f"[INFO] fusion & boosting returning {len(results)} candidates")
+    def _rank_nearby(self, candidate_points: list, lat: float, lng: float, limit: int, radius_km: float) -> list[dict]:
+        results = []
+        for p in candidate_points:
+            payload = p.payload or {}
+            p_lat, p_lng = self._payload_coordinates(payload)
+            if p_lat is None or p_lng is None:
+                continue
 
-        first_stage_results = results[:candidate_k]
-        if enable_rerank:
-            # 이미지 전용 검색(query="")일 때 emotional_text를 fallback으로 사용.
-            # 둘 다 없으면 _rerank_candidates 내부에서 rerank를 스킵하고 score 순 유지.
-            rerank_query = (query or "").strip() or (emotional_text or "").strip()
-            reranked = await self._rerank_candidates(
-                query=rerank_query,
-                candidates=first_stage_results,
-                top_k=min(rerank_top_k, candidate_k)
-            )
-        else:
-            reranked = first_stage_results[: min(rerank_top_k, candidate_k)]
-            for idx, c in enumerate(reranked, start=1):
-                c["rerank_score"] = None
-                c["final_rank"] = idx
+            dist = self._haversine(float(lat), float(lng), p_lat, p_lng)
+            if dist <= radius_km:
+                results.append({
+                    "id": p.id,
+                    "payload": payload,
+                    "score": 1.0 / (dist + 0.1),
+                    "distance_km": dist,
+                })
 
-        # 기존 인터페이스 호환: limit 기준으로 반환
-        final = reranked[: max(int(limit or 0), 1)]
-        print(f"[INFO] search_hybrid returning {len(final)} candidates (score_map={len(score_map)} reranked={len(reranked)})")
-        return final
+        results.sort(key=lambda x: x["distance_km"])
+        trimmed = results[:limit]
+        print(f"[INFO] search_nearby matched={len(results)} returned={len(trimmed)}")
+        return trimmed
 
-    def search_nearby(self, lat: float, lng: float, limit: int = 5, radius_km: float = 10.0):
+    def _search_spatial_index(
+        self, lat: float, lng: float, limit: int, radius_km: float, categories: list[CategoryType] | None,
+    ) -> list[tuple[int, float]]:
+        hits = self.spatial_index.search(
+            float(lat), float(lng),
+            k=limit,
+            radius_km=radius_km,
+            categories=[c.value for c in (categories or [])],
+        )
+        print(f"[DEBUG] search_nearby spatial index hits={len(hits)} (indexed={len(self.spatial_index)})")
+        return hits
+
+    @staticmethod
+    def _format_nearby_hits(hits: list[tuple[int, float]], points: list) -> list[dict]:
+        """공간 색인 결과(거리순) + retrieve payload → _rank_nearby와 같은 결과 형식."""
+        payloads = {_to_positive_int(p.id): p.payload or {} for p in points}
+        results = [
+            {"id": pid, "payload": payloads[pid], "score": 1.0 / (dist + 0.1), "distance_km": dist}
+            for pid, dist in hits
+            if pid in payloads
+        ]
+        print(f"[INFO] search_nearby matched={len(hits)} returned={len(results)}")
+        return results
+
+    def search_nearby(
+        self,
+        lat: float,
+        lng: float,
+        limit: int = 5,
+        radius_km: float = 10.0,
+        categories: list[CategoryType] | None = None,
+    ):
         """
         Search for places near a specific coordinate.
-        GEO 인덱스 사용이 가능하면 반경 필터 기반으로 조회하고, 아니면 제한적 fallback scroll을 사용한다.
+        공간 색인이 있으면 실제 거리순 k-nearest (반경 / category 조건 포함) 후 payload만 retrieve.
+        없으면 GEO 반경 필터 scroll, 그마저 실패하면 제한적 fallback scroll을 사용한다.
+        동기 버전 — 스크립트/평가용. async 코드에서는 asearch_nearby 사용.
         """
         print(f"[INFO] search_nearby start lat={lat} lng={lng} limit={limit} radius_km={radius_km}")
+        if self.spatial_index is not None:
+            self._maybe_refresh_spatial_index()
+            hits = self._search_spatial_index(lat, lng, limit, radius_km, categories)
+            points = self.client.retrieve(
+                collection_name=PLACES_COLLECTION,
+                ids=[pid for pid, _ in hits],
+                with_payload=True,
+                with_vectors=False,
+            ) if hits else []
+            return self._format_nearby_hits(hits, points)
+
         candidate_points = []
-        radius_m = max(float(radius_km), 0.1) * 1000.0
-        scan_limit = max(int(limit or 0) * 20, 50)
+        geo_filter, fallback_filter, scan_limit = self._nearby_scan_params(lat, lng, limit, radius_km, categories)
 
         if ENABLE_GEO_FILTER:
             try:
-                geo_filter = Filter(
-                    must=[
-                        FieldCondition(
-                            key="geo",
-                            geo_radius={
-                                "center": {"lat": float(lat), "lon": float(lng)},
-                                "radius": radius_m,
-                            },
-                        )
-                    ]
-                )
                 points, _ = self.client.scroll(
                     collection_name=PLACES_COLLECTION,
                     scroll_filter=geo_filter,
@@ -546,6 +1520,7 @@ class PlaceRetriever(PlaceScorer):
         if not candidate_points:
             points, _ = self.client.scroll(
                 collection_name=PLACES_COLLECTION,
+                scroll_filter=fallback_filter,
                 limit=scan_limit,
                 with_payload=True,
                 with_vectors=False,
@@ -553,26 +1528,58 @@ class PlaceRetriever(PlaceScorer):
             candidate_points = list(points)
             print(f"[DEBUG] search_nearby fallback candidates={len(candidate_points)}")
 
-        results = []
-        for p in candidate_points:
-            payload = p.payload or {}
-            p_lat, p_lng = self._payload_coordinates(payload)
-            if p_lat is None or p_lng is None:
-                continue
+        return self._rank_nearby(candidate_points, lat, lng, limit, radius_km)
 
-            dist = self._haversine(float(lat), float(lng), p_lat, p_lng)
-            if dist <= radius_km:
-                results.append({
-                    "id": p.id,
-                    "payload": payload,
-                    "score": 1.0 / (dist + 0.1),
-                    "distance_km": dist,
-                })
+    async def asearch_nearby(
+        self,
+        lat: float,
+        lng: float,
+        limit: int = 5,
+        radius_km: float = 10.0,
+        categories: list[CategoryType] | None = None,
+    ):
+        """search_nearby의 async 버전 (AsyncQdrantClient 사용, event loop 차단 없음)."""
+        print(f"[INFO] asearch_nearby start lat={lat} lng={lng} limit={limit} radius_km={radius_km}")
+        if self.spatial_index is not None:
+            self._maybe_refresh_spatial_index()
+            hits = self._search_spatial_index(lat, lng, limit, radius_km, categories)
+            points = await self.aclient.retrieve(
+                collection_name=PLACES_COLLECTION,
+                ids=[pid for pid, _ in hits],
+                with_payload=True,
+                with_vectors=False,
+            ) if hits else []
+            return self._format_nearby_hits(hits, points)
 
-        results.sort(key=lambda x: x["distance_km"])
-        trimmed = results[:limit]
-        print(f"[INFO] search_nearby matched={len(results)} returned={len(trimmed)}")
-        return trimmed
+        candidate_points = []
+        geo_filter, fallback_filter, scan_limit = self._nearby_scan_params(lat, lng, limit, radius_km, categories)
+
+        if ENABLE_GEO_FILTER:
+            try:
+                points, _ = await self.aclient.scroll(
+                    collection_name=PLACES_COLLECTION,
+                    scroll_filter=geo_filter,
+                    limit=scan_limit,
+                    with_payload=True,
+                    with_vectors=False,
+                )
+                candidate_points = list(points)
+                print(f"[DEBUG] asearch_nearby geo-filter candidates={len(candidate_points)}")
+            except Exception as e:
+                print(f"[WARN] asearch_nearby geo filter failed, fallback scroll: {e}")
+
+        if not candidate_points:
+            points, _ = await self.aclient.scroll(
+                collection_name=PLACES_COLLECTION,
+                scroll_filter=fallback_filter,
+                limit=scan_limit,
+                with_payload=True,
+                with_vectors=False,
+            )
+            candidate_points = list(points)
+            print(f"[DEBUG] asearch_nearby fallback candidates={len(candidate_points)}")
+
+        return self._rank_nearby(candidate_points, lat, lng, limit, radius_km)
 
 
 async def retrieval_place(message_in: ChatMessageCreate):
@@ -607,7 +1614,11 @@ async def retrieval_place(message_in: ChatMessageCreate):
 
         query = message_in.message
         if len(address) > 0:
-            query += f'\n## location : ({user_lat}, {user_long}), address : {address}'
+            # 좌표는 검색 캐시 grid로 스냅 — 원본 float이 query에 들어가면 캐시 키가 요청마다 달라짐
+            query += (
+                f'\n## location : ({_snap(user_lat, SEARCH_CACHE_GRID_DEG)}, '
+                f'{_snap(user_long, SEARCH_CACHE_GRID_DEG)}), address : {address}'
+            )
         # Main Search (Hybrid)
         search_results = await retriever.search_hybrid(
             query=query,
@@ -665,15 +1676,15 @@ async def retrieval_place(message_in: ChatMessageCreate):
             print(f"[DEBUG] retrieval_place best_place coords lat={lat} lng={lng}")
 
             if lat != 0 and lng != 0:
-                nearby_places = retriever.search_nearby(lat, lng, limit=3, radius_km=5.0)
+                # 검색 결과와 겹치는 장소를 제외하고도 3개가 남도록 k-nearest를 여유 있게 조회
+                nearby_places = await retriever.asearch_nearby(lat, lng, limit=3 + len(search_ids), radius_km=5.0)
+                skipped = [res['id'] for res in nearby_places if res['id'] in search_ids]
+                if skipped:
+                    print(f"[DEBUG] retrieval_place skip nearby self ids={skipped}")
+                nearby_places = [res for res in nearby_places if res['id'] not in search_ids][:3]
                 if nearby_places:
                     formatted_results.append("\n### 📍 Nearby Recommendations (near 첨부한 위치)")
                     for i, res in enumerate(nearby_places):
-                        # Filter out the place itself if needed, but Qdrant might return it. Use ID check.
-                        if res['id'] in search_ids:
-                            print(f"[DEBUG] retrieval_place skip nearby self id={res['id']}")
-                            continue
-
                         payload = res.get('payload', {})
                         title = payload.get('title', 'Unknown')
                         dist = res.get('distance_km', 0)
@@ -715,6 +1726,9 @@ async def _fetch_photo_urls_by_contentids(
     wanted_ids = {str(cid) for cid in content_ids if cid is not None}
     if not wanted_ids:
         return {}
+    if retriever.photo_url_index is not None:
+        # 적재 시 계산한 대표 사진 URL 색인 조회 (photos scroll 없음)
+        return retriever.photo_url_index.get_many(wanted_ids, per_place=per_place)
 
     should_conditions = [
         FieldCondition(key="contentid", match=MatchValue(value=cid))
@@ -726,12 +1740,11 @@ async def _fetch_photo_urls_by_contentids(
     offset = None
 
     while True:
-        points, offset = await asyncio.to_thread(
-            retriever.client.scroll,
+        points, offset = await retriever.aclient.scroll(
             collection_name=PHOTOS_COLLECTION,
             scroll_filter=scroll_filter,
             limit=scroll_limit,
-            with_payload=True,
+            with_payload=["contentid", "image_url", "image"],
             with_vectors=False,
             offset=offset,
         )
@@ -0,0 +1,86 @@
+"""
+place_features.py — 장소별 점수 계산 feature 캐시
+
+fusion/boost 단계에서 후보마다 payload를 다시 토큰화·stem·좌표 파싱하던 작업을
+contentid 기준으로 1회만 계산해 캐싱한다.
+- 처음 보는 장소(first sight)에서 계산 → LRU로 메모리 상한 유지
+- payload 핵심 필드(title / 주소 / 카테고리 / 좌표) 서명이 바뀌면 재계산
+  (photos payload처럼 필드가 다른 payload로 먼저 계산된 경우도 자동 교체)
+- feature 추출 로직은 place_score._extract_place_features (scorer와 같은 토큰화 규칙 사용)
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+@dataclass(frozen=True)
+class PlaceFeatures:
+    title_norm: str                      # _normalize_match_text(title)
+    title_tokens: frozenset[str]         # title 토큰 (2자 이상)
+    target_tokens: frozenset[str]        # 주소+제목 토큰 (정규화)
+    target_stems: frozenset[str]         # 주소+제목 토큰 district stem (정규화)
+    addr_tokens: tuple[str, ...]         # payload addr_tokens (없으면 런타임 보강)
+    addr_token_set: frozenset[str]
+    addr_stem_set: frozenset[str]        # addr_tokens의 _addr_token_stem
+    lat: float | None
+    lng: float | None
+    compact_text: str                    # rerank / BM25용 compact text
+    compact_tokens: tuple[str, ...]
+
+
+def payload_signature(payload: dict[str, Any]) -> tuple:
+    """feature 재계산 여부 판단용 payload 핵심 필드 서명."""
+    return (
+        payload.get("title") or payload.get("name"),
+        payload.get("addr") or payload.get("address") or payload.get("road_address"),
+        payload.get("contenttypeid") or payload.get("category"),
+        payload.get("geo"),
+        payload.get("mapx"),
+        payload.get("mapy"),
+    )
+
+
+class PlaceFeatureStore:
+    """contentid → PlaceFeatures LRU 캐시 (thread-safe)."""
+
+    def __init__(self, extract: Callable[[dict[str, Any]], PlaceFeatures], max_size: int = 10000):
+        self.extract = extract
+        self.max_size = max(int(max_size), 1)
+        self._entries: OrderedDict[str, tuple[tuple, PlaceFeatures]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, payload: dict[str, Any]) -> PlaceFeatures:
+        payload = payload or {}
+        key = str(payload.get("contentid") or "").strip()
+        if not key:
+            # contentid 없는 payload는 캐시 없이 계산
+            return self.extract(payload)
+
+        signature = payload_signature(payload)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        features = self.extract(payload)
+        with self._lock:
+            self._entries[key] = (signature, features)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return features
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
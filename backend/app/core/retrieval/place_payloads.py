@@ -0,0 +1,94 @@
+"""
+place_payloads.py — photos 경량 payload 규칙 + 장소 payload 캐시 (late hydration)
+
+photos 포인트에는 장소 문서 전체 대신 조회/필터에 필요한 필드만 저장한다.
+(contentid / contenttypeid / image_url / geo)
+search_hybrid에서 photos 채널로만 회수된 후보는 fusion 전에 places payload로 교체한다.
+first stage 채널은 FIRST_STAGE_PAYLOAD_FIELDS만 조회하고, 최종 결과만 전체 payload로 보강한다.
+- 장소 payload는 전체 payload contentid LRU 캐시로 먼저 조회
+- 캐시에 없는 장소만 PLACES retrieve 1회로 가져옴
+- 컬렉션 버전 스탬프가 바뀌면(재적재) 캐시 전체 무효화
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Iterable
+
+PHOTO_PAYLOAD_FIELDS = ("contentid", "contenttypeid", "image_url", "geo")
+# search_hybrid first stage 채널 조회 필드 (fusion / boost / rerank compact text / feature 캐시 서명에 쓰는 필드만)
+FIRST_STAGE_PAYLOAD_FIELDS = (
+    "contentid", "title", "name",
+    "addr", "address", "road_address", "old_address", "addr_tokens",
+    "contenttypeid", "category",
+    "geo", "lat", "lng", "mapx", "mapy", "latitude", "longitude",
+)
+
+
+def slim_photo_payload(place_payload: dict[str, Any], image_url: str | None) -> dict[str, Any]:
+    """장소 payload → photos 포인트 payload (PHOTO_PAYLOAD_FIELDS만, 값 없는 필드 제외)."""
+    payload = {
+        "contentid": str(place_payload.get("contentid") or "").strip(),
+        "contenttypeid": place_payload.get("contenttypeid"),
+        "image_url": image_url,
+        "geo": place_payload.get("geo"),
+    }
+    return {key: value for key, value in payload.items() if value not in (None, "", [], {})}
+
+
+def is_place_payload(payload: dict[str, Any] | None) -> bool:
+    """places 문서 payload인지 (photos 경량 payload / 빈 payload는 False)."""
+    return bool(payload) and bool(payload.get("title") or payload.get("name"))
+
+
+class PlacePayloadCache:
+    """contentid → places payload LRU 캐시 (thread-safe)."""
+
+    def __init__(self, max_size: int = 10000, version_fn: Callable[[], Any] | None = None):
+        self.max_size = max(int(max_size), 1)
+        self._entries: OrderedDict[int, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.version_fn = version_fn
+        self._version: Any = None
+        self.hits = 0
+        self.misses = 0
+
+    def _check_version_locked(self) -> None:
+        if self.version_fn is None:
+            return
+        version = self.version_fn()
+        if version != self._version:
+            self._entries.clear()
+            self._version = version
+
+    def put_many(self, items: Iterable[tuple[int | None, dict[str, Any] | None]]) -> None:
+        with self._lock:
+            self._check_version_locked()
+            for pid, payload in items:
+                if pid is None or not is_place_payload(payload):
+                    continue
+                self._entries[pid] = payload
+                self._entries.move_to_end(pid)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def get_many(self, pids: Iterable[int]) -> dict[int, dict[str, Any]]:
+        found = {}
+        with self._lock:
+            self._check_version_locked()
+            for pid in pids:
+                payload = self._entries.get(pid)
+                if payload is None:
+                    self.misses += 1
+                    continue
+                self._entries.move_to_end(pid)
+                self.hits += 1
+                found[pid] = payload
+        return found
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
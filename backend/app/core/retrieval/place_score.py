@@ -6,29 +6,40 @@ place_score.py — 점수 계산 전담 모듈
   _build_compact_text, _to_positive_int, _safe_float, _extract_place_id
 
 PlaceScorer mixin:
-  토큰화, 주소 파싱, BM25, 키워드/위치/거리 boost, reranker
+  토큰화, 주소 파싱, BM25, 키워드/위치/거리 boost, RRF+boost 결합(fusion.py 배열 연산), reranker
   → PlaceRetriever가 상속해서 self.메서드()로 호출
+  boost / rerank는 payload 대신 장소별 feature 캐시(place_features)를 읽는다.
 """
 
 
 import asyncio
 import math
 import re
+from functools import lru_cache
 from typing import Any
-from sentence_transformers import CrossEncoder
+
+import numpy as np
 
 from app.agents.models.output import CategoryType
 from app.utils.config import (
     PLACES_COLLECTION,
     PHOTOS_COLLECTION,
-    DEVICE,
     BM25_POOL_LIMIT,
     SPARSE_ADDR_EXACT_WEIGHT,
     SPARSE_ADDR_STEM_WEIGHT,
     SPARSE_ADDR_MAX_BOOST,
+    RERANK_MODEL,
+    RERANK_INFERENCE_BACKEND,
+    BOOST_WEIGHT,
+    GEO_PROXIMITY_RADIUS_KM,
+    RRF_SCORE_MAX, FUSED_SCORE_MAX, MAX_BOOST_SUM,
 )
 from app.scripts.preprocess_data import build_addr_tokens
+from app.core.retrieval.fusion import CandidatePool, geo_proximity_bonus, rank_fused_candidates
+from app.core.retrieval.model_loader import load_cross_encoder
+from app.core.retrieval.place_features import PlaceFeatures, PlaceFeatureStore
 from app.utils.place_id import get_place_id_from_point
+from app.core.retrieval.batching import MicroBatcher
 
 
 # ---------------------------------------------------------------------------
@@ -85,6 +96,74 @@ def _safe_float(value: Any) -> float | None:
         return None
 
 
+def _parse_payload_coordinates(payload: dict[str, Any]) -> tuple[float | None, float | None]:
+    if not payload:
+        return None, None
+
+    geo = payload.get("geo")
+    if isinstance(geo, dict):
+        geo_lat = _safe_float(geo.get("lat"))
+        geo_lng = _safe_float(geo.get("lon"))
+        if geo_lat is not None and geo_lng is not None:
+            if -90.0 <= geo_lat <= 90.0 and -180.0 <= geo_lng <= 180.0:
+                return geo_lat, geo_lng
+
+    lat_keys = ("lat", "mapy", "latitude")
+    lng_keys = ("lng", "mapx", "longitude")
+    lat = next((_safe_float(payload.get(k)) for k in lat_keys if _safe_float(payload.get(k)) is not None), None)
+    lng = next((_safe_float(payload.get(k)) for k in lng_keys if _safe_float(payload.get(k)) is not None), None)
+
+    if lat is None or lng is None:
+        return None, None
+    if abs(lat) < 1e-9 and abs(lng) < 1e-9:
+        return None, None
+    if not (-90.0 <= lat <= 90.0 and -180.0 <= lng <= 180.0):
+        return None, None
+    return lat, lng
+
+
+def _tokenize_text(text: str) -> list[str]:
+    return re.findall(r"[가-힣A-Za-z0-9]+", text or "")
+
+
+@lru_cache(maxsize=1024)
+def _query_token_set(text: str, min_len: int = 1) -> frozenset[str]:
+    """query / preferred_location 토큰 set. 같은 요청의 후보 수만큼 반복 호출되므로 캐싱."""
+    return frozenset(t for t in _tokenize_text(text) if len(t) >= min_len)
+
+
+def _extract_place_features(payload: dict[str, Any]) -> PlaceFeatures:
+    """payload → PlaceFeatures. PlaceFeatureStore가 장소당 1회 호출."""
+    payload = payload or {}
+    title = str(payload.get("title") or payload.get("name") or "")
+    addr = str(payload.get("addr") or payload.get("address") or payload.get("road_address") or "")
+    target_raw = _tokenize_text(f"{addr} {title}")
+
+    raw_addr_tokens = payload.get("addr_tokens")
+    if isinstance(raw_addr_tokens, list):
+        addr_tokens = tuple(str(t).strip().lower() for t in raw_addr_tokens if str(t).strip())
+    else:
+        # 하위 호환: 적재 데이터에 addr_tokens가 없으면 런타임 보강
+        addr_tokens = tuple(build_addr_tokens(payload))
+    addr_token_set = frozenset(addr_tokens)
+
+    lat, lng = _parse_payload_coordinates(payload)
+    compact_text = _build_compact_text(payload)
+    return PlaceFeatures(
+        title_norm=_normalize_match_text(title),
+        title_tokens=frozenset(t for t in _tokenize_text(title) if len(t) >= 2),
+        target_tokens=frozenset(_normalize_match_text(t) for t in target_raw),
+        target_stems=frozenset(_normalize_match_text(_district_stem(t)) for t in target_raw),
+        addr_tokens=addr_tokens,
+        addr_token_set=addr_token_set,
+        addr_stem_set=frozenset(_addr_token_stem(t) for t in addr_token_set),
+        lat=lat,
+        lng=lng,
+        compact_text=compact_text,
+        compact_tokens=tuple(_tokenize_text(compact_text)),
+    )
+
+
 def _extract_place_id(point: Any, source_collection: str) -> int | None:
     if source_collection == PHOTOS_COLLECTION:
         cid = get_place_id_from_point(point, prefer_payload=True, fallback_to_point_id=False)
@@ -110,13 +189,24 @@ class PlaceScorer:
     # reranker 상태 — PlaceRetriever.__init__에서 초기화
     _reranker: "CrossEncoder | None"
     _reranker_load_attempted: bool
+    # 요청 간 micro-batching (None이면 요청별 단독 predict)
+    _rerank_batcher: "MicroBatcher | None" = None
+    # 장소별 feature 캐시 (None이면 매번 payload에서 계산)
+    place_features: PlaceFeatureStore | None = None
+    # places 좌표 공간 색인 (None이면 payload 좌표만 사용)
+    spatial_index: "SpatialIndex | None" = None
+
+    def _place_features(self, payload: dict[str, Any]) -> PlaceFeatures:
+        if self.place_features is not None:
+            return self.place_features.get(payload)
+        return _extract_place_features(payload)
 
     # ------------------------------------------------------------------
     # 토큰화
     # ------------------------------------------------------------------
 
     def _tokenize(self, text: str) -> list[str]:
-        return re.findall(r"[가-힣A-Za-z0-9]+", text or "")
+        return _tokenize_text(text)
 
     def _extract_query_addr_tokens(self, text: str) -> list[str]:
         if not text:
@@ -143,11 +233,7 @@ class PlaceScorer:
     def _payload_addr_tokens(self, payload: dict[str, Any]) -> list[str]:
         if not payload:
             return []
-        raw = payload.get("addr_tokens")
-        if isinstance(raw, list):
-            return [str(t).strip().lower() for t in raw if str(t).strip()]
-        # 하위 호환: 적재 데이터에 addr_tokens가 없으면 런타임 보강
-        return build_addr_tokens(payload)
+        return list(self._place_features(payload).addr_tokens)
 
     # ------------------------------------------------------------------
     # 좌표 / 거리
@@ -156,27 +242,8 @@ class PlaceScorer:
     def _payload_coordinates(self, payload: dict[str, Any]) -> tuple[float | None, float | None]:
         if not payload:
             return None, None
-
-        geo = payload.get("geo")
-        if isinstance(geo, dict):
-            geo_lat = _safe_float(geo.get("lat"))
-            geo_lng = _safe_float(geo.get("lon"))
-            if geo_lat is not None and geo_lng is not None:
-                if -90.0 <= geo_lat <= 90.0 and -180.0 <= geo_lng <= 180.0:
-                    return geo_lat, geo_lng
-
-        lat_keys = ("lat", "mapy", "latitude")
-        lng_keys = ("lng", "mapx", "longitude")
-        lat = next((_safe_float(payload.get(k)) for k in lat_keys if _safe_float(payload.get(k)) is not None), None)
-        lng = next((_safe_float(payload.get(k)) for k in lng_keys if _safe_float(payload.get(k)) is not None), None)
-
-        if lat is None or lng is None:
-            return None, None
-        if abs(lat) < 1e-9 and abs(lng) < 1e-9:
-            return None, None
-        if not (-90.0 <= lat <= 90.0 and -180.0 <= lng <= 180.0):
-            return None, None
-        return lat, lng
+        features = self._place_features(payload)
+        return features.lat, features.lng
 
     def _haversine(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """두 좌표 간 거리(km)."""
@@ -194,19 +261,25 @@ class PlaceScorer:
     def _addr_sparse_bonus(
         self,
         query_addr_tokens: list[str],
-        payload_addr_tokens: list[str],
+        payload_addr_tokens: list[str] | None = None,
         max_boost: float = SPARSE_ADDR_MAX_BOOST,
         exact_weight: float = SPARSE_ADDR_EXACT_WEIGHT,
         stem_weight: float = SPARSE_ADDR_STEM_WEIGHT,
+        payload: dict[str, Any] | None = None,
     ) -> float:
         """
         주소 sparse 보너스
         (예: '강남구' -> '강남' 매칭)
+        payload를 넘기면 feature 캐시의 토큰/stem set을 사용한다.
         """
-        if not query_addr_tokens or not payload_addr_tokens:
+        if payload is not None:
+            features = self._place_features(payload)
+            payload_token_set, payload_stem_set = features.addr_token_set, features.addr_stem_set
+        else:
+            payload_token_set = set(payload_addr_tokens or [])
+            payload_stem_set = {_addr_token_stem(t) for t in payload_token_set}
+        if not query_addr_tokens or not payload_token_set:
             return 0.0
-        payload_token_set = set(payload_addr_tokens)
-        payload_stem_set = {_addr_token_stem(t) for t in payload_token_set}
         bonus = 0.0
         for token in query_addr_tokens:
             if token in payload_token_set:
@@ -229,16 +302,13 @@ class PlaceScorer:
         if not query or not payload:
             return 0.0
 
-        title = str(payload.get("title") or payload.get("name") or "")
-        if not title:
-            return 0.0
-
-        title_norm = _normalize_match_text(title)
+        features = self._place_features(payload)
+        title_norm = features.title_norm
         if not title_norm:
             return 0.0
 
         # query를 토큰 단위로 분리
-        query_tokens = set(self._tokenize(query))
+        query_tokens = _query_token_set(query)
         if not query_tokens:
             return 0.0
 
@@ -254,8 +324,7 @@ class PlaceScorer:
         # Case 2: title이 여러 토큰으로 구성된 경우 → query 토큰과 overlap 확인
         # title이 4자 이상이어야 의미 있는 상호명으로 판단 (지역명 혼동 방지)
         elif len(title_norm) >= 4:
-            title_tokens = {t for t in self._tokenize(title) if len(t) >= 2}
-            overlap = len(query_tokens & title_tokens)
+            overlap = len(query_tokens & features.title_tokens)
             if overlap > 0:
                 # 가중치를 낮게 유지: 주소/지역 매칭(_addr_sparse_bonus)과 역할 분리
                 bonus += min(0.06, 0.02 * overlap)
@@ -271,16 +340,14 @@ class PlaceScorer:
         if not preferred_location or not payload:
             return 0.0
 
-        addr = str(payload.get("addr") or payload.get("address") or payload.get("road_address") or "")
-        title = str(payload.get("title") or payload.get("name") or "")
-
         # 주소 + 제목을 토큰 set으로 분리 (공백 제거된 단일 문자열이 아니라 단어 단위로 비교)
-        target_tokens = {_normalize_match_text(t) for t in self._tokenize(f"{addr} {title}") if len(t) >= 1}
-        target_stems = {_normalize_match_text(_district_stem(t)) for t in self._tokenize(f"{addr} {title}") if len(t) >= 1}
+        features = self._place_features(payload)
+        target_tokens = features.target_tokens
+        target_stems = features.target_stems
         if not target_tokens:
             return 0.0
 
-        location_tokens = {t for t in self._tokenize(preferred_location) if len(t) >= 2}
+        location_tokens = _query_token_set(preferred_location, 2)
         if not location_tokens:
             return 0.0
 
@@ -321,6 +388,58 @@ class PlaceScorer:
         normalized = max(0.0, 1.0 - (dist_km / radius_km))
         return max_boost * normalized
 
+    def _fuse_candidates(
+        self,
+        pool: CandidatePool,
+        query: str,
+        preferred_location: str | None,
+        query_addr_tokens: list[str],
+        sparse_enabled: bool,
+        anchor_lat: float | None,
+        anchor_lng: float | None,
+    ) -> list[dict[str, Any]]:
+        """
+        RRF 후보 풀 + boost 결합 → 최종 점수 순 후보 목록
+        텍스트 boost는 장소 feature 캐시 기반 per-place 계산, 거리/합산/정규화/정렬은 배열 연산.
+        """
+        n = len(pool)
+        keyword = np.zeros(n, dtype=np.float64)
+        location_text = np.zeros(n, dtype=np.float64)
+        addr_sparse = np.zeros(n, dtype=np.float64)
+        lats = np.full(n, np.nan, dtype=np.float64)
+        lngs = np.full(n, np.nan, dtype=np.float64)
+
+        for row, payload in enumerate(pool.payloads):
+            keyword[row] = self._keyword_match_bonus(query=query or "", payload=payload)
+            location_text[row] = self._location_text_bonus(preferred_location=preferred_location, payload=payload)
+            lat, lng = self._payload_coordinates(payload)
+            if lat is not None and lng is not None:
+                lats[row], lngs[row] = lat, lng
+            if sparse_enabled:
+                addr_sparse[row] = self._addr_sparse_bonus(query_addr_tokens=query_addr_tokens, payload=payload)
+                if addr_sparse[row] > 0.0:
+                    pool.matches[row].add("addr_sparse")
+
+        if self.spatial_index is not None:
+            # photos payload 등 좌표 없는 후보는 공간 색인 좌표로 보강
+            missing = np.flatnonzero(np.isnan(lats))
+            if len(missing):
+                idx_lats, idx_lngs = self.spatial_index.coordinates(pool.ids[row] for row in missing.tolist())
+                lats[missing], lngs[missing] = idx_lats, idx_lngs
+
+        geo_proximity = geo_proximity_bonus(
+            lats, lngs, anchor_lat, anchor_lng,
+            radius_km=GEO_PROXIMITY_RADIUS_KM,  # config 기반 반경 (#9)
+        )
+        # boost 합계(최대 0.65) * BOOST_WEIGHT(0.3) → boost 최대 기여 ≈ 0.195
+        return rank_fused_candidates(
+            pool, keyword, location_text, geo_proximity, addr_sparse,
+            boost_weight=BOOST_WEIGHT,
+            fused_score_max=FUSED_SCORE_MAX,
+            rrf_score_max=RRF_SCORE_MAX,
+            max_boost_sum=MAX_BOOST_SUM,
+        )
+
     # ------------------------------------------------------------------
     # BM25 lexical 검색 (vector pool 재채점)
     # ------------------------------------------------------------------
@@ -351,8 +470,7 @@ class PlaceScorer:
         tokens = self._tokenize(query)
         if not tokens:
             return 0.0
-        doc_text = _build_compact_text(payload)
-        doc_tokens = self._tokenize(doc_text)
+        doc_tokens = self._place_features(payload).compact_tokens
         if not doc_tokens:
             return 0.0
 
@@ -390,7 +508,7 @@ class PlaceScorer:
         doc_freq: dict[str, int] = {}
         for p in pool:
             payload = p.payload or {}
-            doc_tokens = set(self._tokenize(_build_compact_text(payload)))
+            doc_tokens = set(self._place_features(payload).compact_tokens)
             num_docs += 1
             for tok in doc_tokens:
                 doc_freq[tok] = doc_freq.get(tok, 0) + 1
@@ -423,28 +541,62 @@ class PlaceScorer:
             return
         self._reranker_load_attempted = True
         try:
-            self._reranker = CrossEncoder(
-                "cross-encoder/mmarco-mMiniLMv2-L12-H384-v1",
-                device=DEVICE,
-            )
-            print("[INFO] Reranker loaded: cross-encoder/mmarco-mMiniLMv2-L12-H384-v1")
+            self._reranker = load_cross_encoder(RERANK_MODEL, RERANK_INFERENCE_BACKEND)
+            print(f"[INFO] Reranker loaded: {RERANK_MODEL} backend={RERANK_INFERENCE_BACKEND}")
         except Exception as e:
             self._reranker = None
             print(f"[WARN] Reranker unavailable: {e}")
 
+    async def _predict_rerank(self, pairs: list[tuple[str, str]]) -> list[float]:
+        # 이미 batcher 상한보다 큰 요청(여행 일정 전체 rerank 등)은 batcher로 쪼개지 않고 predict 1회
+        if self._rerank_batcher is not None and len(pairs) <= self._rerank_batcher.max_batch_size:
+            return await self._rerank_batcher.submit_many(pairs)
+        return await asyncio.to_thread(self._reranker.predict, pairs, batch_size=max(len(pairs), 1))
+
+    @staticmethod
+    def _keep_first_stage_order(candidates: list[dict], top_k: int) -> list[dict]:
+        for idx, c in enumerate(candidates[:top_k], start=1):
+            c["rerank_score"] = None
+            c["final_rank"] = idx
+        return candidates[:top_k]
+
     async def _rerank_candidates(self, query: str, candidates: list[dict], top_k: int) -> list[dict]:
+        results = await self._rerank_candidates_many([(query, candidates, top_k)])
+        return results[0]
+
+    async def _rerank_candidates_many(self, jobs: list[tuple[str, list[dict], int]]) -> list[list[dict]]:
+        """
+        여러 (query, candidates, top_k) 묶음을 CrossEncoder.predict 1회로 rerank.
+        반환은 jobs 순서대로 _rerank_candidates와 같은 형태의 리스트.
+        """
         self._ensure_reranker()
-        # query가 없으면 reranker 실행 불가 → score 순 유지
-        if not self._reranker or not candidates or not (query or "").strip():
-            for idx, c in enumerate(candidates[:top_k], start=1):
-                c["rerank_score"] = None
-                c["final_rank"] = idx
-            return candidates[:top_k]
+        outputs: list[list[dict] | None] = [None] * len(jobs)
+        pairs = []
+        spans = []  # (job index, pairs 시작, pairs 끝)
+        for i, (query, candidates, top_k) in enumerate(jobs):
+            # query가 없으면 reranker 실행 불가 → score 순 유지
+            if not self._reranker or not candidates or not (query or "").strip():
+                outputs[i] = self._keep_first_stage_order(candidates, top_k)
+                continue
+            start = len(pairs)
+            pairs.extend((query, self._place_features(c.get("payload") or {}).compact_text) for c in candidates)
+            spans.append((i, start, len(pairs)))
+
+        if not spans:
+            return outputs
 
-        pairs = [(query, _build_compact_text(c.get("payload", {}))) for c in candidates]
         try:
-            scores = await asyncio.to_thread(self._reranker.predict, pairs)
-            for c, s in zip(candidates, scores):
+            scores = await self._predict_rerank(pairs)
+        except Exception as e:
+            print(f"[WARN] Reranker inference failed: {e}")
+            for i, _, _ in spans:
+                _, candidates, top_k = jobs[i]
+                outputs[i] = self._keep_first_stage_order(candidates, top_k)
+            return outputs
+
+        for i, start, end in spans:
+            _, candidates, top_k = jobs[i]
+            for c, s in zip(candidates, scores[start:end]):
                 # sigmoid 적용: CrossEncoder raw logit(-∞~+∞) → [0.0, 1.0]
                 # 음수 오버플로우 방지를 위해 -500 clamp 적용
                 logit = max(-500.0, float(s))
@@ -452,10 +604,5 @@ class PlaceScorer:
             candidates.sort(key=lambda x: float(x.get("rerank_score", 0.0)), reverse=True)
             for idx, c in enumerate(candidates[:top_k], start=1):
                 c["final_rank"] = idx
-            return candidates[:top_k]
-        except Exception as e:
-            print(f"[WARN] Reranker inference failed: {e}")
-            for idx, c in enumerate(candidates[:top_k], start=1):
-                c["rerank_score"] = None
-                c["final_rank"] = idx
-            return candidates[:top_k]
+            outputs[i] = candidates[:top_k]
+        return outputs
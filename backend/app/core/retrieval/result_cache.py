@@ -0,0 +1,139 @@
+"""
+result_cache.py — search_hybrid 결과 캐시
+
+explore 페이지 / 추천 프롬프트 / 재시도처럼 같은 검색 요청이 반복되면
+encode → Qdrant 채널 → BM25 → CrossEncoder 전체 경로를 생략하고 이전 결과를 반환한다.
+- 키: 요청 파라미터 정규화 (query 공백/NFC, categories 정렬, 사용자 좌표는 격자 셀로 스냅)
+       + retrieval 프로파일 파라미터 (프로파일이 바뀌면 다른 키)
+- LRU + TTL 퇴출
+- 컬렉션 버전 스탬프(collection_version)가 바뀌면 전체 무효화
+- hit / miss / hit_rate / 절약된 검색 시간(saved_ms) 통계
+"""
+
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from app.core.retrieval.embedding_cache import normalize_query_key
+
+
+def _snap(value: float | None, grid_deg: float) -> float | None:
+    if value in (None, 0, 0.0):
+        return None
+    if grid_deg <= 0:
+        return round(float(value), 6)
+    return round(round(float(value) / grid_deg) * grid_deg, 6)
+
+
+def build_search_key(request: Any, scope: str, params: dict, grid_deg: float) -> str:
+    """HybridSearchRequest + 정규화 scope + retrieval 프로파일 → 캐시 키 (sha1)."""
+    categories = sorted(
+        str(getattr(c, "value", c)) for c in (request.categories or [])
+    )
+    anchor = None
+    if request.location_anchor_lat is not None and request.location_anchor_lon is not None:
+        anchor = [
+            round(float(request.location_anchor_lat), 6),
+            round(float(request.location_anchor_lon), 6),
+            request.location_radius_m,
+        ]
+    parts = {
+        "query": normalize_query_key(request.query),
+        "image_url": request.image_url or None,
+        "limit": int(request.limit or 0),
+        "categories": categories,
+        "emotional_text": normalize_query_key(request.emotional_text) or None,
+        "user": [_snap(request.user_latitude, grid_deg), _snap(request.user_longitude, grid_deg)],
+        "preferred_location": normalize_query_key(request.preferred_location) or None,
+        "candidate_k": request.candidate_k,
+        "enable_bm25": bool(request.enable_bm25),
+        "enable_rerank": bool(request.enable_rerank),
+        "rerank_top_k": request.rerank_top_k,
+        "scope": scope,
+        "anchor": anchor,
+        "params": params,
+    }
+    raw = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class SearchResultCache:
+    """키 → search_hybrid 결과 LRU + TTL 캐시 (thread-safe). 반환/저장 시 deep copy."""
+
+    def __init__(
+        self,
+        max_size: int = 512,
+        ttl_s: float = 600.0,
+        version_fn: Callable[[], Any] | None = None,
+    ):
+        self.max_size = max(int(max_size), 1)
+        self.ttl_s = float(ttl_s)
+        self.version_fn = version_fn
+        self._entries: OrderedDict[str, tuple[float, float, list[dict]]] = OrderedDict()
+        self._version: Any = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.saved_ms = 0.0
+
+    def _check_version_locked(self) -> None:
+        if self.version_fn is None:
+            return
+        version = self.version_fn()
+        if version != self._version:
+            if self._entries:
+                self.invalidations += 1
+                print(f"[INFO] search result cache invalidated (collection version {self._version} -> {version})")
+            self._entries.clear()
+            self._version = version
+
+    def get(self, key: str) -> list[dict] | None:
+        now = time.monotonic()
+        with self._lock:
+            self._check_version_locked()
+            item = self._entries.get(key)
+            if item is not None and (self.ttl_s <= 0 or now - item[0] <= self.ttl_s):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                self.saved_ms += item[1]
+                results = item[2]
+            else:
+                if item is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+        return copy.deepcopy(results)
+
+    def put(self, key: str, results: list[dict], elapsed_ms: float) -> None:
+        """elapsed_ms: 이 결과를 계산하는 데 걸린 시간 (hit마다 saved_ms에 누적)."""
+        stored = copy.deepcopy(results)
+        with self._lock:
+            self._check_version_locked()
+            self._entries[key] = (time.monotonic(), float(elapsed_ms), stored)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "saved_ms": round(self.saved_ms, 1),
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
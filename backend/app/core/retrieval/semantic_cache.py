@@ -0,0 +1,185 @@
+"""
+semantic_cache.py — 의미 유사 query 결과 캐시
+
+"홍대 분위기 좋은 카페" / "홍대 감성 카페 추천"처럼 표현만 다른 query는 후보 pool이 거의 같으므로,
+BGE-M3 query 임베딩 cosine 유사도가 임계값 이상이고 필터 서명(categories / anchor / 좌표 / 옵션)이 같으면
+이전 검색의 fusion + rerank 결과를 재사용한다.
+- 최근 query 임베딩을 고정 크기 행렬(정규화 float32)에 보관 → 서명별 slot 행렬곱으로 최근접 검색
+  (항목 수가 작아 brute-force 내적이 곧 정확한 최근접이며 근사 색인보다 빠름)
+- LRU + TTL 퇴출 (퇴출된 slot 재사용)
+- 품질 guard rail: 일부 hit를 전체 검색과 비교(ndcg@k, 오프라인 평가와 같은 정의)해 rolling 평균이
+  기준 미만이면 캐시 제공을 중단. 컬렉션 버전이 바뀌거나 disable_cooldown_s가 지나면 audit을 비우고 재개
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Callable
+
+import numpy as np
+
+from app.utils.ranking_metrics import ndcg_at_k
+
+
+class SemanticQueryCache:
+    """(query 임베딩, 필터 서명) → 검색 결과. thread-safe."""
+
+    def __init__(
+        self,
+        max_size: int = 512,
+        threshold: float = 0.92,
+        ttl_s: float = 600.0,
+        min_quality: float = 0.7,
+        audit_window: int = 50,
+        min_audits: int = 10,
+        version_fn: Callable[[], Any] | None = None,
+        disable_cooldown_s: float = 1800.0,
+    ):
+        self.max_size = max(int(max_size), 1)
+        self.threshold = float(threshold)
+        self.ttl_s = float(ttl_s)
+        self.min_quality = float(min_quality)
+        self.min_audits = max(int(min_audits), 1)
+        self.disable_cooldown_s = float(disable_cooldown_s)
+        self._vectors: np.ndarray | None = None  # [max_size, dim], 첫 put에서 할당
+        self._entries: OrderedDict[int, dict[str, Any]] = OrderedDict()  # slot -> entry (LRU 순)
+        self._slots_by_signature: dict[str, set[int]] = {}
+        self._free_slots = list(range(self.max_size - 1, -1, -1))
+        self._audits: deque[float] = deque(maxlen=max(int(audit_window), 1))
+        self.version_fn = version_fn
+        self._version: Any = None
+        self._lock = threading.Lock()
+        self.enabled = True
+        self._disabled_at = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _normalize(vector: Any) -> np.ndarray:
+        vec = np.asarray(vector, dtype=np.float32).reshape(-1)
+        norm = float(np.linalg.norm(vec))
+        return vec / norm if norm > 0 else vec
+
+    def _drop_locked(self, slot: int) -> None:
+        entry = self._entries.pop(slot)
+        slots = self._slots_by_signature.get(entry["signature"])
+        if slots is not None:
+            slots.discard(slot)
+            if not slots:
+                del self._slots_by_signature[entry["signature"]]
+        self._free_slots.append(slot)
+
+    def _reset_locked(self) -> None:
+        """항목 / audit 기록을 비우고 캐시 제공 재개."""
+        for slot in list(self._entries):
+            self._drop_locked(slot)
+        self._audits.clear()
+        self.enabled = True
+
+    def _check_version_locked(self) -> None:
+        """
+        컬렉션 버전 스탬프가 바뀌면 전체 비움 (SearchResultCache와 동일 기준).
+        quality guard로 중단된 상태면 새 컬렉션 기준으로 다시 채점하도록 재개, 버전이 그대로여도 cooldown 후 재개.
+        """
+        if self.version_fn is not None:
+            version = self.version_fn()
+            if version != self._version:
+                if not self.enabled:
+                    print("[INFO] semantic cache re-enabled: collection version changed")
+                self._reset_locked()
+                self._version = version
+                return
+        if (
+            not self.enabled
+            and self.disable_cooldown_s > 0
+            and time.monotonic() - self._disabled_at >= self.disable_cooldown_s
+        ):
+            print(f"[INFO] semantic cache re-enabled after {self.disable_cooldown_s:.0f}s cooldown")
+            self._reset_locked()
+
+    def lookup(self, vector: Any, signature: str) -> dict[str, Any] | None:
+        """같은 서명 중 cosine 최대 항목이 threshold 이상이면 {query, similarity, results(copy)}."""
+        with self._lock:
+            self._check_version_locked()
+            slots = list(self._slots_by_signature.get(signature, ()))
+            if not self.enabled or not slots or self._vectors is None:
+                self.misses += 1
+                return None
+            now = time.monotonic()
+            if self.ttl_s > 0:
+                for slot in [s for s in slots if now - self._entries[s]["created"] > self.ttl_s]:
+                    self._drop_locked(slot)
+                    slots.remove(slot)
+            if not slots:
+                self.misses += 1
+                return None
+            sims = self._vectors[slots] @ self._normalize(vector)
+            best = int(np.argmax(sims))
+            similarity = float(sims[best])
+            if similarity < self.threshold:
+                self.misses += 1
+                return None
+            slot = slots[best]
+            self._entries.move_to_end(slot)
+            self.hits += 1
+            entry = self._entries[slot]
+            query, results = entry["query"], entry["results"]
+        return {"query": query, "similarity": similarity, "results": copy.deepcopy(results)}
+
+    def put(self, vector: Any, signature: str, query: str, results: list[dict]) -> None:
+        vec = self._normalize(vector)
+        stored = copy.deepcopy(results)
+        with self._lock:
+            self._check_version_locked()
+            if self._vectors is None:
+                self._vectors = np.zeros((self.max_size, vec.shape[0]), dtype=np.float32)
+            if not self._free_slots:
+                # LRU 퇴출
+                self._drop_locked(next(iter(self._entries)))
+            slot = self._free_slots.pop()
+            self._vectors[slot] = vec
+            self._entries[slot] = {
+                "created": time.monotonic(),
+                "signature": signature,
+                "query": query,
+                "results": stored,
+            }
+            self._slots_by_signature.setdefault(signature, set()).add(slot)
+
+    def record_audit(self, cached_ids: list[str], fresh_ids: list[str], k: int) -> float:
+        """
+        캐시 결과를 전체 검색 결과(정답 취급) 대비 ndcg@k로 채점해 rolling window에 기록.
+        최근 min_audits회 이상 평균이 min_quality 미만이면 캐시 제공 중단 (버전 변경 / cooldown 후 재개).
+        """
+        k = max(int(k), 1)
+        score = ndcg_at_k(cached_ids, set(fresh_ids[:k]), k) if fresh_ids else 1.0
+        with self._lock:
+            self._audits.append(score)
+            mean = sum(self._audits) / len(self._audits)
+            if self.enabled and len(self._audits) >= self.min_audits and mean < self.min_quality:
+                self.enabled = False
+                self._disabled_at = time.monotonic()
+                print(
+                    f"[WARN] semantic cache disabled by quality guard "
+                    f"(ndcg@k mean={mean:.3f} < {self.min_quality} over {len(self._audits)} audits)"
+                )
+        return score
+
+    def clear(self) -> None:
+        with self._lock:
+            for slot in list(self._entries):
+                self._drop_locked(slot)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "audits": len(self._audits),
+                "audit_ndcg_mean": round(sum(self._audits) / len(self._audits), 4) if self._audits else None,
+            }
@@ -0,0 +1,165 @@
+"""
+spatial_index.py — places 좌표 in-memory 공간 색인 (k-nearest / 반경 검색)
+
+search_nearby가 임의 points를 scroll(limit*20)한 뒤 Python haversine 정렬하던 방식 대신,
+places 전체 좌표를 단위 구면 3D 좌표(x, y, z)로 변환해 KD-tree(scipy cKDTree)에 올린다.
+- 현(chord) 거리는 대원 거리와 단조 관계 → KD-tree k-NN 결과가 곧 실제 최근접 순서
+- 반경 검색은 반경(km)을 현 거리 상한으로 변환해 distance_upper_bound로 처리
+- category 필터는 category별 부분 트리(lazy 생성)로 처리
+- 불변 색인: 갱신은 PlaceRetriever가 places 컬렉션 버전 스탬프 변경 시 전체 재생성 후 교체
+"""
+
+import threading
+from typing import Any, Iterable
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from app.core.retrieval.place_score import _parse_payload_coordinates
+from app.utils.place_id import get_place_id_from_point
+
+EARTH_RADIUS_KM = 6371.0
+# 좌표 파싱에 필요한 payload 필드만 scroll
+SPATIAL_PAYLOAD_FIELDS = [
+    "geo", "lat", "lng", "mapx", "mapy", "latitude", "longitude",
+    "contenttypeid", "category",
+]
+
+
+def _to_unit_xyz(lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+    lat_r = np.radians(np.asarray(lats, dtype=np.float64))
+    lng_r = np.radians(np.asarray(lngs, dtype=np.float64))
+    cos_lat = np.cos(lat_r)
+    return np.column_stack([cos_lat * np.cos(lng_r), cos_lat * np.sin(lng_r), np.sin(lat_r)])
+
+
+def _chord_to_km(chord: np.ndarray) -> np.ndarray:
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.minimum(1.0, np.asarray(chord) / 2.0))
+
+
+def _km_to_chord(km: float) -> float:
+    return 2.0 * float(np.sin(min(float(km), np.pi * EARTH_RADIUS_KM) / (2.0 * EARTH_RADIUS_KM)))
+
+
+def _payload_category(payload: dict[str, Any]) -> str:
+    return str(payload.get("contenttypeid") or payload.get("category") or "").strip()
+
+
+class SpatialIndex:
+    """place id → (lat, lng, category) 공간 색인. 생성 후 불변, 조회는 thread-safe (category 트리 lazy 생성만 lock)."""
+
+    def __init__(self, records: Iterable[tuple[int, float, float, str]] = ()):
+        self._lock = threading.RLock()
+        self._build(list(records))
+
+    @classmethod
+    def from_payloads(cls, records: Iterable[tuple[int, dict[str, Any]]]) -> "SpatialIndex":
+        """(place id, payload) → 좌표 있는 장소만 색인. 좌표 파싱은 scorer와 같은 규칙 사용."""
+        rows = []
+        for pid, payload in records:
+            lat, lng = _parse_payload_coordinates(payload or {})
+            if lat is not None and lng is not None:
+                rows.append((int(pid), lat, lng, _payload_category(payload or {})))
+        return cls(rows)
+
+    def _build(self, rows: list[tuple[int, float, float, str]]) -> None:
+        rows = sorted(rows, key=lambda r: r[0])
+        self._ids = np.asarray([r[0] for r in rows], dtype=np.int64)
+        self._lats = np.asarray([r[1] for r in rows], dtype=np.float64)
+        self._lngs = np.asarray([r[2] for r in rows], dtype=np.float64)
+        self._categories = [r[3] for r in rows]
+        self._row_by_id = {int(pid): row for row, pid in enumerate(self._ids.tolist())}
+        self._xyz = _to_unit_xyz(self._lats, self._lngs) if rows else np.zeros((0, 3))
+        self._tree = cKDTree(self._xyz) if rows else None
+        self._category_trees: dict[str, tuple[cKDTree, np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def coordinates(self, pids: Iterable[int]) -> tuple[np.ndarray, np.ndarray]:
+        """place id 목록 → (lats, lngs). 색인에 없으면 NaN."""
+        pids = list(pids)
+        lats = np.full(len(pids), np.nan, dtype=np.float64)
+        lngs = np.full(len(pids), np.nan, dtype=np.float64)
+        for i, pid in enumerate(pids):
+            row = self._row_by_id.get(pid)
+            if row is not None:
+                lats[i], lngs[i] = self._lats[row], self._lngs[row]
+        return lats, lngs
+
+    def _category_tree(self, categories: frozenset[str]) -> tuple[cKDTree | None, np.ndarray]:
+        key = "\x1f".join(sorted(categories))
+        cached = self._category_trees.get(key)
+        if cached is None:
+            rows = np.asarray(
+                [row for row, cat in enumerate(self._categories) if cat in categories], dtype=np.int64
+            )
+            tree = cKDTree(self._xyz[rows]) if len(rows) else None
+            cached = (tree, rows)
+            self._category_trees[key] = cached
+        return cached
+
+    def search(
+        self,
+        lat: float,
+        lng: float,
+        k: int,
+        radius_km: float | None = None,
+        categories: Iterable[str] | None = None,
+    ) -> list[tuple[int, float]]:
+        """
+        (lat, lng)에서 가까운 순 최대 k개 [(place id, 거리 km)].
+        radius_km가 있으면 반경 안만, categories가 있으면 해당 category만.
+        """
+        k = int(k or 0)
+        if k <= 0:
+            return []
+        wanted = frozenset(c for c in (categories or []) if c)
+        center = _to_unit_xyz([lat], [lng])[0]
+        bound = _km_to_chord(radius_km) if radius_km is not None else np.inf
+
+        with self._lock:
+            if wanted:
+                tree, rows = self._category_tree(wanted)
+            else:
+                tree, rows = self._tree, None
+
+        top: list[tuple[float, int]] = []
+        if tree is not None and tree.n:
+            # 경계값 부동소수 오차 여유 → 최종 km 비교로 다시 거름
+            dists, idx = tree.query(center, k=min(k, tree.n), distance_upper_bound=bound * (1 + 1e-12))
+            dists, idx = np.atleast_1d(dists), np.atleast_1d(idx)
+            keep = np.isfinite(dists)
+            for chord, i in zip(dists[keep].tolist(), idx[keep].tolist()):
+                row = int(rows[i]) if rows is not None else int(i)
+                top.append((chord, int(self._ids[row])))
+
+        distances = _chord_to_km([chord for chord, _ in top]) if top else []
+        results = [(pid, float(dist)) for (_, pid), dist in zip(top, np.atleast_1d(distances))]
+        if radius_km is not None:
+            results = [(pid, dist) for pid, dist in results if dist <= radius_km]
+        return results
+
+
+def build_from_qdrant(client, collection_name: str, scroll_limit: int = 1000) -> SpatialIndex:
+    """동기 QdrantClient로 좌표 관련 payload 필드만 scroll해서 공간 색인 생성. (startup / 갱신용)"""
+    records: list[tuple[int, dict]] = []
+    offset = None
+    while True:
+        points, offset = client.scroll(
+            collection_name=collection_name,
+            limit=scroll_limit,
+            offset=offset,
+            with_payload=SPATIAL_PAYLOAD_FIELDS,
+            with_vectors=False,
+        )
+        for point in points:
+            pid = get_place_id_from_point(point, prefer_payload=False, fallback_to_point_id=True)
+            if not pid.isdigit() or int(pid) <= 0:
+                continue
+            records.append((int(pid), point.payload or {}))
+        if offset is None:
+            break
+    index = SpatialIndex.from_payloads(records)
+    print(f"[INFO] spatial index build: collection={collection_name} points={len(records)} indexed={len(index)}")
+    return index
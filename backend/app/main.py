@@ -15,6 +15,9 @@ from app.api import auth, users, chat, prefer, common, explore, reservations, di
 # 모델 등록 (Base.metadata에 포함되도록 import)
 from app.models import user, chat as chat_model, country, hot_place, reservation, diary
 from app.core.retrieval.place import PlaceRetriever
+from app.utils.image_loader import ImageLoader
+from app.utils.description_cache import DescriptionCache
+from app.agents.speculative import speculation_stats
 from app.core.llm_factory import LLMFactory
 from app.utils.error_handler import (
     AppException,
@@ -48,6 +51,8 @@ async def lifespan(app: FastAPI):
     yield
     # 서버 종료 시 실행될 로직
     print("[INFO] Shutting down...")
+    if PlaceRetriever._instance is not None:
+        await PlaceRetriever._instance.aclose()
 
 app = FastAPI(lifespan=lifespan)
 app.add_exception_handler(AppException, app_exception_handler)
@@ -136,3 +141,23 @@ def read_root():
 @app.get("/api/healthz")
 def healthz():
     return {"status": "ok"}
+
+
+@app.get("/api/metrics/retrieval")
+def retrieval_metrics():
+    """검색 캐시 통계 (결과 캐시 hit rate / 절약 시간, 의미 유사 query 캐시, embedding 캐시, 장소 feature / payload 캐시, 이미지 / 설명 캐시, 추측 검색)."""
+    retriever = PlaceRetriever._instance
+    if retriever is None:
+        return {"status": "not_ready"}
+    return {
+        "status": "ok",
+        "search_cache": retriever.search_cache.stats() if retriever.search_cache is not None else None,
+        "semantic_cache": retriever.semantic_cache.stats() if retriever.semantic_cache is not None else None,
+        "embedding_cache": retriever.embedding_cache.stats(),
+        "place_features": retriever.place_features.stats(),
+        "place_payloads": retriever.place_payloads.stats(),
+        "photo_url_index": retriever.photo_url_index.stats() if retriever.photo_url_index is not None else None,
+        "image_loader": ImageLoader.get_instance().stats(),
+        "image_descriptions": DescriptionCache._instance.stats() if DescriptionCache._instance is not None else None,
+        "speculative_search": speculation_stats(),
+    }
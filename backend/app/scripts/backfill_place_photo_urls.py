@@ -0,0 +1,76 @@
+"""
+기존 places 포인트에 대표 사진 URL 목록(photo_urls)을 채운다. (contentid → 사진 URL 색인용)
+photos 컬렉션을 contentid별로 한 번 scroll해서 모은 뒤 places payload에 batch set_payload.
+완료 후 컬렉션 버전을 올려 서버 검색 캐시를 무효화한다. (서버 색인은 재시작 시 로드)
+
+# cd backend
+# docker exec -it skn21-final-2team-backend-1 python -m app.scripts.backfill_place_photo_urls [--dry-run]
+"""
+
+import argparse
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from qdrant_client import QdrantClient
+from qdrant_client.models import SetPayload, SetPayloadOperation
+
+from app.core.retrieval.place_score import _to_positive_int
+from app.core.retrieval.photo_urls import PHOTO_URLS_FIELD, select_photo_urls
+from app.utils.collection_version import bump_collection_version
+from app.utils.config import PHOTOS_COLLECTION, PLACES_COLLECTION, PLACE_PHOTO_URLS_MAX
+
+
+def collect_photo_urls(client: QdrantClient, scroll_limit: int = 1000) -> dict[int, list[str]]:
+    """photos 전체 scroll → place id별 사진 URL 목록 (적재 순서 유지)."""
+    urls_by_place: dict[int, list[str]] = {}
+    offset = None
+    while True:
+        points, offset = client.scroll(
+            collection_name=PHOTOS_COLLECTION,
+            limit=scroll_limit,
+            offset=offset,
+            with_payload=["contentid", "image_url", "image"],
+            with_vectors=False,
+        )
+        for point in points:
+            payload = point.payload or {}
+            pid = _to_positive_int(payload.get("contentid"))
+            url = payload.get("image_url") or payload.get("image")
+            if pid is not None and url:
+                urls_by_place.setdefault(pid, []).append(url)
+        if offset is None:
+            break
+    return {pid: select_photo_urls(urls, PLACE_PHOTO_URLS_MAX) for pid, urls in urls_by_place.items()}
+
+
+def backfill_place_photo_urls(client: QdrantClient, batch_size: int = 256, dry_run: bool = False) -> dict[str, int]:
+    urls_by_place = {pid: urls for pid, urls in collect_photo_urls(client).items() if urls}
+    items = list(urls_by_place.items())
+    for start in range(0, len(items), batch_size):
+        operations = [
+            SetPayloadOperation(set_payload=SetPayload(payload={PHOTO_URLS_FIELD: urls}, points=[pid]))
+            for pid, urls in items[start:start + batch_size]
+        ]
+        if not dry_run:
+            client.batch_update_points(collection_name=PLACES_COLLECTION, update_operations=operations, wait=True)
+        print(f"  - Progress: {min(start + batch_size, len(items))}/{len(items)} places")
+    return {"places": len(items), "urls": sum(len(urls) for urls in urls_by_place.values())}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="places payload 대표 사진 URL(photo_urls) backfill")
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--dry-run", action="store_true", help="대상 수만 출력")
+    args = parser.parse_args()
+
+    host = os.getenv("QDRANT_HOST", "localhost")
+    port = int(os.getenv("QDRANT_PORT", "6333"))
+    client = QdrantClient(host=host, port=port, timeout=600)
+
+    stats = backfill_place_photo_urls(client, batch_size=args.batch_size, dry_run=args.dry_run)
+    print(f"[INFO] place photo_urls backfill {'(dry-run) ' if args.dry_run else ''}done: {stats}")
+    if not args.dry_run and stats["places"]:
+        bump_collection_version(PLACES_COLLECTION)
@@ -0,0 +1,24 @@
+"""
+places 컬렉션 전체로 코퍼스 lexical 역색인(bm25_lexical 채널)을 재빌드한다.
+
+# cd backend
+# docker exec -it skn21-final-2team-backend-1 python -m app.scripts.build_lexical_index
+"""
+
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from qdrant_client import QdrantClient
+
+from app.core.retrieval.lexical_index import build_from_qdrant
+from app.utils.config import LEXICAL_INDEX_DIR, PLACES_COLLECTION
+
+
+if __name__ == "__main__":
+    host = os.getenv("QDRANT_HOST", "localhost")
+    port = int(os.getenv("QDRANT_PORT", "6333"))
+    client = QdrantClient(host=host, port=port, timeout=600)
+    build_from_qdrant(client, PLACES_COLLECTION).save(LEXICAL_INDEX_DIR)
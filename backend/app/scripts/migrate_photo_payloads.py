@@ -0,0 +1,78 @@
+"""
+photos 컬렉션 기존 포인트의 payload를 경량 payload(contentid / contenttypeid / image_url / geo)로 일괄 재작성한다.
+벡터는 그대로 두고 payload만 overwrite (batch_update_points로 batch당 요청 1회).
+
+기존 포인트에는 사진별 URL이 없으므로(장소 payload 전체가 복사되어 있음)
+image_url은 기존 payload의 image_url → image(장소 대표 이미지) 순으로 채운다.
+완료 후 컬렉션 버전을 올려 서버 검색 캐시를 무효화한다.
+
+# cd backend
+# docker exec -it skn21-final-2team-backend-1 python -m app.scripts.migrate_photo_payloads [--dry-run]
+"""
+
+import argparse
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from qdrant_client import QdrantClient
+from qdrant_client.models import OverwritePayloadOperation, SetPayload
+
+from app.core.retrieval.place_payloads import PHOTO_PAYLOAD_FIELDS, slim_photo_payload
+from app.utils.collection_version import bump_collection_version
+from app.utils.config import PHOTOS_COLLECTION
+
+
+def migrate_photo_payloads(client: QdrantClient, batch_size: int = 256, dry_run: bool = False) -> dict[str, int]:
+    """photos 전체 scroll → PHOTO_PAYLOAD_FIELDS 외 필드가 있는 포인트만 batch overwrite."""
+    stats = {"scanned": 0, "rewritten": 0}
+    offset = None
+    while True:
+        points, offset = client.scroll(
+            collection_name=PHOTOS_COLLECTION,
+            limit=batch_size,
+            offset=offset,
+            with_payload=True,
+            with_vectors=False,
+        )
+        operations = []
+        for point in points:
+            payload = point.payload or {}
+            stats["scanned"] += 1
+            if set(payload) <= set(PHOTO_PAYLOAD_FIELDS):
+                continue
+            slim = slim_photo_payload(payload, payload.get("image_url") or payload.get("image"))
+            operations.append(
+                OverwritePayloadOperation(overwrite_payload=SetPayload(payload=slim, points=[point.id]))
+            )
+        if operations and not dry_run:
+            client.batch_update_points(collection_name=PHOTOS_COLLECTION, update_operations=operations, wait=True)
+        stats["rewritten"] += len(operations)
+        print(f"  - Progress: scanned={stats['scanned']} rewritten={stats['rewritten']}")
+        if offset is None:
+            break
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="photos payload 경량화 마이그레이션")
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--dry-run", action="store_true", help="재작성 대상 수만 출력")
+    args = parser.parse_args()
+
+    host = os.getenv("QDRANT_HOST", "localhost")
+    port = int(os.getenv("QDRANT_PORT", "6333"))
+    client = QdrantClient(host=host, port=port, timeout=600)
+
+    stats = migrate_photo_payloads(client, batch_size=args.batch_size, dry_run=args.dry_run)
+    print(f"[INFO] photos payload migration {'(dry-run) ' if args.dry_run else ''}done: {stats}")
+
+    if not args.dry_run and stats["rewritten"]:
+        # 경량 payload에 없는 필드의 payload index 정리
+        try:
+            client.delete_payload_index(PHOTOS_COLLECTION, "addr_tokens")
+        except Exception as e:
+            print(f"[WARN] addr_tokens payload index delete skipped: {e}")
+        bump_collection_version(PHOTOS_COLLECTION)
@@ -5,6 +5,7 @@ import json
 import re
 import hashlib
 from collections import Counter
+import numpy as np
 from PIL import Image
 from dotenv import load_dotenv
 
@@ -132,6 +133,25 @@ def build_sparse_vector(text: str) -> tuple[list[int], list[float]]:
     return [idx for idx, _ in items], [val for _, val in items]
 
 
+def aggregate_image_vectors(vectors, method: str = "mean") -> np.ndarray | None:
+    """
+    장소의 사진 CLIP 벡터들 → 대표 벡터 1개 (places.img_vec_agg). 사진이 없으면 None.
+    - mean: 사진별 L2 정규화 후 평균 → 재정규화 (cosine 공간 centroid)
+    - medoid: 다른 사진들과 cosine 합이 가장 큰 실제 사진 벡터 (이질적인 사진 1장의 영향이 적음)
+    """
+    if vectors is None or len(vectors) == 0:
+        return None
+    mat = np.asarray(vectors, dtype=np.float32).reshape(len(vectors), -1)
+    norms = np.linalg.norm(mat, axis=1, keepdims=True)
+    mat = mat / np.where(norms > 0, norms, 1.0)
+    if method == "medoid":
+        agg = mat[int(np.argmax((mat @ mat.T).sum(axis=1)))]
+    else:
+        agg = mat.mean(axis=0)
+    norm = float(np.linalg.norm(agg))
+    return agg / norm if norm > 0 else agg
+
+
 def enrich_payload_geo_and_addr_tokens(payload: dict) -> dict:
     lat = _safe_float(payload.get("mapy"))
     lng = _safe_float(payload.get("mapx"))
@@ -12,9 +12,9 @@ from qdrant_client.models import (
     PayloadSchemaType, HnswConfigDiff, OptimizersConfigDiff,
     SparseVectorParams, SparseIndexParams, SparseVector,
 )
-from sentence_transformers import SentenceTransformer
 
 from app.scripts.preprocess_data import (
+    aggregate_image_vectors,
     download_image,
     enrich_payload_geo_and_addr_tokens,
     build_sparse_text,
@@ -23,6 +23,11 @@ from app.scripts.preprocess_data import (
 )
 
 from app.utils.config import *
+from app.core.retrieval.model_loader import load_sentence_model
+from app.core.retrieval.lexical_index import build_from_qdrant
+from app.core.retrieval.place_payloads import slim_photo_payload
+from app.core.retrieval.photo_urls import PHOTO_URLS_FIELD, select_photo_urls
+from app.utils.collection_version import bump_collection_version
 from app.scripts.preprocess_data import ingest_data
 
 # CLIPProcessor가 자동으로 resize / center crop / normalize 수행
@@ -40,12 +45,21 @@ class QdrantClientDB:
 
         print("==== QdrantClientDB get env load")
         # Load specialized models
-        self.text_model = SentenceTransformer(TEXT_MODEL, device=DEVICE)
-        self.vision_model = SentenceTransformer(VISION_MODEL, device=DEVICE)
+        # 서버 검색과 같은 backend로 인덱싱 (INFERENCE_BACKEND 참고)
+        self.text_model = load_sentence_model(TEXT_MODEL, TEXT_INFERENCE_BACKEND)
+        self.vision_model = load_sentence_model(VISION_MODEL, VISION_INFERENCE_BACKEND, onnx_supported=False)
         
         print(f"[INFO] Models loaded on {DEVICE}")
         if setup_collections:
             self.ensure_collections()
+        # popup 모드로 재생성 전 스키마 컬렉션에 추가하는 경우 img_vec_agg 없이 저장
+        self.place_image_vector = self._has_place_image_vector()
+
+    def _has_place_image_vector(self) -> bool:
+        if not self.client.collection_exists(PLACES_COLLECTION):
+            return False
+        vectors = self.client.get_collection(PLACES_COLLECTION).config.params.vectors
+        return isinstance(vectors, dict) and PLACE_IMAGE_VECTOR_NAME in vectors
 
     # Qdrant schema
     def ensure_collections(self):
@@ -56,7 +70,12 @@ class QdrantClientDB:
 
         self.client.create_collection(
             collection_name=PLACES_COLLECTION,
-            vectors_config=VectorParams(size=TEXT_VECTOR_SIZE, distance=Distance.COSINE, on_disk=True),
+            vectors_config={
+                # 기본(이름 없는) 벡터: BGE-M3 text
+                "": VectorParams(size=TEXT_VECTOR_SIZE, distance=Distance.COSINE, on_disk=True),
+                # 장소별 사진 CLIP 벡터 집계 (text_to_image 채널)
+                PLACE_IMAGE_VECTOR_NAME: VectorParams(size=VISION_VECTOR_SIZE, distance=Distance.COSINE, on_disk=True),
+            },
             sparse_vectors_config={
                 "text_sparse": SparseVectorParams(
                     index=SparseIndexParams(on_disk=True)
@@ -76,7 +95,7 @@ class QdrantClientDB:
         self.client.create_payload_index(PLACES_COLLECTION, "geo", PayloadSchemaType.GEO)
         self.client.create_payload_index(PLACES_COLLECTION, "addr_tokens", PayloadSchemaType.KEYWORD)
         
-        # 2) photos: image vector only
+        # 2) photos: image vector + 경량 payload (contentid / contenttypeid / image_url / geo)
         if self.client.collection_exists(PHOTOS_COLLECTION):
             self.client.delete_collection(PHOTOS_COLLECTION)
 
@@ -96,7 +115,6 @@ class QdrantClientDB:
         self.client.create_payload_index(PHOTOS_COLLECTION, "contenttypeid", PayloadSchemaType.KEYWORD)
         self.client.create_payload_index(PHOTOS_COLLECTION, "contentid", PayloadSchemaType.KEYWORD)
         self.client.create_payload_index(PHOTOS_COLLECTION, "geo", PayloadSchemaType.GEO)
-        self.client.create_payload_index(PHOTOS_COLLECTION, "addr_tokens", PayloadSchemaType.KEYWORD)
 
     # 장소 저장
     # - description -> places.text_vec (BGE-M3)
@@ -118,6 +136,8 @@ class QdrantClientDB:
             image_urls.append(image)
 
         photo_points = []
+        img_vecs = []
+        photo_urls = []
 
         for url in image_urls:
             img = download_image(url)
@@ -126,18 +146,26 @@ class QdrantClientDB:
 
             # Explicitly use CLIP for images
             img_vec = self.vision_model.encode(img).astype(np.float32)
-            
+            img_vecs.append(img_vec)
+            photo_urls.append(url)
+
             photo_points.append(
                 PointStruct(
                     id=str(uuid.uuid4()),  # 고유 UUID 사용
                     vector=img_vec.tolist(),
-                    payload=payload,
+                    # 장소 문서는 places에만 저장 (검색 결과는 places payload로 late hydration)
+                    payload=slim_photo_payload(payload, url),
                 )
             )
 
         if len(photo_points) > 0:
             self.client.upsert(collection_name=PHOTOS_COLLECTION, points=photo_points)
 
+        # 대표 사진 URL 목록 → places payload (서버 contentid → 사진 URL 색인용)
+        place_photo_urls = select_photo_urls(photo_urls, PLACE_PHOTO_URLS_MAX)
+        if place_photo_urls:
+            payload[PHOTO_URLS_FIELD] = place_photo_urls
+
         # [Text] : Place Collection ================================
         # 3) places upsert (named vectors)
         text_vec = self.text_model.encode(llm_text).astype(np.float32)
@@ -150,6 +178,10 @@ class QdrantClientDB:
         vector_payload = {"": text_vec.tolist()}
         if sparse_indices and sparse_values:
             vector_payload["text_sparse"] = SparseVector(indices=sparse_indices, values=sparse_values)
+        # 사진 벡터 집계 → places.img_vec_agg (사진 없는 장소는 생략 → text_to_image 검색 대상에서 제외)
+        img_vec_agg = aggregate_image_vectors(img_vecs, PLACE_IMAGE_AGG_METHOD)
+        if img_vec_agg is not None and self.place_image_vector:
+            vector_payload[PLACE_IMAGE_VECTOR_NAME] = img_vec_agg.tolist()
 
         place_point = PointStruct(
             id=contentid,
@@ -247,3 +279,10 @@ if __name__ == "__main__":
         #     client.add_popup_places(popup_path)
         # else:
         #     print(f"[WARN] 팝업스토어 파일 없음, 건너뜀: {popup_path}")
+
+    # [STEP 3] 컬렉션 버전 갱신 → 서버 search_hybrid 결과 캐시 무효화
+    bump_collection_version(PLACES_COLLECTION, PHOTOS_COLLECTION)
+
+    # [STEP 4] 코퍼스 lexical 역색인 재빌드 (서버 bm25_lexical 채널용, 서버는 재시작 시 로드)
+    # 버전 갱신 후 빌드해야 meta의 source_version이 현재 버전과 일치
+    build_from_qdrant(client.client, PLACES_COLLECTION).save(LEXICAL_INDEX_DIR)
@@ -0,0 +1,53 @@
+"""
+collection_version.py — Qdrant 컬렉션 버전 스탬프
+
+ingestion 스크립트(qdrant_setup 등)가 컬렉션을 변경한 뒤 bump_collection_version()을 호출하면
+COLLECTION_VERSION_FILE의 버전이 바뀌고, 검색 결과 캐시가 이를 보고 무효화한다.
+같은 호스트/볼륨을 쓰는 서버 프로세스는 파일 mtime으로 변경을 감지한다.
+"""
+
+import json
+import os
+import threading
+import time
+
+from app.utils.config import COLLECTION_VERSION_FILE
+
+_lock = threading.Lock()
+_cached: dict[str, tuple[int, dict[str, str]]] = {}  # path -> (mtime_ns, versions)
+
+
+def get_collection_versions(path: str = COLLECTION_VERSION_FILE) -> dict[str, str]:
+    """{컬렉션명: 버전}. 파일이 없으면 {} (mtime이 같으면 다시 읽지 않음)."""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return {}
+    with _lock:
+        cached = _cached.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+    try:
+        with open(path, encoding="utf-8") as f:
+            versions = {str(k): str(v) for k, v in json.load(f).items()}
+    except (OSError, ValueError) as e:
+        print(f"[WARN] collection version file unreadable: {e}")
+        return {}
+    with _lock:
+        _cached[path] = (mtime, versions)
+    return versions
+
+
+def bump_collection_version(*collections: str, path: str = COLLECTION_VERSION_FILE) -> dict[str, str]:
+    """지정 컬렉션 버전을 현재 시각(ns)으로 갱신. tmp 파일 → rename으로 원자적 교체."""
+    versions = dict(get_collection_versions(path))
+    stamp = str(time.time_ns())
+    for name in collections:
+        versions[name] = stamp
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(versions, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+    print(f"[INFO] collection version bumped: {', '.join(collections)} -> {stamp}")
+    return versions
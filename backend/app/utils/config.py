@@ -20,6 +20,13 @@ VECTOR_SIZE = 768 # Standardizing to vision size for now or keep for legacy refe
 PLACES_COLLECTION = "places"
 PHOTOS_COLLECTION = "photos"
 
+# places 장소별 대표 이미지 벡터 (사진 CLIP 벡터 집계: mean=정규화 평균 / medoid=대표 사진)
+# text_to_image 채널이 PHOTOS(사진 단위 hit → 장소 중복 제거) 대신 PLACES를 장소당 1 hit로 조회.
+# 컬렉션에 named vector가 없으면(재생성 전 스키마) 기존 PHOTOS 조회로 fallback.
+PLACE_IMAGE_VECTOR_NAME = "img_vec_agg"
+PLACE_IMAGE_AGG_METHOD = os.getenv("PLACE_IMAGE_AGG_METHOD", "mean").lower()
+ENABLE_PLACE_IMAGE_VECTOR = os.getenv("ENABLE_PLACE_IMAGE_VECTOR", "true").lower() == "true"
+
 # Agent
 RETRIEVAL_PROFILE = os.getenv("RETRIEVAL_PROFILE", "serving").lower()
 
@@ -76,6 +83,16 @@ CANDIDATE_LIMIT_MULTIPLIER = int(os.getenv("CANDIDATE_LIMIT_MULTIPLIER", "3"))
 # 10km로 줄이면 시내 이동 범위에 집중.
 GEO_PROXIMITY_RADIUS_KM = float(os.getenv("GEO_PROXIMITY_RADIUS_KM", "10.0"))
 
+# landmark geo filter 반경 단계 (progressive radius)
+# anchor 반경 r에 GEO_RADIUS_LADDER 배수를 곱한 단계 → GEO_LADDER_CITY_RADIUS_M(시 단위) → geo 없음 순으로
+# 모든 단계를 한 번에(같은 batch로) 조회하고, 후보가 GEO_LADDER_MIN_CANDIDATES(limit 이하) 이상인 첫 단계를 사용.
+# GEO_LADDER_CITY_RADIUS_M=0이면 시 단위 단계 생략.
+GEO_RADIUS_LADDER = [
+    float(x) for x in os.getenv("GEO_RADIUS_LADDER", "1,2").split(",") if x.strip()
+]
+GEO_LADDER_CITY_RADIUS_M = float(os.getenv("GEO_LADDER_CITY_RADIUS_M", "15000"))
+GEO_LADDER_MIN_CANDIDATES = int(os.getenv("GEO_LADDER_MIN_CANDIDATES", "5"))
+
 # 점수 정규화 기준값 — 결과 필드를 [0.0, 1.0] 범위로 표시하기 위한 참조 최대값
 # RRF_SCORE_MAX : first_stage_score 상한 (모든 채널이 동시에 1위인 이론적 최대)
 # FUSED_SCORE_MAX: score 상한 (first_stage_score 최대 + BOOST_WEIGHT * 최대 boost)
@@ -83,3 +100,190 @@ GEO_PROXIMITY_RADIUS_KM = float(os.getenv("GEO_PROXIMITY_RADIUS_KM", "10.0"))
 RRF_SCORE_MAX   = 0.08
 FUSED_SCORE_MAX = 0.20
 MAX_BOOST_SUM   = 0.65
+
+# 검색 채널 동시 실행 timeout (초)
+# 채널 하나가 지연되면 해당 채널만 버리고 나머지 채널 결과로 융합한다.
+# image_emotional은 GPT-4o-mini 이미지 설명 호출을 포함하므로 별도 상한을 둔다.
+CHANNEL_TIMEOUT_S = float(os.getenv("CHANNEL_TIMEOUT_S", "5.0"))
+IMAGE_EMOTIONAL_CHANNEL_TIMEOUT_S = float(os.getenv("IMAGE_EMOTIONAL_CHANNEL_TIMEOUT_S", "20.0"))
+# 이미지 설명(describe_image) 대기 deadline (초, 검색 시작 시점부터)
+# 설명은 CLIP / text 채널과 동시에 시작하고, deadline 안에 오면 image_emotional 채널로 융합.
+# 넘기면 이번 턴은 설명 없이 응답하고 설명 호출은 백그라운드에서 마저 끝나 영속 캐시에 저장됨.
+IMAGE_DESCRIPTION_DEADLINE_S = float(os.getenv("IMAGE_DESCRIPTION_DEADLINE_S", "8.0"))
+
+# Query embedding 캐시 (BGE-M3 / CLIP text)
+# 같은 턴 내 geo fallback 재검색, 사용자 간 반복 query("성수 카페" 등)의 CPU encode 생략.
+EMBEDDING_CACHE_MAX_SIZE = int(os.getenv("EMBEDDING_CACHE_MAX_SIZE", "2048"))
+EMBEDDING_CACHE_TTL_S = float(os.getenv("EMBEDDING_CACHE_TTL_S", "3600"))
+
+# 요청 간 dynamic micro-batching (encode / rerank)
+# 동시 요청의 단건 encode를 최대 ENCODE_BATCH_MAX_WAIT_MS 동안 모아 batch 1회로 실행.
+ENABLE_ENCODE_BATCHING = os.getenv("ENABLE_ENCODE_BATCHING", "true").lower() == "true"
+ENCODE_BATCH_MAX_SIZE = int(os.getenv("ENCODE_BATCH_MAX_SIZE", "16"))
+ENCODE_BATCH_MAX_WAIT_MS = float(os.getenv("ENCODE_BATCH_MAX_WAIT_MS", "5"))
+RERANK_BATCH_MAX_SIZE = int(os.getenv("RERANK_BATCH_MAX_SIZE", "128"))
+
+# Qdrant batch query
+# 채널/쿼리(itinerary 항목)별 query_points 대신, 같은 시점에 제출된 요청을
+# collection 단위 query_batch_points 1회로 묶어 round trip 수를 줄인다.
+ENABLE_QDRANT_BATCH_QUERY = os.getenv("ENABLE_QDRANT_BATCH_QUERY", "true").lower() == "true"
+QDRANT_BATCH_MAX_SIZE = int(os.getenv("QDRANT_BATCH_MAX_SIZE", "32"))
+QDRANT_BATCH_MAX_WAIT_MS = float(os.getenv("QDRANT_BATCH_MAX_WAIT_MS", "2"))
+QDRANT_BATCH_MAX_IN_FLIGHT = int(os.getenv("QDRANT_BATCH_MAX_IN_FLIGHT", "4"))
+
+# Qdrant async client (서버 검색 경로)
+# 검색 경로는 AsyncQdrantClient로 event loop에서 직접 await → 기본 thread pool 점유 없음.
+# 동기 QdrantClient는 스크립트/평가용으로 유지.
+# QDRANT_PREFER_GRPC=true면 gRPC(QDRANT_GRPC_PORT) 사용, 아니면 REST(httpx 커넥션 풀).
+QDRANT_PREFER_GRPC = os.getenv("QDRANT_PREFER_GRPC", "false").lower() == "true"
+QDRANT_GRPC_PORT = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
+QDRANT_TIMEOUT_S = int(os.getenv("QDRANT_TIMEOUT_S", "10"))
+QDRANT_POOL_MAX_CONNECTIONS = int(os.getenv("QDRANT_POOL_MAX_CONNECTIONS", "64"))
+QDRANT_POOL_MAX_KEEPALIVE = int(os.getenv("QDRANT_POOL_MAX_KEEPALIVE", "32"))
+
+# 추론 backend (embedder / reranker)
+# - torch     : 기존 PyTorch fp32
+# - onnx      : ONNX Runtime fp32 (BGE-M3, reranker). CLIP은 ONNX 미지원 → torch fp32 유지
+# - onnx-int8 : ONNX Runtime dynamic int8 (BGE-M3, reranker) + CLIP은 torch dynamic int8 (CPU)
+# 모델별로 다르게 쓰려면 TEXT_/VISION_/RERANK_INFERENCE_BACKEND로 개별 지정.
+# onnx 계열은 optimum[onnxruntime] 필요. 로드 실패 시 torch로 fallback.
+RERANK_MODEL = os.getenv("RERANK_MODEL", "cross-encoder/mmarco-mMiniLMv2-L12-H384-v1")
+INFERENCE_BACKEND = os.getenv("INFERENCE_BACKEND", "torch").lower()
+TEXT_INFERENCE_BACKEND = os.getenv("TEXT_INFERENCE_BACKEND", INFERENCE_BACKEND).lower()
+VISION_INFERENCE_BACKEND = os.getenv("VISION_INFERENCE_BACKEND", INFERENCE_BACKEND).lower()
+RERANK_INFERENCE_BACKEND = os.getenv("RERANK_INFERENCE_BACKEND", INFERENCE_BACKEND).lower()
+# int8 양자화 ONNX 파일 캐시 위치 / 양자화 대상 CPU 명령어셋 (arm64 | avx2 | avx512 | avx512_vnni)
+ONNX_MODEL_CACHE_DIR = os.getenv(
+    "ONNX_MODEL_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data", "onnx_models"),
+)
+ONNX_QUANTIZATION_CONFIG = os.getenv("ONNX_QUANTIZATION_CONFIG", "avx512_vnni")
+
+# 코퍼스 lexical 역색인 (bm25_lexical 독립 채널)
+# places 전체 BM25 역색인을 LEXICAL_INDEX_DIR에 저장하고 mmap 로드.
+# startup 시 인덱스가 없거나 places points 수와 다르면 LEXICAL_INDEX_BUILD_ON_STARTUP에 따라 재빌드.
+# 비활성화 시 기존 vector pool 재채점 BM25 사용.
+ENABLE_LEXICAL_INDEX = os.getenv("ENABLE_LEXICAL_INDEX", "true").lower() == "true"
+LEXICAL_INDEX_BUILD_ON_STARTUP = os.getenv("LEXICAL_INDEX_BUILD_ON_STARTUP", "true").lower() == "true"
+LEXICAL_INDEX_DIR = os.getenv(
+    "LEXICAL_INDEX_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data", "lexical_index"),
+)
+
+# 장소별 점수 feature 캐시 (contentid 기준 LRU)
+# boost 계산용 토큰 set / stem / 좌표 / rerank compact text를 장소당 1회만 계산.
+PLACE_FEATURE_CACHE_MAX_SIZE = int(os.getenv("PLACE_FEATURE_CACHE_MAX_SIZE", "20000"))
+
+# 장소 payload 캐시 (contentid 기준 LRU)
+# photos 포인트는 경량 payload만 저장 → photos 채널로만 회수된 후보를 이 캐시 / PLACES retrieve로 보강.
+PLACE_PAYLOAD_CACHE_MAX_SIZE = int(os.getenv("PLACE_PAYLOAD_CACHE_MAX_SIZE", "20000"))
+
+# search_hybrid first stage payload projection
+# 채널 조회는 fusion / boost / rerank에 필요한 필드(제목 / 주소 / 카테고리 / 좌표 / addr_tokens)만 가져오고,
+# 최종 limit개 결과만 장소 payload 캐시 / PLACES retrieve 1회로 전체 payload 보강.
+ENABLE_PAYLOAD_PROJECTION = os.getenv("ENABLE_PAYLOAD_PROJECTION", "true").lower() == "true"
+
+# 장소 대표 사진 URL 색인 (contentid → URL 목록)
+# 적재 시 places payload photo_urls에 최대 PLACE_PHOTO_URLS_MAX개 저장 → 서버 startup에 in-memory 색인으로 로드.
+# 색인이 비어 있으면(photo_urls 적재 전 컬렉션) 기존 photos scroll 조회로 fallback.
+ENABLE_PHOTO_URL_INDEX = os.getenv("ENABLE_PHOTO_URL_INDEX", "true").lower() == "true"
+PLACE_PHOTO_URLS_MAX = int(os.getenv("PLACE_PHOTO_URLS_MAX", "5"))
+
+# 이미지 로더 (describe_image / image_visual 채널 공용 비동기 다운로드 + decode + CLIP embedding 캐시)
+# 같은 턴 / 반복 이미지는 다운로드·decode·encode 1회. 캐시 키는 이미지 바이트 해시(content-addressed).
+IMAGE_FETCH_TIMEOUT_S = float(os.getenv("IMAGE_FETCH_TIMEOUT_S", "10"))
+IMAGE_MAX_BYTES = int(os.getenv("IMAGE_MAX_BYTES", str(10 * 1024 * 1024)))
+IMAGE_MAX_SIDE = int(os.getenv("IMAGE_MAX_SIDE", "1024"))  # decode 후 긴 변 상한 (CLIP 입력 224, LLM 설명용으로도 충분)
+IMAGE_CACHE_MAX_ENTRIES = int(os.getenv("IMAGE_CACHE_MAX_ENTRIES", "32"))
+IMAGE_POOL_MAX_CONNECTIONS = int(os.getenv("IMAGE_POOL_MAX_CONNECTIONS", "20"))
+
+# describe_image 결과 영속 캐시 (SQLite, 키: 이미지 바이트 sha1 + 프롬프트/모델 버전)
+# 같은 이미지(재업로드 / 인기 장소 사진 재공유)는 vision LLM 호출 없이 저장된 감성 설명 재사용.
+ENABLE_IMAGE_DESCRIPTION_CACHE = os.getenv("ENABLE_IMAGE_DESCRIPTION_CACHE", "true").lower() == "true"
+IMAGE_DESCRIPTION_CACHE_PATH = os.getenv(
+    "IMAGE_DESCRIPTION_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data", "cache", "image_descriptions.sqlite3"),
+)
+IMAGE_DESCRIPTION_CACHE_TTL_S = float(os.getenv("IMAGE_DESCRIPTION_CACHE_TTL_S", str(30 * 24 * 3600)))
+IMAGE_DESCRIPTION_CACHE_MAX_ENTRIES = int(os.getenv("IMAGE_DESCRIPTION_CACHE_MAX_ENTRIES", "50000"))
+
+# places 좌표 공간 색인 (search_nearby k-NN / 반경 검색, geo proximity 좌표 보강)
+# startup 시 Qdrant payload 좌표로 KD-tree 생성. places 컬렉션 버전 스탬프가 바뀌면 백그라운드에서 전체 재생성
+# (재생성 시도는 SPATIAL_INDEX_REFRESH_S마다 최대 1회).
+# 비활성화 시 기존 geo filter scroll 방식 사용.
+ENABLE_SPATIAL_INDEX = os.getenv("ENABLE_SPATIAL_INDEX", "true").lower() == "true"
+SPATIAL_INDEX_REFRESH_S = int(os.getenv("SPATIAL_INDEX_REFRESH_S", "600"))
+
+# search_hybrid 결과 캐시 (동일 요청 재사용)
+# 키: 정규화 query + categories + landmark anchor + 옵션 + retrieval 프로파일 + 사용자 좌표(SEARCH_CACHE_GRID_DEG 격자로 스냅)
+# TTL + LRU 크기 상한. ingestion 스크립트가 COLLECTION_VERSION_FILE의 컬렉션 버전을 올리면 전체 무효화.
+ENABLE_SEARCH_RESULT_CACHE = os.getenv("ENABLE_SEARCH_RESULT_CACHE", "true").lower() == "true"
+SEARCH_RESULT_CACHE_MAX_SIZE = int(os.getenv("SEARCH_RESULT_CACHE_MAX_SIZE", "512"))
+SEARCH_RESULT_CACHE_TTL_S = int(os.getenv("SEARCH_RESULT_CACHE_TTL_S", "600"))
+SEARCH_CACHE_GRID_DEG = float(os.getenv("SEARCH_CACHE_GRID_DEG", "0.005"))  # 약 500m
+COLLECTION_VERSION_FILE = os.getenv(
+    "COLLECTION_VERSION_FILE",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data", "collection_versions.json"),
+)
+
+# 의미 유사 query 캐시 (BGE-M3 query 임베딩 cosine ≥ SEMANTIC_CACHE_THRESHOLD + 같은 필터 서명이면 결과 재사용)
+# 이미지 검색 / 빈 query는 대상 아님. hit 중 SEMANTIC_CACHE_AUDIT_RATE 비율은 백그라운드로 전체 검색과 비교(ndcg@k)하고,
+# 최근 SEMANTIC_CACHE_MIN_AUDITS회 이상 평균이 SEMANTIC_CACHE_MIN_NDCG 미만이면 캐시 제공 중단.
+# 중단 후 컬렉션 버전이 바뀌거나 SEMANTIC_CACHE_DISABLE_COOLDOWN_S(0이면 버전 변경 시에만)가 지나면 audit을 비우고 재개.
+ENABLE_SEMANTIC_CACHE = os.getenv("ENABLE_SEMANTIC_CACHE", "true").lower() == "true"
+SEMANTIC_CACHE_MAX_SIZE = int(os.getenv("SEMANTIC_CACHE_MAX_SIZE", "512"))
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+SEMANTIC_CACHE_TTL_S = int(os.getenv("SEMANTIC_CACHE_TTL_S", "600"))
+SEMANTIC_CACHE_AUDIT_RATE = float(os.getenv("SEMANTIC_CACHE_AUDIT_RATE", "0.05"))
+SEMANTIC_CACHE_MIN_NDCG = float(os.getenv("SEMANTIC_CACHE_MIN_NDCG", "0.7"))
+SEMANTIC_CACHE_MIN_AUDITS = int(os.getenv("SEMANTIC_CACHE_MIN_AUDITS", "10"))
+SEMANTIC_CACHE_DISABLE_COOLDOWN_S = float(os.getenv("SEMANTIC_CACHE_DISABLE_COOLDOWN_S", "1800"))
+
+# intent LLM 호출과 병렬로 실행하는 추측(speculative) 검색
+# 턴 시작 시 원문 user_input + LLM 없이 추정한 slot(표준 장소명 / 카테고리 키워드)으로 search_hybrid를 먼저 시작.
+# intent 결과로 만든 검색 요청이 같으면(query / categories / location / scope) 결과 재사용, 다르면 취소.
+# 소비되지 않은 추측 검색은 SPECULATIVE_SEARCH_TTL_S 후 정리.
+ENABLE_SPECULATIVE_RETRIEVAL = os.getenv("ENABLE_SPECULATIVE_RETRIEVAL", "true").lower() == "true"
+SPECULATIVE_SEARCH_TTL_S = float(os.getenv("SPECULATIVE_SEARCH_TTL_S", "60"))
+
+# 사용자 좌표 → 도로명 주소 역지오코딩 캐시 (speculative 검색 / retriever 공용)
+# 좌표를 REVERSE_GEOCODE_GRID_DEG 격자로 스냅해 조회·캐싱 → 이동 중인 사용자도 같은 셀이면 재사용. 조회 실패는 캐싱하지 않음.
+REVERSE_GEOCODE_CACHE_MAX_SIZE = int(os.getenv("REVERSE_GEOCODE_CACHE_MAX_SIZE", "1024"))
+REVERSE_GEOCODE_CACHE_TTL_S = float(os.getenv("REVERSE_GEOCODE_CACHE_TTL_S", "86400"))
+REVERSE_GEOCODE_GRID_DEG = float(os.getenv("REVERSE_GEOCODE_GRID_DEG", "0.001"))  # 약 100m
+
+# 로컬 intent 분류기 fast path (BGE-M3 query 임베딩 + softmax 선형 head + 규칙 slot)
+# 분류 확률 ≥ INTENT_FAST_PATH_THRESHOLD이고 INTENT_FAST_PATH_INTENTS에 속하면 intent LLM 호출 생략.
+# 모델 파일(INTENT_CLASSIFIER_PATH)은 evaluation/train_intent_classifier.py로 INTENT_LOG_PATH 로그에서 학습. 파일이 없으면 항상 LLM.
+ENABLE_INTENT_FAST_PATH = os.getenv("ENABLE_INTENT_FAST_PATH", "true").lower() == "true"
+INTENT_CLASSIFIER_PATH = os.getenv(
+    "INTENT_CLASSIFIER_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data", "intent_classifier.npz"),
+)
+INTENT_FAST_PATH_THRESHOLD = float(os.getenv("INTENT_FAST_PATH_THRESHOLD", "0.9"))
+INTENT_FAST_PATH_INTENTS = tuple(
+    s.strip() for s in os.getenv("INTENT_FAST_PATH_INTENTS", "GENERAL,PLACE_INQUIRY").split(",") if s.strip()
+)
+# fast path 턴은 대화 요약(summary_message / summary_title)을 갱신하지 않음 → 다음 LLM 턴에서 밀린 메시지까지 포함해 갱신.
+# 연속 fast path 턴이 INTENT_FAST_PATH_MAX_SUMMARY_LAG에 도달하면 분류기 확신과 무관하게 LLM 호출 (요약 지연 상한)
+INTENT_FAST_PATH_MAX_SUMMARY_LAG = int(os.getenv("INTENT_FAST_PATH_MAX_SUMMARY_LAG", "2"))
+# intent LLM 결과 로그 (JSONL, 분류기 학습 데이터) — 사용자 원문 발화가 저장되므로 opt-in (기본 off)
+# 보관: INTENT_LOG_MAX_BYTES 초과 시 .1 ~ .INTENT_LOG_BACKUP_COUNT로 회전, 가장 오래된 파일은 삭제
+#       → worker당 최대 약 INTENT_LOG_MAX_BYTES × (INTENT_LOG_BACKUP_COUNT + 1) 보관
+ENABLE_INTENT_LOG = os.getenv("ENABLE_INTENT_LOG", "false").lower() == "true"
+INTENT_LOG_PATH = os.getenv(
+    "INTENT_LOG_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data", "logs", "intent_log.jsonl"),
+)
+INTENT_LOG_MAX_BYTES = int(os.getenv("INTENT_LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+INTENT_LOG_BACKUP_COUNT = int(os.getenv("INTENT_LOG_BACKUP_COUNT", "3"))
+
+# intent 프롬프트 표준 장소 후보 선별 (LANDMARK_DESC 전체 대신 관련 장소만 주입)
+# 점수: user_input / 최근 메시지(LANDMARK_CONTEXT_MESSAGES개, 오래될수록 감쇠)와 표준명·별칭 문자열 매칭
+#      + (ENABLE_LANDMARK_EMBEDDING_MATCH) BGE-M3 user_input ↔ 장소 설명 cosine ≥ LANDMARK_EMBEDDING_MIN_SIM
+# 상위 LANDMARK_PROMPT_TOP_N개만 주입. 목록 밖 장소명은 retriever의 normalize_location이 서버에서 정규화.
+ENABLE_LANDMARK_PRESELECT = os.getenv("ENABLE_LANDMARK_PRESELECT", "true").lower() == "true"
+LANDMARK_PROMPT_TOP_N = int(os.getenv("LANDMARK_PROMPT_TOP_N", "5"))
+LANDMARK_CONTEXT_MESSAGES = int(os.getenv("LANDMARK_CONTEXT_MESSAGES", "4"))
+ENABLE_LANDMARK_EMBEDDING_MATCH = os.getenv("ENABLE_LANDMARK_EMBEDDING_MATCH", "true").lower() == "true"
+LANDMARK_EMBEDDING_MIN_SIM = float(os.getenv("LANDMARK_EMBEDDING_MIN_SIM", "0.55"))
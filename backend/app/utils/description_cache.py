@@ -0,0 +1,109 @@
+"""
+description_cache.py — describe_image 결과 영속 캐시 (SQLite)
+
+이미지 첨부 턴마다 GPT-4o-mini vision 호출(수 초)로 감성 설명을 만들던 것을,
+(이미지 바이트 sha1 + 프롬프트 / 모델 버전) 키로 디스크에 저장해 같은 이미지는 재호출 없이 재사용한다.
+- 서버 재시작 / 여러 worker 간 공유 (SQLite WAL)
+- TTL 만료 항목은 조회 시 무시, 저장 시 정리
+- 항목 수 상한 초과 시 마지막 사용 시각이 오래된 것부터 삭제
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+from app.utils.config import (
+    IMAGE_DESCRIPTION_CACHE_MAX_ENTRIES,
+    IMAGE_DESCRIPTION_CACHE_PATH,
+    IMAGE_DESCRIPTION_CACHE_TTL_S,
+)
+
+
+def description_cache_key(image_digest: str, prompt: str, model: str) -> str:
+    """이미지 해시 + 프롬프트 / 모델 버전. 프롬프트나 모델이 바뀌면 자동으로 다른 키."""
+    version = hashlib.sha1(f"{model}\n{prompt}".encode("utf-8")).hexdigest()[:12]
+    return f"{image_digest}:{version}"
+
+
+class DescriptionCache:
+    """key → 설명 텍스트. thread-safe (연결 1개 + lock)."""
+
+    _instance = None
+
+    @classmethod
+    def get_instance(cls) -> "DescriptionCache":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(
+        self,
+        path: str = IMAGE_DESCRIPTION_CACHE_PATH,
+        ttl_s: float = IMAGE_DESCRIPTION_CACHE_TTL_S,
+        max_entries: int = IMAGE_DESCRIPTION_CACHE_MAX_ENTRIES,
+    ):
+        self.path = path
+        self.ttl_s = float(ttl_s)
+        self.max_entries = max(int(max_entries), 1)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5)
+        with self._lock:
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS image_descriptions ("
+                " key TEXT PRIMARY KEY, description TEXT NOT NULL,"
+                " created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_image_descriptions_accessed ON image_descriptions(accessed_at)"
+            )
+            self._conn.commit()
+
+    def _expired_before(self, now: float) -> float:
+        return now - self.ttl_s if self.ttl_s > 0 else float("-inf")
+
+    def get(self, key: str) -> str | None:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT description, created_at FROM image_descriptions WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] < self._expired_before(now):
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE image_descriptions SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, description: str) -> None:
+        if not description:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO image_descriptions (key, description, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?)",
+                (key, description, now, now),
+            )
+            self._conn.execute(
+                "DELETE FROM image_descriptions WHERE created_at < ?", (self._expired_before(now),)
+            )
+            self._conn.execute(
+                "DELETE FROM image_descriptions WHERE key IN ("
+                " SELECT key FROM image_descriptions ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM image_descriptions").fetchone()[0]
+        return {"size": size, "hits": self.hits, "misses": self.misses}
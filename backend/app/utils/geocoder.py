@@ -114,31 +114,128 @@ def _collapse_spaces(text: str) -> str:
     return re.sub(r"\s+", "", text).strip()
 
 
-def _lookup_landmark(text: str) -> Optional[NormalizedLocationResult]:
-    """canonical key / alias 순서로 LANDMARK_DICTIONARY 검색."""
-    # Step 3: canonical exact match
-    if text in LANDMARK_DICTIONARY:
-        entry = LANDMARK_DICTIONARY[text]
-        return NormalizedLocationResult(
-            raw=None,  # 호출자가 채움
-            normalized_location=text,
-            canonical_matched=True,
-            lat=entry["lat"],
-            lon=entry["lon"],
-            radius_m=entry["radius_m"],
-        )
-    # Step 4: alias exact match
+def _match_key(text: str) -> str:
+    """역색인 / 자동기계 공용 키: 공백 제거 + 소문자 (HBC / hbc 동일 취급)."""
+    return _collapse_spaces(text).lower()
+
+
+def _build_alias_index() -> Dict[str, str]:
+    """
+    표준명 / alias / 공백 제거형 → canonical key 역색인. 모듈 로드 시 1회 생성.
+    기존 조회 순서(canonical 우선 → 사전 순서대로 alias)를 유지하도록 먼저 등록된 값이 우선.
+    """
+    index: Dict[str, str] = {}
+    for canonical in LANDMARK_DICTIONARY:
+        index.setdefault(canonical, canonical)
     for canonical, entry in LANDMARK_DICTIONARY.items():
-        if text in entry.get("aliases", []):
-            return NormalizedLocationResult(
-                raw=None,
-                normalized_location=canonical,
-                canonical_matched=True,
-                lat=entry["lat"],
-                lon=entry["lon"],
-                radius_m=entry["radius_m"],
-            )
-    return None
+        for alias in entry.get("aliases", []):
+            index.setdefault(alias, canonical)
+    for name, canonical in list(index.items()):
+        index.setdefault(_match_key(name), canonical)
+    return index
+
+
+@dataclass
+class LandmarkMention:
+    canonical: str   # LANDMARK_DICTIONARY key
+    text: str        # 원문에서 매칭된 부분 (공백 포함 원형)
+    start: int       # 원문 offset
+    end: int
+
+
+class LandmarkMatcher:
+    """
+    표준명 / alias 전체에 대한 Aho-Corasick 자동기계.
+    자유 텍스트를 공백 제거형으로 한 번 훑어 모든 landmark 언급을 찾는다. ("성수 핫플" → 성수핫플)
+    """
+
+    def __init__(self, patterns: Dict[str, str]):
+        # goto[state] = {char: next_state}, fail[state], out[state] = [(pattern 길이, canonical)]
+        self._goto: list[Dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[tuple[int, str]]] = [[]]
+        for pattern, canonical in patterns.items():
+            key = _match_key(pattern)
+            if key:
+                self._add(key, canonical)
+        self._build_fail_links()
+
+    def _add(self, key: str, canonical: str) -> None:
+        state = 0
+        for ch in key:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        if all(length != len(key) for length, _ in self._out[state]):
+            self._out[state].append((len(key), canonical))
+
+    def _build_fail_links(self) -> None:
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find_all(self, text: Optional[str]) -> list[LandmarkMention]:
+        """모든 landmark 언급 (원문 순서, 겹치면 먼저 시작하는 것 → 긴 것 우선, 어절 시작 위치만)."""
+        if not text:
+            return []
+        # 공백 제거 문자열의 각 문자 → 원문 offset
+        chars, offsets = [], []
+        for i, ch in enumerate(text):
+            if not ch.isspace():
+                chars.append(ch.lower())
+                offsets.append(i)
+
+        hits: list[tuple[int, int, str]] = []  # (collapsed start, collapsed end, canonical)
+        state = 0
+        for pos, ch in enumerate(chars):
+            while state and ch not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(ch, 0)
+            for length, canonical in self._out[state]:
+                hits.append((pos - length + 1, pos + 1, canonical))
+
+        mentions: list[LandmarkMention] = []
+        last_end = 0
+        for start, end, canonical in sorted(hits, key=lambda h: (h[0], -(h[1] - h[0]))):
+            raw_start = offsets[start]
+            # 단어 중간에서 시작하는 hit 제외 ("상계동"의 "계동" ↛ 북촌) — 원문 기준 맨 앞 또는 공백·문장부호 뒤만 인정
+            if start < last_end or (raw_start > 0 and text[raw_start - 1].isalnum()):
+                continue
+            raw_end = offsets[end - 1] + 1
+            mentions.append(LandmarkMention(canonical, text[raw_start:raw_end], raw_start, raw_end))
+            last_end = end
+        return mentions
+
+
+_ALIAS_INDEX: Dict[str, str] = _build_alias_index()
+LANDMARK_MATCHER = LandmarkMatcher(_ALIAS_INDEX)
+
+
+def _lookup_landmark(text: str) -> Optional[NormalizedLocationResult]:
+    """canonical key / alias / 공백 제거형 역색인 조회 (O(1))."""
+    canonical = _ALIAS_INDEX.get(text) or _ALIAS_INDEX.get(_match_key(text))
+    if canonical is None:
+        return None
+    entry = LANDMARK_DICTIONARY[canonical]
+    return NormalizedLocationResult(
+        raw=None,  # 호출자가 채움
+        normalized_location=canonical,
+        canonical_matched=True,
+        lat=entry["lat"],
+        lon=entry["lon"],
+        radius_m=entry["radius_m"],
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -153,7 +250,7 @@ def normalize_location(raw: Optional[str]) -> NormalizedLocationResult:
       1. 빈값/None → normalized_location=None
       2. 공백/괄호/기본 접미어 정리
       3. canonical exact match
-      4. alias exact match
+      4. alias exact match (3~4는 역색인 조회 1회)
       5. 공백 제거 후 exact match (압구정 로데오 → 압구정로데오)
       6. 매칭 실패 → 원문 유지 (canonical_matched=False)
     """
@@ -185,10 +282,24 @@ def normalize_location(raw: Optional[str]) -> NormalizedLocationResult:
     return NormalizedLocationResult(raw=raw, normalized_location=cleaned, canonical_matched=False)
 
 
-def _build_landmark_desc() -> str:
-    """Intent 프롬프트에 주입할 compact 표준 장소 목록 문자열 생성. 모듈 로드 시 1회 실행."""
+def find_landmarks(text: Optional[str]) -> list[LandmarkMention]:
+    """
+    자유 텍스트에서 표준 장소 언급을 한 번에 추출 (LLM slot 없이 geo anchor 결정용).
+    예: "홍대입구 근처 카페, 성수 핫플도" → [홍대, 성수동 카페거리]
+    """
+    return LANDMARK_MATCHER.find_all(text)
+
+
+def format_landmark_desc(canonicals: Optional[list[str]] = None) -> str:
+    """
+    Intent 프롬프트에 주입할 compact 표준 장소 목록 문자열 (`표준명: 별칭1, 별칭2`).
+    canonicals를 주면 해당 장소만 그 순서로 (후보 선별용), None이면 사전 전체.
+    """
     lines = []
-    for canonical, entry in LANDMARK_DICTIONARY.items():
+    for canonical in LANDMARK_DICTIONARY if canonicals is None else canonicals:
+        entry = LANDMARK_DICTIONARY.get(canonical)
+        if entry is None:
+            continue
         aliases = entry.get("aliases", [])
         alias_str = ", ".join(aliases)
         lines.append(f"{canonical}: {alias_str}" if alias_str else canonical)
@@ -196,7 +307,7 @@ def _build_landmark_desc() -> str:
 
 
 # 모듈 로드 시 1회 생성 후 상수로 캐싱
-LANDMARK_DESC: str = _build_landmark_desc()
+LANDMARK_DESC: str = format_landmark_desc()
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,252 @@
+"""
+image_loader.py — 비동기 이미지 fetch / decode / CLIP embedding 공유 캐시
+
+이미지 첨부 턴 하나에서 describe_image(LLM 설명)와 image_visual 채널(CLIP)이
+같은 URL을 각자 blocking requests.get(timeout 600s)으로 내려받고 decode하던 것을 한 곳으로 모은다.
+- httpx.AsyncClient 커넥션 풀 + timeout + 바이트 상한(IMAGE_MAX_BYTES, 스트리밍 중 초과 시 중단)
+- decode(RGB 변환 + 긴 변 IMAGE_MAX_SIDE 축소)는 스레드에서 수행
+- 캐시 키는 이미지 바이트 sha1 (content-addressed): URL이 달라도 같은 이미지면 한 항목
+  항목에 decode된 RGB 이미지 / CLIP embedding / LLM 전달용 JPEG data URL을 lazy 보관, LRU 상한
+- 같은 대상에 대한 동시 요청은 진행 중인 작업 1개를 공유 (single-flight)
+"""
+
+import asyncio
+import base64
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+import httpx
+import numpy as np
+from PIL import Image
+
+from app.utils.config import (
+    IMAGE_FETCH_TIMEOUT_S,
+    IMAGE_MAX_BYTES,
+    IMAGE_MAX_SIDE,
+    IMAGE_CACHE_MAX_ENTRIES,
+    IMAGE_POOL_MAX_CONNECTIONS,
+)
+
+
+class ImageTooLargeError(ValueError):
+    pass
+
+
+@dataclass
+class LoadedImage:
+    digest: str
+    image: Image.Image
+    embedding: np.ndarray | None = None
+    data_url: str | None = None
+
+
+def _decode_image(data: bytes, max_side: int) -> Image.Image:
+    img = Image.open(io.BytesIO(data)).convert("RGB")
+    if max_side > 0 and max(img.size) > max_side:
+        img.thumbnail((max_side, max_side))
+    return img
+
+
+def _encode_jpeg_data_url(img: Image.Image) -> str:
+    buffered = io.BytesIO()
+    img.save(buffered, format="JPEG")
+    return f"data:image/jpeg;base64,{base64.b64encode(buffered.getvalue()).decode('utf-8')}"
+
+
+class ImageLoader:
+    _instance = None
+
+    @classmethod
+    def get_instance(cls) -> "ImageLoader":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(
+        self,
+        max_entries: int = IMAGE_CACHE_MAX_ENTRIES,
+        max_bytes: int = IMAGE_MAX_BYTES,
+        max_side: int = IMAGE_MAX_SIDE,
+        timeout_s: float = IMAGE_FETCH_TIMEOUT_S,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.max_entries = max(int(max_entries), 1)
+        self.max_bytes = int(max_bytes)
+        self.max_side = int(max_side)
+        self.timeout_s = float(timeout_s)
+        self._transport = transport
+        self._entries: OrderedDict[str, LoadedImage] = OrderedDict()  # digest -> 항목 (LRU)
+        self._digest_by_source: OrderedDict[str, str] = OrderedDict()  # URL / 경로 -> digest
+        self._lock = threading.Lock()
+        # httpx client / 진행 중 작업은 event loop에 묶이므로 loop가 바뀌면 새로 생성
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._inflight: dict[tuple[str, str], asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.downloads = 0
+        self.encodes = 0
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._client = None
+            self._inflight = {}
+            self._loop = loop
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        self._bind_loop()
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout_s,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=IMAGE_POOL_MAX_CONNECTIONS),
+                transport=self._transport,
+            )
+        return self._client
+
+    async def _single_flight(self, key: tuple[str, str], factory: Callable[[], Awaitable[Any]]) -> Any:
+        self._bind_loop()
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _, key=key: self._inflight.pop(key, None))
+        # 호출자 하나가 취소되어도 공유 작업은 계속
+        return await asyncio.shield(future)
+
+    # ------------------------------------------------------------------
+    # 원본 바이트
+    # ------------------------------------------------------------------
+
+    async def _read_bytes(self, source: str) -> bytes:
+        if source.startswith("data:image"):
+            _, encoded = source.split(",", 1)
+            data = base64.b64decode(encoded)
+        elif source.startswith("http"):
+            self.downloads += 1
+            async with self.client.stream("GET", source) as response:
+                response.raise_for_status()
+                length = response.headers.get("content-length")
+                if length and length.isdigit() and int(length) > self.max_bytes:
+                    raise ImageTooLargeError(f"content-length {length} > {self.max_bytes}")
+                chunks, size = [], 0
+                async for chunk in response.aiter_bytes():
+                    size += len(chunk)
+                    if size > self.max_bytes:
+                        raise ImageTooLargeError(f"body > {self.max_bytes} bytes")
+                    chunks.append(chunk)
+            data = b"".join(chunks)
+        elif os.path.exists(source):
+            if os.path.getsize(source) > self.max_bytes:
+                raise ImageTooLargeError(f"file > {self.max_bytes} bytes")
+            data = await asyncio.to_thread(lambda: open(source, "rb").read())
+        else:
+            raise ValueError("invalid image path/url")
+        if len(data) > self.max_bytes:
+            raise ImageTooLargeError(f"image > {self.max_bytes} bytes")
+        return data
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def _cached(self, source: str) -> LoadedImage | None:
+        with self._lock:
+            digest = self._digest_by_source.get(source)
+            entry = self._entries.get(digest) if digest else None
+            if entry is not None:
+                self._entries.move_to_end(digest)
+                self._digest_by_source.move_to_end(source)
+            return entry
+
+    def _store(self, source: str, digest: str, image: Image.Image) -> LoadedImage:
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                entry = LoadedImage(digest=digest, image=image)
+                self._entries[digest] = entry
+            self._entries.move_to_end(digest)
+            # data URL은 키가 너무 길어 URL → digest 매핑에 넣지 않음 (바이트 해시로 바로 찾음)
+            if not source.startswith("data:"):
+                self._digest_by_source[source] = digest
+                self._digest_by_source.move_to_end(source)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            while len(self._digest_by_source) > self.max_entries * 4:
+                self._digest_by_source.popitem(last=False)
+            return entry
+
+    async def load(self, source: str) -> LoadedImage | None:
+        """URL / data URL / 로컬 경로 → decode된 RGB 이미지 항목. 실패 시 None."""
+        source = str(source or "").strip()
+        if not source:
+            return None
+        entry = self._cached(source)
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        async def fetch() -> LoadedImage | None:
+            data = await self._read_bytes(source)
+            digest = hashlib.sha1(data).hexdigest()
+            with self._lock:
+                existing = self._entries.get(digest)
+            if existing is not None:
+                # 다른 URL로 이미 받은 같은 이미지 → decode 생략
+                self.hits += 1
+                return self._store(source, digest, existing.image)
+            self.misses += 1
+            image = await asyncio.to_thread(_decode_image, data, self.max_side)
+            return self._store(source, digest, image)
+
+        key_source = source if not source.startswith("data:") else hashlib.sha1(source.encode()).hexdigest()
+        try:
+            return await self._single_flight(("load", key_source), fetch)
+        except Exception as e:
+            print(f"[WARN] image load failed: {source[:50]}... err={e}")
+            return None
+
+    async def embedding(
+        self,
+        source: str,
+        encode: Callable[[Image.Image], Awaitable[np.ndarray]],
+    ) -> np.ndarray | None:
+        """이미지 CLIP embedding (항목당 encode 1회). 로드 실패 시 None."""
+        entry = await self.load(source)
+        if entry is None:
+            return None
+        if entry.embedding is not None:
+            return entry.embedding
+
+        async def run() -> np.ndarray:
+            self.encodes += 1
+            entry.embedding = np.asarray(await encode(entry.image), dtype=np.float32)
+            return entry.embedding
+
+        return await self._single_flight(("embedding", entry.digest), run)
+
+    async def data_url(self, source: str) -> str | None:
+        """LLM 전달용 JPEG data URL (항목당 1회 인코딩). 로드 실패 시 None."""
+        entry = await self.load(source)
+        if entry is None:
+            return None
+        if entry.data_url is None:
+            entry.data_url = await asyncio.to_thread(_encode_jpeg_data_url, entry.image)
+        return entry.data_url
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "downloads": self.downloads,
+                "encodes": self.encodes,
+            }
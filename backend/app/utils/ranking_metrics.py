@@ -0,0 +1,22 @@
+"""
+ranking_metrics.py — 서빙 코드에서도 쓰는 순위 지표
+
+오프라인 평가(evaluation/common/metrics.py)와 semantic cache 품질 guard rail이 같은 정의를 공유한다.
+"""
+
+import math
+
+
+def ndcg_at_k(predicted_ids: list[str], relevant_ids: set[str], k: int) -> float:
+    """이진 relevance nDCG@k. relevant_ids가 비어 있으면 0.0."""
+    dcg = 0.0
+    for rank, pid in enumerate(predicted_ids[:k], start=1):
+        if pid in relevant_ids:
+            dcg += 1.0 / math.log2(rank + 1)
+
+    ideal_count = min(len(relevant_ids), k)
+    if ideal_count == 0:
+        return 0.0
+
+    idcg = sum(1.0 / math.log2(i + 1) for i in range(1, ideal_count + 1))
+    return float(dcg / idcg)
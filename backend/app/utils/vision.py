@@ -1,36 +1,54 @@
-import os
-import base64
+import asyncio
 from typing import Optional
 from dotenv import load_dotenv
 
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 
 from app.core.llm_factory import LLMFactory
+from app.utils.config import ENABLE_IMAGE_DESCRIPTION_CACHE, LLM_MODEL
+from app.utils.description_cache import DescriptionCache, description_cache_key
+from app.utils.image_loader import ImageLoader
 from app.agents.prompts.prompts import IMAGE_TO_EMOTIONAL_PROMPT
 
 load_dotenv()
 
+def _description_cache() -> Optional[DescriptionCache]:
+    if not ENABLE_IMAGE_DESCRIPTION_CACHE:
+        return None
+    try:
+        return DescriptionCache.get_instance()
+    except Exception as e:
+        print(f"[WARN] image description cache unavailable: {e}")
+        return None
+
+
 async def describe_image(image_data: str) -> Optional[str]:
     """
     Extracts emotional and descriptive text from an image using GPT-4o-mini.
     image_data: Base64 string or URL.
+    같은 이미지(바이트 sha1) + 같은 프롬프트/모델이면 영속 캐시에서 바로 반환.
     """
     try:
-        if image_data.startswith("http"):
-            from app.scripts.preprocess_data import download_image
-            import base64
-            from io import BytesIO
-            img = download_image(image_data)
-            if img:
-                buffered = BytesIO()
-                img.save(buffered, format="JPEG")
-                image_base64 = base64.b64encode(buffered.getvalue()).decode('utf-8')
-                image_url = f"data:image/jpeg;base64,{image_base64}"
-            else:
-                return None
+        if image_data.startswith("http") or image_data.startswith("data:image"):
+            source = image_data
         else:
-            image_url = image_data if image_data.startswith("data:image") else f"data:image/jpeg;base64,{image_data}"
+            source = f"data:image/jpeg;base64,{image_data}"
+
+        # image_visual 채널과 다운로드 / decode 공유 (ImageLoader 캐시)
+        loader = ImageLoader.get_instance()
+        entry = await loader.load(source)
+        if entry is None:
+            return None
+
+        cache = _description_cache()
+        cache_key = description_cache_key(entry.digest, IMAGE_TO_EMOTIONAL_PROMPT, LLM_MODEL)
+        if cache is not None:
+            cached = await asyncio.to_thread(cache.get, cache_key)
+            if cached:
+                print(f"[INFO] describe_image cache hit: {entry.digest[:12]}")
+                return cached
 
+        image_url = await loader.data_url(source)
         prompt = ChatPromptTemplate.from_messages([
             ("system", IMAGE_TO_EMOTIONAL_PROMPT),
             ("human", [
@@ -42,6 +60,11 @@ async def describe_image(image_data: str) -> Optional[str]:
         response = await llm.ainvoke(prompt)
         description = response.content.strip()
         print(f"[INFO] describe_image output: {description}")
+        if cache is not None and description:
+            try:
+                await asyncio.to_thread(cache.put, cache_key, description)
+            except Exception as e:
+                print(f"[WARN] image description cache put failed: {e}")
         return description
     except Exception as e:
         print(f"[ERROR] describe_image failed: {e}")
@@ -0,0 +1,189 @@
+"""
+search_hybrid fusion & boosting 단계 벤치마크.
+
+후보별 Python 루프(기존 구현)와 columnar 배열 구현(fusion.py)을 같은 합성 채널 결과로 비교한다.
+- 후보 풀 크기별 latency (p50 / mean, ms)
+- 두 구현의 순위 / 출력 필드 일치 여부
+
+사용 예:
+    python -m evaluation.benchmark_fusion
+    python -m evaluation.benchmark_fusion --pool-sizes 100 500 2000 --repeat 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.core.retrieval.fusion import CandidatePool
+from app.core.retrieval.place_features import PlaceFeatureStore
+from app.core.retrieval.place_score import PlaceScorer, _extract_place_features
+from app.utils.config import (
+    BOOST_WEIGHT,
+    FUSED_SCORE_MAX,
+    GEO_PROXIMITY_RADIUS_KM,
+    MAX_BOOST_SUM,
+    RRF_SCORE_MAX,
+)
+
+# (match_type, RRF 가중치, payload_mode) — search_hybrid 채널 병합 순서와 동일
+CHANNELS = (
+    ("text_semantic", 1.0, "replace"),
+    ("qdrant_sparse", 0.85, "replace"),
+    ("text_to_image", 0.5, "keep"),
+    ("image_visual", 1.0, "keep"),
+    ("image_emotional", 0.8, "replace"),
+    ("bm25_lexical", 0.7, "fill"),
+)
+DISTRICTS = ["용산구", "중구", "종로구", "마포구", "강남구", "송파구", "해운대구", "수영구"]
+TITLES = ["서울타워", "한옥마을", "돈까스", "해수욕장", "박물관", "카페", "야시장", "미술관"]
+
+
+class _Scorer(PlaceScorer):
+    def __init__(self):
+        self.place_features = PlaceFeatureStore(_extract_place_features, max_size=100000)
+
+
+def make_channels(pool_size: int, hits_per_channel: int, seed: int = 7) -> list[tuple]:
+    """채널별 (ids, payloads, weight, match_type, payload_mode) 합성 결과."""
+    rng = random.Random(seed)
+    payloads = {}
+    for pid in range(1, pool_size + 1):
+        district = rng.choice(DISTRICTS)
+        payload = {
+            "contentid": str(pid),
+            "title": f"{rng.choice(TITLES)} {pid}",
+            "contenttypeid": rng.choice(["관광지", "음식점", "카페"]),
+            "addr": f"서울특별시 {district} 테스트로 {pid}",
+            "addr_tokens": ["서울특별시", district, district[:-1]],
+        }
+        if rng.random() > 0.1:
+            payload["geo"] = {"lat": 37.55 + rng.uniform(-0.2, 0.2), "lon": 126.98 + rng.uniform(-0.2, 0.2)}
+        payloads[pid] = payload
+
+    channels = []
+    for match_type, weight, mode in CHANNELS:
+        ids = rng.sample(range(1, pool_size + 1), min(hits_per_channel, pool_size))
+        # 일부 hit는 id 없음 / payload 없음 (photos 채널 등)
+        ch_ids = [None if rng.random() < 0.02 else pid for pid in ids]
+        ch_payloads = [None if mode == "keep" and rng.random() < 0.3 else payloads[pid] for pid in ids]
+        channels.append((ch_ids, ch_payloads, weight, match_type, mode))
+    return channels
+
+
+def legacy_fuse(scorer: PlaceScorer, channels: list[tuple], query: str, preferred_location: str | None,
+                anchor_lat: float | None, anchor_lng: float | None) -> list[dict]:
+    """기존 search_hybrid 후보별 루프 (dict score_map + Python sort)."""
+    rrf_k = 60
+    score_map = {}
+    for ids, payloads, weight, match_type, mode in channels:
+        for rank, (pid, payload) in enumerate(zip(ids, payloads), start=1):
+            if pid is None:
+                continue
+            if pid not in score_map:
+                score_map[pid] = {"score": 0.0, "payload": payload or {}, "matches": set()}
+            elif payload and (mode == "replace" or (mode == "fill" and not score_map[pid]["payload"])):
+                score_map[pid]["payload"] = payload
+            score_map[pid]["score"] += weight * (1.0 / (rrf_k + rank))
+            score_map[pid]["matches"].add(match_type)
+
+    query_addr_tokens = scorer._extract_query_addr_tokens(query)
+    fused = []
+    for pid, data in score_map.items():
+        payload = data["payload"]
+        keyword_boost = scorer._keyword_match_bonus(query=query, payload=payload)
+        location_text_boost = scorer._location_text_bonus(preferred_location=preferred_location, payload=payload)
+        geo_proximity_boost = scorer._geo_proximity_bonus(
+            payload=payload, anchor_lat=anchor_lat, anchor_lng=anchor_lng, radius_km=GEO_PROXIMITY_RADIUS_KM,
+        )
+        addr_sparse_boost = scorer._addr_sparse_bonus(query_addr_tokens=query_addr_tokens, payload=payload)
+        if addr_sparse_boost > 0.0:
+            data["matches"].add("addr_sparse")
+        boost = keyword_boost + location_text_boost + geo_proximity_boost + addr_sparse_boost
+        fused.append((pid, data, data["score"] + BOOST_WEIGHT * boost,
+                      (keyword_boost, location_text_boost, geo_proximity_boost, addr_sparse_boost, boost)))
+
+    fused.sort(key=lambda x: x[2], reverse=True)
+    results = []
+    for idx, (pid, data, final_score, detail) in enumerate(fused, start=1):
+        results.append({
+            "id": pid,
+            "score": round(min(1.0, final_score / FUSED_SCORE_MAX), 4),
+            "first_stage_score": round(min(1.0, data["score"] / RRF_SCORE_MAX), 4),
+            "first_stage_rank": idx,
+            "payload": data["payload"],
+            "match_types": sorted(list(data["matches"])),
+            "keyword_match_boost": detail[0],
+            "location_text_boost": detail[1],
+            "geo_proximity_boost": detail[2],
+            "addr_sparse_boost": detail[3],
+            "score_boost_total": round(min(1.0, detail[4] / MAX_BOOST_SUM), 4),
+        })
+    return results
+
+
+def vectorized_fuse(scorer: PlaceScorer, channels: list[tuple], query: str, preferred_location: str | None,
+                    anchor_lat: float | None, anchor_lng: float | None) -> list[dict]:
+    """현재 search_hybrid 경로 (CandidatePool + PlaceScorer._fuse_candidates)."""
+    pool = CandidatePool(rrf_k=60)
+    for ids, payloads, weight, match_type, mode in channels:
+        pool.add_ranked(ids, payloads, weight, match_type, payload_mode=mode)
+    return scorer._fuse_candidates(
+        pool,
+        query=query,
+        preferred_location=preferred_location,
+        query_addr_tokens=scorer._extract_query_addr_tokens(query),
+        sparse_enabled=True,
+        anchor_lat=anchor_lat,
+        anchor_lng=anchor_lng,
+    )
+
+
+def _timed(fn, repeat: int) -> dict[str, float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {"p50_ms": float(np.percentile(samples, 50)), "mean_ms": float(np.mean(samples))}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="fusion & boosting 단계 벤치마크 (루프 vs 배열)")
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=[100, 500, 2000])
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--query", type=str, default="용산구 서울타워 야경")
+    parser.add_argument("--preferred-location", type=str, default="용산")
+    args = parser.parse_args()
+
+    anchor = (37.5512, 126.9882)
+    for pool_size in args.pool_sizes:
+        channels = make_channels(pool_size, hits_per_channel=max(pool_size // 2, 20))
+        scorer = _Scorer()
+        run = lambda fn: fn(scorer, channels, args.query, args.preferred_location, *anchor)
+        # 첫 호출로 feature 캐시 warm-up (실서비스 steady state와 동일 조건)
+        legacy, current = run(legacy_fuse), run(vectorized_fuse)
+        same_rank = [r["id"] for r in legacy] == [r["id"] for r in current]
+
+        legacy_stats = _timed(lambda: run(legacy_fuse), args.repeat)
+        current_stats = _timed(lambda: run(vectorized_fuse), args.repeat)
+        print(
+            f"[INFO] pool={len(current):>5} "
+            f"loop p50={legacy_stats['p50_ms']:.2f}ms mean={legacy_stats['mean_ms']:.2f}ms | "
+            f"array p50={current_stats['p50_ms']:.2f}ms mean={current_stats['mean_ms']:.2f}ms | "
+            f"speedup={legacy_stats['p50_ms'] / max(current_stats['p50_ms'], 1e-9):.2f}x "
+            f"same_ranking={same_rank}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+추론 backend(torch / onnx / onnx-int8) 벤치마크.
+
+backend마다 별도 프로세스에서 모델을 로드해 아래 항목을 측정한다.
+- 모델별 단건 encode/predict latency (p50 / p95 / mean, ms)
+- 모델 로드 전/후 RSS (MB)
+
+사용 예:
+    python -m evaluation.benchmark_inference_backend
+    python -m evaluation.benchmark_inference_backend --backends torch onnx-int8 --repeat 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+EVAL_DIR = Path(__file__).resolve().parent
+RESULT_DIR = EVAL_DIR / "result"
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+QUERIES = [
+    "서울 야경 좋은 카페",
+    "아이와 함께 가기 좋은 박물관",
+    "해운대 근처 조용한 숙소",
+    "비 오는 날 실내 데이트 코스",
+    "전주 한옥마을 비빔밥 맛집",
+    "가을 단풍 명소 추천해줘",
+]
+RERANK_DOC = "남산서울타워 관광지 서울특별시 용산구 남산공원길"
+
+
+def _rss_mb() -> float:
+    try:
+        import psutil
+
+        return psutil.Process(os.getpid()).memory_info().rss / (1024 * 1024)
+    except ImportError:
+        import resource
+
+        # psutil이 없으면 peak RSS(ru_maxrss, Linux 기준 KB)로 대체
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _latency_stats(fn, inputs: list, repeat: int, warmup: int = 3) -> dict[str, float]:
+    for item in inputs[:warmup]:
+        fn(item)
+    samples = []
+    for i in range(repeat):
+        item = inputs[i % len(inputs)]
+        started = time.perf_counter()
+        fn(item)
+        samples.append((time.perf_counter() - started) * 1000.0)
+    arr = np.asarray(samples)
+    return {
+        "p50_ms": round(float(np.percentile(arr, 50)), 2),
+        "p95_ms": round(float(np.percentile(arr, 95)), 2),
+        "mean_ms": round(float(arr.mean()), 2),
+    }
+
+
+def run_single_backend(backend: str, repeat: int) -> dict:
+    """현재 프로세스에서 backend 하나를 측정. (RSS 측정을 위해 backend별 프로세스 분리)"""
+    from app.core.retrieval.model_loader import load_cross_encoder, load_sentence_model
+    from app.utils.config import RERANK_MODEL, TEXT_MODEL, VISION_MODEL
+
+    result = {"backend": backend, "rss_start_mb": round(_rss_mb(), 1)}
+
+    text_model = load_sentence_model(TEXT_MODEL, backend)
+    result["rss_after_text_mb"] = round(_rss_mb(), 1)
+    result["text_encode"] = _latency_stats(text_model.encode, QUERIES, repeat)
+
+    vision_model = load_sentence_model(VISION_MODEL, backend, onnx_supported=False)
+    result["rss_after_vision_mb"] = round(_rss_mb(), 1)
+    result["clip_text_encode"] = _latency_stats(vision_model.encode, QUERIES, repeat)
+
+    reranker = load_cross_encoder(RERANK_MODEL, backend)
+    result["rss_after_rerank_mb"] = round(_rss_mb(), 1)
+    result["rerank_predict"] = _latency_stats(
+        lambda q: reranker.predict([(q, RERANK_DOC)]),
+        QUERIES,
+        repeat,
+    )
+    return result
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="추론 backend latency / RSS 벤치마크")
+    parser.add_argument("--backends", nargs="+", default=["torch", "onnx", "onnx-int8"])
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--output", default=str(RESULT_DIR / "benchmark_inference_backend.json"))
+    parser.add_argument("--single", default=None, help=argparse.SUPPRESS)  # 내부용: 자식 프로세스 모드
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    if args.single:
+        print(json.dumps(run_single_backend(args.single, args.repeat), ensure_ascii=False))
+        return
+
+    results = []
+    for backend in args.backends:
+        print(f"[INFO] benchmarking backend={backend}")
+        proc = subprocess.run(
+            [sys.executable, "-m", "evaluation.benchmark_inference_backend", "--single", backend, "--repeat", str(args.repeat)],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            print(f"[WARN] backend={backend} failed:\n{proc.stderr[-2000:]}")
+            continue
+        # 모델 로드 로그 뒤 마지막 줄이 결과 JSON
+        results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+    for r in results:
+        print(
+            f"{r['backend']:>10} | text p50={r['text_encode']['p50_ms']}ms "
+            f"clip p50={r['clip_text_encode']['p50_ms']}ms "
+            f"rerank p50={r['rerank_predict']['p50_ms']}ms | rss={r['rss_after_rerank_mb']}MB"
+        )
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"[INFO] saved: {output}")
+
+
+if __name__ == "__main__":
+    main()
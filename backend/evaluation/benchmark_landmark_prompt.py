@@ -0,0 +1,167 @@
+"""
+intent 프롬프트 표준 장소 목록 token 벤치마크.
+
+intent 로그(INTENT_LOG_PATH, source=llm)의 user_input으로 INTENT_PROMPT system 메시지를 렌더링해 비교한다.
+- full: LANDMARK_DESC(사전 전체) 주입 — 기존 방식
+- preselect: landmark_candidates 후보 선별 상위 LANDMARK_PROMPT_TOP_N개만 주입
+- token 수(mean / p50 / p95)와 감소율, 선택된 후보 수
+- location recall: LLM slot location이 표준 장소인 건 중 후보 목록에 포함된 비율
+
+사용 예:
+    python -m evaluation.benchmark_landmark_prompt
+    python -m evaluation.benchmark_landmark_prompt --top-n 3 --embedding
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+EVAL_DIR = Path(__file__).resolve().parent
+RESULT_DIR = EVAL_DIR / "result"
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.agents.landmark_candidates import (
+    EMPTY_LANDMARK_DESC,
+    get_landmark_vectors,
+    score_landmarks,
+    select_landmarks,
+)
+from app.agents.models.output import CategoryType
+from app.agents.prompts.prompts import INTENT_PROMPT
+from app.utils.config import INTENT_LOG_PATH, LANDMARK_PROMPT_TOP_N, LLM_MODEL
+from app.utils.geocoder import LANDMARK_DESC, LANDMARK_DICTIONARY, format_landmark_desc, normalize_location
+from evaluation.train_intent_classifier import load_intent_log
+
+
+def token_counter(model: str):
+    """LLM 모델 tokenizer(tiktoken) 기준 token 수 함수. 모델을 모르면 o200k_base."""
+    import tiktoken
+
+    try:
+        encoding = tiktoken.encoding_for_model(model)
+    except KeyError:
+        encoding = tiktoken.get_encoding("o200k_base")
+    return lambda text: len(encoding.encode(text))
+
+
+def render_intent_prompt(landmark_desc: str) -> str:
+    """intent_node system 메시지 (landmark_desc 외 입력은 고정값)."""
+    return INTENT_PROMPT.format(
+        prefs_info="선호도 정보 없음",
+        summary_title="제목 없음",
+        summary_message="아직 대화 요약 없음",
+        category_desc=CategoryType.description(),
+        landmark_desc=landmark_desc,
+    )
+
+
+def _canonical_location(slots: dict[str, Any] | None) -> str | None:
+    """LLM slot location → 표준 장소명 (사전에 없으면 None)."""
+    name = ((slots or {}).get("location") or {}).get("name")
+    norm = normalize_location(name)
+    return norm.normalized_location if norm.canonical_matched else None
+
+
+def _summary(values: list[int]) -> dict[str, float]:
+    arr = np.asarray(values, dtype=np.float64)
+    return {
+        "mean": round(float(arr.mean()), 1),
+        "p50": round(float(np.percentile(arr, 50)), 1),
+        "p95": round(float(np.percentile(arr, 95)), 1),
+    }
+
+
+def benchmark_records(
+    records: list[dict[str, Any]],
+    count_tokens,
+    top_n: int = LANDMARK_PROMPT_TOP_N,
+    query_vectors: list[np.ndarray] | None = None,
+    landmark_vectors: dict[str, np.ndarray] | None = None,
+) -> dict[str, Any]:
+    """레코드별 full / preselect system prompt token 수 + 후보 location recall."""
+    full_tokens = count_tokens(render_intent_prompt(LANDMARK_DESC))
+    pre_tokens: list[int] = []
+    selected_counts: list[int] = []
+    location_total = location_hit = 0
+    for i, record in enumerate(records):
+        text = record.get("user_input") or ""
+        vector = query_vectors[i] if query_vectors is not None else None
+        selected = select_landmarks(score_landmarks(text, (), vector, landmark_vectors), top_n)
+        desc = format_landmark_desc(selected) if selected else EMPTY_LANDMARK_DESC
+        pre_tokens.append(count_tokens(render_intent_prompt(desc)))
+        selected_counts.append(len(selected))
+
+        location = _canonical_location(record.get("slots"))
+        if location is not None:
+            location_total += 1
+            location_hit += location in selected
+
+    pre = _summary(pre_tokens)
+    return {
+        "samples": len(records),
+        "top_n": top_n,
+        "full_tokens": full_tokens,
+        "preselect_tokens": pre,
+        "saved_tokens_mean": round(full_tokens - pre["mean"], 1),
+        "reduction": round(1 - pre["mean"] / full_tokens, 4) if full_tokens else 0.0,
+        "selected_mean": round(float(np.mean(selected_counts)), 2) if selected_counts else 0.0,
+        "location_samples": location_total,
+        "location_recall": round(location_hit / location_total, 4) if location_total else None,
+    }
+
+
+async def _embed(records: list[dict[str, Any]]) -> tuple[list[np.ndarray], dict[str, np.ndarray]]:
+    from app.core.retrieval.place import PlaceRetriever
+
+    retriever = PlaceRetriever.get_instance()
+    vectors = await asyncio.gather(*(retriever.aencode_query(r.get("user_input") or "") for r in records))
+    return list(vectors), await get_landmark_vectors(retriever)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="intent 프롬프트 표준 장소 목록 token 벤치마크 (전체 vs 후보 선별)")
+    parser.add_argument("--log", default=INTENT_LOG_PATH)
+    parser.add_argument("--output", default=str(RESULT_DIR / "landmark_prompt_tokens.json"))
+    parser.add_argument("--top-n", type=int, default=LANDMARK_PROMPT_TOP_N)
+    parser.add_argument("--model", default=LLM_MODEL, help="token 계산에 쓸 tokenizer 모델명")
+    parser.add_argument("--embedding", action="store_true", help="BGE-M3 임베딩 매칭 포함 (검색 모델 로드)")
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    records = load_intent_log(args.log)
+    if not records:
+        raise SystemExit(f"[ERROR] intent 로그가 없습니다: {args.log}")
+
+    query_vectors = landmark_vectors = None
+    if args.embedding:
+        query_vectors, landmark_vectors = asyncio.run(_embed(records))
+
+    result = benchmark_records(records, token_counter(args.model), args.top_n, query_vectors, landmark_vectors)
+    result.update({"model": args.model, "embedding": args.embedding, "landmarks": len(LANDMARK_DICTIONARY)})
+    pre = result["preselect_tokens"]
+    print(
+        f"[INFO] samples={result['samples']} full={result['full_tokens']} tokens | "
+        f"preselect mean={pre['mean']} p50={pre['p50']} p95={pre['p95']} | "
+        f"reduction={result['reduction']:.1%} selected_mean={result['selected_mean']} "
+        f"location_recall={result['location_recall']}"
+    )
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"[INFO] saved: {output}")
+
+
+if __name__ == "__main__":
+    main()
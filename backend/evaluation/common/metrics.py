@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-import math
 import re
 from itertools import combinations
 from typing import Any
 
+# nDCG는 서빙 코드(semantic cache guard rail)와 같은 정의를 사용
+from app.utils.ranking_metrics import ndcg_at_k
+
 
 def _safe_div(numerator: float, denominator: float) -> float:
     return float(numerator / denominator) if denominator else 0.0
@@ -47,21 +49,6 @@ def mrr_at_k(predicted_ids: list[str], relevant_ids: set[str], k: int) -> float:
     return 0.0
 
 
-def ndcg_at_k(predicted_ids: list[str], relevant_ids: set[str], k: int) -> float:
-    dcg = 0.0
-    for rank, pid in enumerate(predicted_ids[:k], start=1):
-        rel = 1.0 if pid in relevant_ids else 0.0
-        if rel > 0:
-            dcg += rel / math.log2(rank + 1)
-
-    ideal_count = min(len(relevant_ids), k)
-    if ideal_count == 0:
-        return 0.0
-
-    idcg = sum(1.0 / math.log2(i + 1) for i in range(1, ideal_count + 1))
-    return _safe_div(dcg, idcg)
-
-
 def ild_at_n(items: list[dict[str, Any]], n: int) -> float:
     """카테고리 불일치 비율 기반 간단 ILD."""
     topn = items[:n]
@@ -0,0 +1,152 @@
+"""
+로컬 intent 분류기(fast path) 학습 / 평가.
+
+intent_node가 남긴 intent 로그(ENABLE_INTENT_LOG=true일 때 INTENT_LOG_PATH, source=llm)를 학습 데이터로 사용한다.
+- 입력: user_input BGE-M3 임베딩 (서버와 같은 TEXT_MODEL / TEXT_INFERENCE_BACKEND)
+- label: primary_intent, 단 LLM 재작성(update_user_input) / 규칙 slot 불일치 / fast path 대상 외 intent는 FALLBACK
+- held-out 평가: threshold별 coverage(LLM 생략 비율)와 LLM 결과 일치율(intent / intent+slot)
+
+사용 예:
+    python -m evaluation.train_intent_classifier
+    python -m evaluation.train_intent_classifier --threshold 0.85 --no-save
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+EVAL_DIR = Path(__file__).resolve().parent
+RESULT_DIR = EVAL_DIR / "result"
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.agents.intent_classifier import FALLBACK_LABEL, IntentClassifier, intent_log_files, rule_slots_agree, training_label
+from app.agents.models.output import IntentType
+from app.utils.config import INTENT_CLASSIFIER_PATH, INTENT_FAST_PATH_THRESHOLD, INTENT_LOG_PATH
+
+SWEEP_THRESHOLDS = (0.7, 0.8, 0.9, 0.95)
+
+
+def load_intent_log(path: str | Path) -> list[dict[str, Any]]:
+    """
+    LLM이 판정한 intent 로그만 로드. (fast path 결과는 자기 강화 방지를 위해 제외, 같은 입력은 최신 1건)
+    회전된 파일(path.1 ...)도 오래된 순서로 함께 읽는다.
+    """
+    records: dict[str, dict[str, Any]] = {}
+    for file in intent_log_files(str(path)):
+        with open(file, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                text = (record.get("user_input") or "").strip()
+                if record.get("source", "llm") == "llm" and text:
+                    records[text] = record
+    return list(records.values())
+
+
+def evaluate_classifier(
+    classifier: IntentClassifier,
+    x: np.ndarray,
+    records: list[dict[str, Any]],
+    threshold: float,
+) -> dict[str, float]:
+    """
+    threshold에서 fast path가 처리하는 비율(coverage)과 처리분의 LLM 일치율.
+    - intent_agreement: fast path intent == LLM primary_intent
+    - full_agreement: intent 일치 + LLM 재작성 없음 + (검색 intent면) 규칙 slot == LLM slot
+    """
+    if not records:
+        return {"threshold": threshold, "samples": 0, "coverage": 0.0, "intent_agreement": 0.0, "full_agreement": 0.0}
+    probs = classifier.predict_proba(x)
+    covered = intent_ok = full_ok = 0
+    for record, row in zip(records, probs):
+        best = int(np.argmax(row))
+        label = classifier.classes[best]
+        if row[best] < threshold or label == FALLBACK_LABEL:
+            continue
+        covered += 1
+        if label != record.get("primary_intent"):
+            continue
+        intent_ok += 1
+        slots_ok = label == IntentType.GENERAL.value or rule_slots_agree(record.get("user_input") or "", record.get("slots"))
+        if slots_ok and not record.get("update_user_input"):
+            full_ok += 1
+    return {
+        "threshold": threshold,
+        "samples": len(records),
+        "coverage": round(covered / len(records), 4),
+        "intent_agreement": round(intent_ok / covered, 4) if covered else 0.0,
+        "full_agreement": round(full_ok / covered, 4) if covered else 0.0,
+    }
+
+
+def split_records(records: list[dict[str, Any]], test_ratio: float, seed: int) -> tuple[list[int], list[int]]:
+    indices = list(range(len(records)))
+    random.Random(seed).shuffle(indices)
+    n_test = int(round(len(indices) * test_ratio)) if len(indices) > 1 else 0
+    return indices[n_test:], indices[:n_test]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="로컬 intent 분류기 학습 / coverage · LLM 일치율 평가")
+    parser.add_argument("--log", default=INTENT_LOG_PATH)
+    parser.add_argument("--model-out", default=INTENT_CLASSIFIER_PATH)
+    parser.add_argument("--output", default=str(RESULT_DIR / "intent_classifier_eval.json"))
+    parser.add_argument("--threshold", type=float, default=INTENT_FAST_PATH_THRESHOLD)
+    parser.add_argument("--test-ratio", type=float, default=0.2)
+    parser.add_argument("--epochs", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-save", action="store_true", help="평가만 하고 모델 파일은 저장하지 않음")
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    records = load_intent_log(args.log)
+    if len(records) < 10:
+        raise SystemExit(f"[ERROR] intent 로그가 부족합니다: {len(records)}건 ({args.log})")
+
+    from app.core.retrieval.model_loader import load_sentence_model
+    from app.utils.config import TEXT_INFERENCE_BACKEND, TEXT_MODEL
+
+    model = load_sentence_model(TEXT_MODEL, TEXT_INFERENCE_BACKEND)
+    x = np.asarray(model.encode([r["user_input"] for r in records], batch_size=32), dtype=np.float32)
+    labels = [training_label(r) for r in records]
+    label_counts = {label: labels.count(label) for label in sorted(set(labels))}
+    print(f"[INFO] records={len(records)} labels={label_counts}")
+
+    train_idx, test_idx = split_records(records, args.test_ratio, args.seed)
+    held_out = IntentClassifier.fit(x[train_idx], [labels[i] for i in train_idx], epochs=args.epochs, threshold=args.threshold)
+    test_records = [records[i] for i in test_idx]
+    sweep = [evaluate_classifier(held_out, x[test_idx], test_records, t) for t in sorted({*SWEEP_THRESHOLDS, args.threshold})]
+    for row in sweep:
+        print(
+            f"  threshold={row['threshold']:.2f} coverage={row['coverage']:.3f} "
+            f"intent_agreement={row['intent_agreement']:.3f} full_agreement={row['full_agreement']:.3f}"
+        )
+
+    result = {"records": len(records), "labels": label_counts, "test_samples": len(test_idx), "sweep": sweep}
+    if not args.no_save:
+        # 배포 모델은 전체 로그로 재학습
+        IntentClassifier.fit(x, labels, epochs=args.epochs, threshold=args.threshold).save(args.model_out)
+        result["model"] = args.model_out
+        print(f"[INFO] model saved: {args.model_out}")
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"[INFO] saved: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import base64
+import io
+import time
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image
+
+from app.utils import vision
+from app.utils.description_cache import DescriptionCache, description_cache_key
+from app.utils.image_loader import ImageLoader
+
+
+def test_cache_persists_across_instances_and_expires_by_ttl(tmp_path, monkeypatch):
+    path = str(tmp_path / "cache" / "descriptions.sqlite3")
+    DescriptionCache(path).put("a:v1", "고즈넉한 한옥 골목")
+
+    reopened = DescriptionCache(path, ttl_s=60)
+    assert reopened.get("a:v1") == "고즈넉한 한옥 골목"
+    assert reopened.get("a:v2") is None
+
+    now = time.time()
+    monkeypatch.setattr("app.utils.description_cache.time.time", lambda: now + 120)
+    assert reopened.get("a:v1") is None
+    assert reopened.stats() == {"size": 1, "hits": 1, "misses": 2}
+
+
+def test_cache_evicts_least_recently_used_over_max_entries(tmp_path):
+    cache = DescriptionCache(str(tmp_path / "d.sqlite3"), max_entries=2)
+    cache.put("a", "A")
+    cache.put("b", "B")
+    cache.get("a")
+    cache.put("c", "C")
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == ("A", "C")
+
+
+def test_cache_key_changes_with_prompt_or_model():
+    base = description_cache_key("digest", "prompt", "gpt-4o-mini")
+    assert base != description_cache_key("digest", "prompt v2", "gpt-4o-mini")
+    assert base != description_cache_key("digest", "prompt", "gpt-4o")
+    assert base.startswith("digest:")
+
+
+@pytest.mark.asyncio
+async def test_describe_image_skips_vision_call_for_repeated_image(tmp_path, monkeypatch):
+    calls = []
+
+    class FakeLLM:
+        async def ainvoke(self, prompt):
+            calls.append(prompt)
+            return SimpleNamespace(content=" 노을 진 바닷가 ")
+
+    buffered = io.BytesIO()
+    Image.new("RGB", (32, 32), (10, 120, 200)).save(buffered, format="PNG")
+    raw_b64 = base64.b64encode(buffered.getvalue()).decode()
+
+    monkeypatch.setattr(vision.LLMFactory, "get_llm", classmethod(lambda cls: FakeLLM()))
+    monkeypatch.setattr(ImageLoader, "_instance", ImageLoader())
+    monkeypatch.setattr(DescriptionCache, "_instance", DescriptionCache(str(tmp_path / "d.sqlite3")))
+
+    first = await vision.describe_image(raw_b64)
+    # 같은 바이트를 data URL 형태로 다시 보내도 캐시 hit
+    second = await vision.describe_image(f"data:image/png;base64,{raw_b64}")
+
+    assert first == second == "노을 진 바닷가"
+    assert len(calls) == 1
+    assert DescriptionCache._instance.stats()["hits"] == 1
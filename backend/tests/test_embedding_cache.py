@@ -0,0 +1,57 @@
+import numpy as np
+
+from app.core.retrieval.embedding_cache import EmbeddingCache, normalize_query_key
+
+
+def test_normalize_query_key_collapses_whitespace_and_keeps_case():
+    assert normalize_query_key("  성수   카페\n추천 ") == "성수 카페 추천"
+    assert normalize_query_key("Seoul Cafe") == "Seoul Cafe"
+
+
+def test_get_or_compute_hits_cache_for_equivalent_queries():
+    cache = EmbeddingCache(max_size=8, ttl_s=60)
+    calls = []
+
+    def encode(text):
+        calls.append(text)
+        return np.ones(4)
+
+    first = cache.get_or_compute("text", "성수 카페", encode)
+    second = cache.get_or_compute("text", " 성수  카페 ", encode)
+
+    assert len(calls) == 1
+    assert first.dtype == np.float32
+    assert np.array_equal(first, second)
+    assert cache.stats()["text"] == {"size": 1, "hits": 1, "misses": 1}
+
+
+def test_namespaces_are_separate():
+    cache = EmbeddingCache(max_size=8, ttl_s=60)
+    cache.put("text", "홍대", np.zeros(3))
+
+    assert cache.get("clip_text", "홍대") is None
+    assert cache.get("text", "홍대") is not None
+
+
+def test_lru_eviction_drops_least_recently_used():
+    cache = EmbeddingCache(max_size=2, ttl_s=60)
+    cache.put("text", "a", np.zeros(2))
+    cache.put("text", "b", np.zeros(2))
+    cache.get("text", "a")
+    cache.put("text", "c", np.zeros(2))
+
+    assert cache.get("text", "b") is None
+    assert cache.get("text", "a") is not None
+    assert cache.get("text", "c") is not None
+
+
+def test_expired_entry_is_recomputed(monkeypatch):
+    import app.core.retrieval.embedding_cache as module
+
+    now = [100.0]
+    monkeypatch.setattr(module.time, "monotonic", lambda: now[0])
+    cache = EmbeddingCache(max_size=8, ttl_s=10)
+    cache.put("text", "a", np.zeros(2))
+
+    now[0] = 111.0
+    assert cache.get("text", "a") is None
@@ -0,0 +1,54 @@
+import math
+
+import numpy as np
+import pytest
+
+from app.core.retrieval.fusion import CandidatePool, geo_proximity_bonus
+from evaluation.benchmark_fusion import _Scorer, legacy_fuse, make_channels, vectorized_fuse
+
+
+@pytest.mark.parametrize(
+    "query,preferred_location,anchor",
+    [
+        ("용산구 서울타워 야경", "용산", (37.5512, 126.9882)),
+        ("송파 돈까스", None, (None, None)),
+        ("", None, (37.5, 127.0)),
+    ],
+)
+def test_vectorized_fusion_matches_legacy_loop(query, preferred_location, anchor):
+    channels = make_channels(pool_size=300, hits_per_channel=150)
+    legacy = legacy_fuse(_Scorer(), channels, query, preferred_location, *anchor)
+    current = vectorized_fuse(_Scorer(), channels, query, preferred_location, *anchor)
+
+    assert [r["id"] for r in current] == [r["id"] for r in legacy]
+    for new, old in zip(current, legacy):
+        assert new.keys() == old.keys()
+        for key, value in old.items():
+            if key == "geo_proximity_boost":
+                # 배열 삼각함수와 math 모듈 간 ulp 수준 차이만 허용
+                assert new[key] == pytest.approx(value, rel=1e-12, abs=1e-15)
+            else:
+                assert new[key] == value, key
+
+
+def test_candidate_pool_payload_modes_and_skipped_rank():
+    pool = CandidatePool(rrf_k=60)
+    pool.add_ranked([None, 1], [{"contentid": "x"}, {}], 1.0, "text_semantic", payload_mode="replace")
+    pool.add_ranked([1], [{"src": "photo"}], 0.5, "image_visual", payload_mode="keep")
+    pool.add_ranked([1], [{"src": "bm25"}], 0.7, "bm25_lexical", payload_mode="fill")
+
+    assert pool.ids == [1]
+    assert pool.payloads[0] == {"src": "bm25"}
+    assert pool.matches[0] == {"text_semantic", "image_visual", "bm25_lexical"}
+    # id 없는 hit도 rank 1을 소비 → text_semantic 기여는 rank 2
+    assert pool.rrf_scores()[0] == 1.0 * (1.0 / 62) + 0.5 * (1.0 / 61) + 0.7 * (1.0 / 61)
+
+
+def test_geo_proximity_bonus_handles_missing_coordinates_and_anchor():
+    lats = np.array([37.5512, np.nan, 35.1587])
+    lngs = np.array([126.9882, 127.0, 129.1604])
+
+    bonus = geo_proximity_bonus(lats, lngs, 37.5512, 126.9882, radius_km=20.0)
+    assert math.isclose(bonus[0], 0.20)
+    assert bonus[1] == 0.0 and bonus[2] == 0.0
+    assert not geo_proximity_bonus(lats, lngs, None, None).any()
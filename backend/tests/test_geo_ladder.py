@@ -0,0 +1,88 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.core.retrieval import place as place_module
+from app.core.retrieval.place import HybridSearchRequest, PlaceRetriever, _geo_radius_ladder
+
+
+def test_radius_ladder_ends_city_wide_then_unfiltered(monkeypatch):
+    monkeypatch.setattr(place_module, "GEO_RADIUS_LADDER", [1.0, 2.0])
+    monkeypatch.setattr(place_module, "GEO_LADDER_CITY_RADIUS_M", 15000.0)
+    assert _geo_radius_ladder(1000) == [1000.0, 2000.0, 15000.0, None]
+    # 배수 단계가 시 단위 반경 이상이면 생략
+    assert _geo_radius_ladder(10000) == [10000.0, 15000.0, None]
+
+    monkeypatch.setattr(place_module, "GEO_LADDER_CITY_RADIUS_M", 0.0)
+    assert _geo_radius_ladder(1000) == [1000.0, 2000.0, None]
+
+
+def _retriever(hits_by_radius):
+    retriever = PlaceRetriever.__new__(PlaceRetriever)
+    retriever.lexical_index = None
+    retriever.spatial_index = None
+    calls = []
+
+    async def query_places_dense(vector, query_filter, limit):
+        radius = None
+        for condition in (query_filter.must if query_filter else None) or []:
+            if getattr(condition, "geo_radius", None) is not None:
+                radius = condition.geo_radius.radius
+        calls.append(radius)
+        return [
+            SimpleNamespace(id=pid, payload={"contentid": str(pid), "title": f"장소{pid}"}, score=0.5)
+            for pid in hits_by_radius.get(radius, [])
+        ]
+
+    retriever._query_places_dense = query_places_dense
+    return retriever, calls
+
+
+@pytest.mark.asyncio
+async def test_first_rung_with_enough_candidates_is_used_in_single_pass(monkeypatch):
+    monkeypatch.setattr(place_module, "GEO_RADIUS_LADDER", [1.0, 2.0])
+    monkeypatch.setattr(place_module, "GEO_LADDER_CITY_RADIUS_M", 15000.0)
+    monkeypatch.setattr(place_module, "GEO_LADDER_MIN_CANDIDATES", 2)
+    retriever, calls = _retriever({1000.0: [1], 2000.0: [1, 2, 3], 15000.0: [1, 2, 3, 4], None: [9, 8]})
+
+    request = HybridSearchRequest(
+        query="홍대 카페",
+        limit=5,
+        enable_bm25=False,
+        location_anchor_lat=37.5575,
+        location_anchor_lon=126.9245,
+        location_radius_m=1000,
+    )
+    defaults = {"candidate_k": 10, "top_k": 5, "rerank_max_k": 10}
+    stage = await retriever._search_first_stage(
+        request, "place_only", defaults, text_emb=np.zeros(4), clip_text_emb=None,
+    )
+
+    # 모든 단계가 한 번에 조회되고 (재귀 재검색 없음) 2r 단계 결과가 선택됨
+    assert sorted(calls, key=lambda r: (r is None, r or 0)) == [1000.0, 2000.0, 15000.0, None]
+    assert sorted(c["id"] for c in stage.candidates) == [1, 2, 3]
+    assert stage.candidates[0]["match_types"] == ["text_semantic"]
+
+
+@pytest.mark.asyncio
+async def test_unfiltered_rung_is_used_when_geo_rungs_are_empty(monkeypatch):
+    monkeypatch.setattr(place_module, "GEO_RADIUS_LADDER", [1.0])
+    monkeypatch.setattr(place_module, "GEO_LADDER_CITY_RADIUS_M", 0.0)
+    retriever, calls = _retriever({None: [7]})
+
+    request = HybridSearchRequest(
+        query="외딴 동네 맛집",
+        limit=3,
+        enable_bm25=False,
+        location_anchor_lat=37.0,
+        location_anchor_lon=127.0,
+        location_radius_m=500,
+    )
+    defaults = {"candidate_k": 10, "top_k": 5, "rerank_max_k": 10}
+    stage = await retriever._search_first_stage(
+        request, "place_only", defaults, text_emb=np.zeros(4), clip_text_emb=None,
+    )
+
+    assert len(calls) == 2
+    assert [c["id"] for c in stage.candidates] == [7]
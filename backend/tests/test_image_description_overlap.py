@@ -0,0 +1,119 @@
+import asyncio
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.core.retrieval import place as place_module
+from app.core.retrieval.embedding_cache import EmbeddingCache
+from app.core.retrieval.place import HybridSearchRequest, PlaceRetriever
+from app.core.retrieval.place_features import PlaceFeatureStore
+from app.core.retrieval.place_score import _extract_place_features
+from app.core.retrieval.result_cache import SearchResultCache
+
+DEFAULTS = {"candidate_k": 10, "top_k": 5, "rerank_max_k": 10}
+
+
+def _retriever(describe_delay_s, monkeypatch):
+    retriever = PlaceRetriever.__new__(PlaceRetriever)
+    retriever.lexical_index = None
+    retriever.spatial_index = None
+    retriever._background_tasks = set()
+    events = []
+
+    async def describe_image(image_url):
+        events.append("describe_start")
+        await asyncio.sleep(describe_delay_s)
+        events.append("describe_done")
+        return "노을 진 바닷가의 고요한 분위기"
+
+    async def query_photos_image(image_url, query_filter, limit):
+        events.append("image_visual")
+        return [SimpleNamespace(id="photo-1", payload={"contentid": "7"}, score=0.4)]
+
+    async def aencode_text(text):
+        return np.ones(4)
+
+    async def query_places_dense(vector, query_filter, limit, with_payload=None):
+        events.append("image_emotional")
+        return [SimpleNamespace(id=8, payload={"contentid": "8"}, score=0.5)]
+
+    monkeypatch.setattr(place_module, "describe_image", describe_image)
+    monkeypatch.setattr(place_module, "IMAGE_DESCRIPTION_DEADLINE_S", 0.05)
+    retriever._query_photos_image = query_photos_image
+    retriever._aencode_text = aencode_text
+    retriever._query_places_dense = query_places_dense
+    return retriever, events
+
+
+@pytest.mark.asyncio
+async def test_description_starts_with_visual_channel_and_is_fused_in_time(monkeypatch):
+    retriever, events = _retriever(0.0, monkeypatch)
+
+    stage = await retriever._search_first_stage(
+        HybridSearchRequest(query="", image_url="https://cdn.example.com/a.jpg", enable_bm25=False),
+        "auto", DEFAULTS, text_emb=None, clip_text_emb=None,
+    )
+
+    assert events.index("describe_start") < events.index("describe_done")
+    assert "image_visual" in events and "image_emotional" in events
+    assert stage.emotional_text == "노을 진 바닷가의 고요한 분위기"
+    assert not stage.description_dropped
+    assert {c["id"] for c in stage.candidates} == {7, 8}
+
+
+@pytest.mark.asyncio
+async def test_late_description_is_dropped_and_finishes_in_background(monkeypatch):
+    retriever, events = _retriever(0.2, monkeypatch)
+
+    stage = await retriever._search_first_stage(
+        HybridSearchRequest(query="바다 사진", image_url="https://cdn.example.com/a.jpg", enable_bm25=False),
+        "auto", DEFAULTS, text_emb=None, clip_text_emb=None,
+    )
+
+    assert stage.emotional_text is None and stage.description_dropped
+    assert [c["id"] for c in stage.candidates] == [7]
+    assert "describe_done" not in events and len(retriever._background_tasks) == 1
+    # LLM 호출은 취소되지 않고 끝까지 실행 (영속 설명 캐시 저장)
+    await asyncio.gather(*retriever._background_tasks)
+    assert events[-1] == "describe_done"
+
+
+@pytest.mark.asyncio
+async def test_photo_only_query_turn_does_not_request_description(monkeypatch):
+    retriever, events = _retriever(0.0, monkeypatch)
+
+    await retriever._search_first_stage(
+        HybridSearchRequest(query="바다", image_url="https://cdn.example.com/a.jpg", enable_bm25=False),
+        "photo_only", DEFAULTS, text_emb=None, clip_text_emb=None,
+    )
+
+    assert events == ["image_visual"]
+
+
+@pytest.mark.asyncio
+async def test_result_with_timed_out_channel_is_not_cached(monkeypatch):
+    retriever, events = _retriever(0.0, monkeypatch)
+    retriever.search_cache = SearchResultCache()
+    retriever.semantic_cache = None
+    retriever.embedding_cache = EmbeddingCache()
+    retriever.place_features = PlaceFeatureStore(_extract_place_features)
+    retriever.place_payloads = None
+    retriever._reranker_load_attempted, retriever._reranker = True, None
+    slow_visual = retriever._query_photos_image
+
+    async def query_photos_image(image_url, query_filter, limit):
+        await asyncio.sleep(0.2)
+        return await slow_visual(image_url, query_filter, limit)
+
+    retriever._query_photos_image = query_photos_image
+    monkeypatch.setattr(place_module, "CHANNEL_TIMEOUT_S", 0.05)
+    request = HybridSearchRequest(query="", image_url="https://cdn.example.com/a.jpg", enable_bm25=False, enable_rerank=False)
+
+    stage = await retriever._search_first_stage(request, "auto", DEFAULTS, text_emb=None, clip_text_emb=None)
+    assert stage.degraded and [c["id"] for c in stage.candidates] == [8]
+
+    # image_visual timeout → emotional 채널 결과만 반환되지만 캐시에는 남기지 않음
+    results = await retriever._run_hybrid_requests([request])
+    assert [r["id"] for r in results[0]] == [8]
+    assert retriever.search_cache.stats()["size"] == 0
@@ -0,0 +1,71 @@
+import asyncio
+import base64
+import io
+
+import httpx
+import numpy as np
+import pytest
+from PIL import Image
+
+from app.utils.image_loader import ImageLoader
+
+
+def _jpeg_bytes(color=(200, 80, 40), size=(64, 48)) -> bytes:
+    buffered = io.BytesIO()
+    Image.new("RGB", size, color).save(buffered, format="JPEG")
+    return buffered.getvalue()
+
+
+def _loader(requests: list, body: bytes, **kwargs) -> ImageLoader:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(str(request.url))
+        return httpx.Response(200, content=body, headers={"content-type": "image/jpeg"})
+
+    return ImageLoader(transport=httpx.MockTransport(handler), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_consumers_share_one_download_decode_and_encode():
+    requests, encoded = [], []
+    loader = _loader(requests, _jpeg_bytes())
+
+    async def encode(img):
+        encoded.append(img.size)
+        await asyncio.sleep(0)
+        return np.ones(4)
+
+    url = "https://cdn.example.com/a.jpg"
+    emb_a, data_url, emb_b = await asyncio.gather(
+        loader.embedding(url, encode), loader.data_url(url), loader.embedding(url, encode),
+    )
+    # 다음 턴의 같은 이미지도 캐시 hit
+    emb_c = await loader.embedding(url, encode)
+
+    assert requests == [url]
+    assert encoded == [(64, 48)]
+    assert data_url.startswith("data:image/jpeg;base64,")
+    assert all(np.array_equal(emb, np.ones(4)) for emb in (emb_a, emb_b, emb_c))
+    assert loader.stats()["downloads"] == 1 and loader.stats()["encodes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_same_bytes_under_different_sources_share_entry_and_large_images_are_shrunk():
+    body = _jpeg_bytes(size=(400, 100))
+    requests = []
+    loader = _loader(requests, body, max_side=200)
+
+    first = await loader.load("https://a.example.com/x.jpg")
+    second = await loader.load(f"data:image/jpeg;base64,{base64.b64encode(body).decode()}")
+
+    assert second is first
+    assert first.image.size == (200, 50)
+    assert loader.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_oversized_or_invalid_images_return_none():
+    loader = _loader([], _jpeg_bytes(), max_bytes=100)
+
+    assert await loader.load("https://cdn.example.com/big.jpg") is None
+    assert await loader.load("not-an-image-source") is None
+    assert await loader.embedding("", lambda img: None) is None
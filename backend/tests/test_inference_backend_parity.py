@@ -0,0 +1,86 @@
+"""
+추론 backend parity 테스트.
+
+모델 다운로드/ONNX export가 필요하므로 RUN_MODEL_PARITY=1일 때만 실행한다.
+    RUN_MODEL_PARITY=1 pytest tests/test_inference_backend_parity.py -q
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from app.core.retrieval import model_loader
+from app.core.retrieval.model_loader import load_cross_encoder, load_sentence_model
+from app.utils.config import RERANK_MODEL, TEXT_MODEL, VISION_MODEL
+
+RUN_PARITY = os.getenv("RUN_MODEL_PARITY", "0") == "1"
+requires_models = pytest.mark.skipif(not RUN_PARITY, reason="RUN_MODEL_PARITY=1 일 때만 실행")
+
+QUERIES = [
+    "서울 야경 좋은 카페",
+    "아이와 함께 가기 좋은 박물관",
+    "해운대 근처 조용한 숙소",
+    "비 오는 날 실내 데이트 코스",
+    "전주 한옥마을 비빔밥 맛집",
+]
+DOCS = [
+    "남산서울타워 관광지 서울특별시 용산구 남산공원길",
+    "국립중앙박물관 문화시설 서울특별시 용산구 서빙고로",
+    "해운대 그랜드 호텔 숙박 부산광역시 해운대구",
+]
+
+# backend별 최소 cosine (torch fp32 벡터 대비)
+MIN_COSINE = {"onnx": 0.999, "onnx-int8": 0.98}
+
+
+def _cosine_rows(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    a = a / np.linalg.norm(a, axis=1, keepdims=True)
+    b = b / np.linalg.norm(b, axis=1, keepdims=True)
+    return np.sum(a * b, axis=1)
+
+
+def test_unknown_backend_falls_back_to_torch():
+    assert model_loader._normalize_backend("tensorrt") == "torch"
+    assert model_loader._normalize_backend(" ONNX-INT8 ") == "onnx-int8"
+
+
+def test_quantized_dir_is_filesystem_safe():
+    path = model_loader._quantized_dir("cross-encoder/mmarco-mMiniLMv2-L12-H384-v1")
+    assert os.path.basename(path) == "cross-encoder__mmarco-mMiniLMv2-L12-H384-v1"
+
+
+@pytest.fixture(scope="module")
+def torch_text_model():
+    return load_sentence_model(TEXT_MODEL, "torch")
+
+
+@requires_models
+@pytest.mark.parametrize("backend", ["onnx", "onnx-int8"])
+def test_text_embedding_cosine_parity(torch_text_model, backend):
+    model = load_sentence_model(TEXT_MODEL, backend)
+    expected = np.asarray(torch_text_model.encode(QUERIES), dtype=np.float32)
+    actual = np.asarray(model.encode(QUERIES), dtype=np.float32)
+
+    assert actual.shape == expected.shape
+    assert _cosine_rows(actual, expected).min() >= MIN_COSINE[backend]
+
+
+@requires_models
+def test_clip_text_embedding_cosine_parity_int8():
+    expected = np.asarray(load_sentence_model(VISION_MODEL, "torch").encode(QUERIES), dtype=np.float32)
+    model = load_sentence_model(VISION_MODEL, "onnx-int8", onnx_supported=False)
+    actual = np.asarray(model.encode(QUERIES), dtype=np.float32)
+
+    assert _cosine_rows(actual, expected).min() >= MIN_COSINE["onnx-int8"]
+
+
+@requires_models
+@pytest.mark.parametrize("backend", ["onnx", "onnx-int8"])
+def test_reranker_preserves_top1(backend):
+    pairs = [(q, d) for q in QUERIES for d in DOCS]
+    expected = np.asarray(load_cross_encoder(RERANK_MODEL, "torch").predict(pairs)).reshape(len(QUERIES), len(DOCS))
+    actual = np.asarray(load_cross_encoder(RERANK_MODEL, backend).predict(pairs)).reshape(len(QUERIES), len(DOCS))
+
+    assert (expected.argmax(axis=1) == actual.argmax(axis=1)).all()
+    assert np.corrcoef(expected.ravel(), actual.ravel())[0, 1] >= MIN_COSINE[backend]
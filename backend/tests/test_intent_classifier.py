@@ -0,0 +1,116 @@
+import json
+
+import numpy as np
+import pytest
+
+from app.agents.intent_classifier import (
+    FALLBACK_LABEL,
+    IntentClassifier,
+    append_intent_log,
+    intent_log_files,
+    build_fast_intent,
+    training_label,
+)
+from app.agents.models.output import CategoryType, IntentOutput, IntentSlots, IntentType
+from evaluation import train_intent_classifier as tic
+
+
+def _record(text, primary, slots=None, update=None):
+    return {"user_input": text, "primary_intent": primary, "slots": slots or {}, "update_user_input": update}
+
+
+def test_training_label_falls_back_when_rules_cannot_reproduce_llm():
+    place_slots = {"location": {"name": "홍대입구"}, "categories": ["음식점"]}
+
+    assert training_label(_record("안녕하세요", "GENERAL")) == "GENERAL"
+    assert training_label(_record("홍대입구 맛집 추천", "PLACE_INQUIRY", place_slots)) == "PLACE_INQUIRY"
+    # LLM 재작성 / 규칙이 못 잡는 지역 / fast path 대상 외 intent
+    assert training_label(_record("거기 맛집", "PLACE_INQUIRY", place_slots, update="홍대 맛집")) == FALLBACK_LABEL
+    assert training_label(_record("부산 해운대 맛집", "PLACE_INQUIRY", {"location": {"name": "부산 해운대"}, "categories": ["음식점"]})) == FALLBACK_LABEL
+    assert training_label(_record("제주 2박 3일 일정", "TRIP_PLANNING")) == FALLBACK_LABEL
+
+
+def _toy_data():
+    rng = np.random.default_rng(0)
+    centers = {"GENERAL": np.eye(8)[0], "PLACE_INQUIRY": np.eye(8)[1], FALLBACK_LABEL: np.eye(8)[2]}
+    labels = [label for label in centers for _ in range(20)]
+    x = np.stack([centers[label] + rng.normal(0, 0.05, 8) for label in labels])
+    return x, labels
+
+
+def test_classifier_fits_and_round_trips(tmp_path):
+    x, labels = _toy_data()
+    classifier = IntentClassifier.fit(x, labels, threshold=0.8)
+
+    assert classifier.confident_intent(np.eye(8)[1])[0] == "PLACE_INQUIRY"
+    # FALLBACK으로 분류되면 LLM 사용
+    assert classifier.confident_intent(np.eye(8)[2])[0] is None
+
+    path = str(tmp_path / "intent.npz")
+    classifier.save(path)
+    loaded = IntentClassifier.load(path)
+    assert loaded.classes == classifier.classes and loaded.threshold == 0.8
+    assert np.allclose(loaded.predict_proba(x), classifier.predict_proba(x))
+
+
+def test_evaluate_reports_coverage_and_llm_agreement():
+    x, labels = _toy_data()
+    classifier = IntentClassifier.fit(x, labels)
+    records = [_record("안녕", "GENERAL"), _record("홍대 맛집", "PLACE_INQUIRY", {"location": {"name": "홍대"}, "categories": ["음식점"]}),
+               _record("어디든", "PLACE_INQUIRY"), _record("제주 일정", "TRIP_PLANNING")]
+    x_eval = np.stack([np.eye(8)[0], np.eye(8)[1], np.eye(8)[1], np.eye(8)[2]])
+
+    report = tic.evaluate_classifier(classifier, x_eval, records, threshold=0.5)
+
+    assert report["coverage"] == 0.75
+    assert report["intent_agreement"] == 1.0
+    # "어디든"은 규칙 slot / LLM slot 모두 비어 있으므로 slot까지 일치
+    assert report["full_agreement"] == 1.0
+
+
+def test_fast_intent_uses_rule_slots_and_keeps_summary(tmp_path):
+    result = build_fast_intent("홍대 카페 추천", "PLACE_INQUIRY", {"summary_title": "홍대 데이트", "summary_message": "요약"})
+
+    assert result.primary_intent == IntentType.PLACE_INQUIRY
+    assert result.slots.location.name == "홍대"
+    assert result.slots.categories == [CategoryType.RESTAURANT]
+    # fast path는 요약을 갱신하지 않음 (제목 변경 없음, 이전 요약 유지)
+    assert (result.summary_title, result.summary_message) == (None, "요약")
+
+    path = tmp_path / "logs" / "intent.jsonl"
+    append_intent_log(str(path), "홍대 카페 추천", result, "fast_path")
+    append_intent_log(str(path), "안녕", IntentOutput(intents=[IntentType.GENERAL], primary_intent=IntentType.GENERAL, slots=IntentSlots()), "llm")
+    rows = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert rows[0]["slots"]["categories"] == ["음식점"] and rows[0]["source"] == "fast_path"
+    assert [r["user_input"] for r in tic.load_intent_log(path)] == ["안녕"]
+
+
+def test_intent_log_rotates_and_keeps_backup_count(tmp_path):
+    path = str(tmp_path / "intent.jsonl")
+    result = IntentOutput(intents=[IntentType.GENERAL], primary_intent=IntentType.GENERAL, slots=IntentSlots())
+    for i in range(5):
+        append_intent_log(path, f"안녕 {i}", result, "llm", max_bytes=1, backup_count=2)
+
+    # 매 기록마다 회전 → 현재 파일 + 백업 2개만 남음
+    assert [p.rsplit("/", 1)[-1] for p in intent_log_files(path)] == ["intent.jsonl.2", "intent.jsonl.1", "intent.jsonl"]
+    assert [r["user_input"] for r in tic.load_intent_log(path)] == ["안녕 2", "안녕 3", "안녕 4"]
+
+
+@pytest.mark.asyncio
+async def test_fast_path_yields_to_llm_when_summary_lag_reaches_cap(monkeypatch):
+    from app.agents import intent as intent_module
+
+    class Confident:
+        def confident_intent(self, vector):
+            return "GENERAL", 0.99
+
+    class Encoder:
+        async def aencode_query(self, text):
+            return np.ones(8)
+
+    monkeypatch.setattr(intent_module.IntentClassifier, "get_instance", classmethod(lambda cls: Confident()))
+    monkeypatch.setattr(intent_module.PlaceRetriever, "get_instance", classmethod(lambda cls: Encoder()))
+    monkeypatch.setattr(intent_module, "INTENT_FAST_PATH_MAX_SUMMARY_LAG", 2)
+
+    assert await intent_module._try_fast_intent("안녕", {"summary_lag_turns": 1}) is not None
+    assert await intent_module._try_fast_intent("안녕", {"summary_lag_turns": 2}) is None
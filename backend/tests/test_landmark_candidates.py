@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from app.agents import landmark_candidates as lc
+from app.utils.geocoder import LANDMARK_DESC, LANDMARK_DICTIONARY
+from evaluation.benchmark_landmark_prompt import benchmark_records
+
+
+def test_string_scores_prefer_mentions_and_skip_shared_suffix():
+    assert lc.string_scores("홍대입구 근처 카페") == {"홍대": 1.0}
+    # "석촌호수 맛집" 별칭 부분 일치
+    assert set(lc.string_scores("석촌호수 근처 맛집")) == {"송리단길"}
+    assert lc.string_scores("안녕하세요") == {}
+
+
+def test_recent_messages_are_decayed_below_current_input():
+    messages = [{"content": "북촌 한옥 카페"}, {"content": "건대 술집 알려줘"}]
+    scores = lc.score_landmarks("홍대 쪽은?", messages)
+
+    assert scores == {"홍대": 1.0, "건대": 0.5, "북촌": 0.25}
+    assert lc.select_landmarks(scores, top_n=2) == ["홍대", "건대"]
+
+
+def test_embedding_match_adds_landmarks_above_min_similarity():
+    dim = len(LANDMARK_DICTIONARY)
+    vectors = {c: np.eye(dim, dtype=np.float32)[i] for i, c in enumerate(LANDMARK_DICTIONARY)}
+    canonicals = list(LANDMARK_DICTIONARY)
+    query = vectors[canonicals[2]] * 0.8 + vectors[canonicals[3]] * 0.3
+
+    scores = lc.score_landmarks("분위기 좋은 골목", (), query, vectors, min_similarity=0.5)
+
+    assert list(scores) == [canonicals[2]]
+
+
+class FakeRetriever:
+    def __init__(self):
+        self.texts = []
+
+    async def aencode_query(self, text):
+        self.texts.append(text)
+        if text == "송파 호수 산책":
+            return np.array([1, 0.2, 0, 0], dtype=np.float32)
+        return np.array([1, 0, 0, 0], dtype=np.float32) if text.startswith("송리단길") else np.array([0, 1, 0, 0], dtype=np.float32)
+
+
+@pytest.mark.asyncio
+async def test_build_landmark_desc_uses_embeddings_once(monkeypatch):
+    monkeypatch.setattr(lc, "_landmark_vectors", None)
+    retriever = FakeRetriever()
+
+    desc, selected = await lc.build_landmark_desc("송파 호수 산책", [], retriever)
+    await lc.build_landmark_desc("송파 호수 산책", [], retriever)
+
+    assert selected[0] == "송리단길" and desc.startswith("송리단길: ")
+    assert len(retriever.texts) == len(LANDMARK_DICTIONARY) + 2
+
+    desc, selected = await lc.build_landmark_desc("안녕하세요")
+    assert (desc, selected) == (lc.EMPTY_LANDMARK_DESC, [])
+
+
+def test_benchmark_reports_token_reduction_and_location_recall():
+    records = [
+        {"user_input": "홍대입구 근처 카페", "slots": {"location": {"name": "홍대입구"}}},
+        {"user_input": "안녕", "slots": {}},
+        # 표기가 사전과 달라 문자열 매칭으로는 못 잡는 경우
+        {"user_input": "뚝섬역 카페", "slots": {"location": {"name": "성수동 카페거리"}}},
+    ]
+
+    report = benchmark_records(records, len, top_n=3)
+
+    assert report["preselect_tokens"]["p95"] < report["full_tokens"]
+    assert report["saved_tokens_mean"] > len(LANDMARK_DESC) // 2
+    assert (report["location_samples"], report["location_recall"]) == (2, 0.5)
+
+
+def test_landmark_vectors_can_be_computed_from_separate_event_loops(monkeypatch):
+    import asyncio
+
+    class SlowRetriever(FakeRetriever):
+        async def aencode_query(self, text):
+            await asyncio.sleep(0.01)
+            return await super().aencode_query(text)
+
+    async def contended():
+        retriever = SlowRetriever()
+        results = await asyncio.gather(lc.get_landmark_vectors(retriever), lc.get_landmark_vectors(retriever))
+        return results, retriever.texts
+
+    for _ in range(2):
+        monkeypatch.setattr(lc, "_landmark_vectors", None)
+        (first, second), texts = asyncio.run(contended())
+        # 같은 loop의 동시 호출은 1회만 계산
+        assert first is second and len(texts) == len(LANDMARK_DICTIONARY)
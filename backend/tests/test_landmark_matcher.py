@@ -0,0 +1,38 @@
+from app.utils.geocoder import LANDMARK_DICTIONARY, LandmarkMatcher, find_landmarks, normalize_location
+
+
+def test_normalize_location_uses_reverse_alias_index():
+    assert normalize_location("홍대입구역").normalized_location == "홍대"
+    assert normalize_location("신사동가로수길").normalized_location == "가로수길"
+    assert normalize_location("hbc").normalized_location == "해방촌"
+
+    miss = normalize_location("부산 해운대")
+    assert not miss.canonical_matched and miss.normalized_location == "부산 해운대"
+
+
+def test_find_landmarks_extracts_every_mention_across_spacing():
+    mentions = find_landmarks("홍대입구 근처 카페랑 성수 핫플, 신사동 가로수길도 알려줘")
+
+    assert [m.canonical for m in mentions] == ["홍대", "성수동 카페거리", "가로수길"]
+    # 원문 offset / 원형(공백 포함) 보존
+    assert [m.text for m in mentions] == ["홍대입구", "성수 핫플", "신사동 가로수길"]
+    assert mentions[1].start == len("홍대입구 근처 카페랑 ")
+    assert find_landmarks("그냥 조용한 곳") == []
+
+
+def test_matcher_prefers_longest_leftmost_match():
+    matcher = LandmarkMatcher({"홍대": "홍대", "홍대입구": "홍대", "입구역": "X"})
+
+    assert [(m.canonical, m.text) for m in matcher.find_all("홍대입구역 앞")] == [("홍대", "홍대입구")]
+    # 사전 전체 표준명 / alias는 모두 자기 자신으로 찾아짐
+    for canonical, entry in LANDMARK_DICTIONARY.items():
+        for name in (canonical, *entry["aliases"]):
+            assert find_landmarks(name)[0].canonical == canonical
+
+
+def test_find_landmarks_ignores_matches_inside_a_word():
+    # alias "계동"(북촌)이 다른 동 이름 중간에 걸리면 안 됨
+    for text in ("상계동 맛집", "신계동 카페", "가계동"):
+        assert find_landmarks(text) == []
+    assert [m.canonical for m in find_landmarks("계동 맛집, (계동)")] == ["북촌", "북촌"]
+    assert [m.canonical for m in find_landmarks("홍대입구 근처")] == ["홍대"]
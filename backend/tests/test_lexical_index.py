@@ -0,0 +1,132 @@
+from app.core.retrieval.lexical_index import LexicalIndex, analyze
+
+
+def _records():
+    return [
+        (101, {
+            "title": "남산서울타워",
+            "contenttypeid": "관광지",
+            "addr": "서울특별시 용산구 남산공원길 105",
+            "addr_tokens": ["서울특별시", "용산구", "용산"],
+            "geo": {"lat": 37.5512, "lon": 126.9882},
+        }),
+        (102, {
+            "title": "남산 돈까스",
+            "contenttypeid": "음식점",
+            "addr": "서울특별시 중구 소파로",
+            "addr_tokens": ["서울특별시", "중구"],
+            "geo": {"lat": 37.5560, "lon": 126.9830},
+        }),
+        (103, {
+            "title": "해운대 해수욕장",
+            "contenttypeid": "관광지",
+            "addr": "부산광역시 해운대구 우동",
+            "addr_tokens": ["부산광역시", "해운대구", "해운대"],
+            "geo": {"lat": 35.1587, "lon": 129.1604},
+        }),
+        (104, {
+            "title": "국립중앙박물관",
+            "contenttypeid": "문화시설",
+            "addr": "서울특별시 용산구 서빙고로 137",
+            "addr_tokens": ["서울특별시", "용산구", "용산"],
+        }),
+    ]
+
+
+def test_analyze_adds_hangul_bigrams():
+    terms = analyze("남산 서울타워")
+    assert "남산" in terms
+    assert "#서울" in terms and "#타워" in terms
+
+
+def test_exact_name_with_different_spacing_is_found():
+    index = LexicalIndex.build(_records())
+    hits = index.search("남산 서울 타워", limit=3)
+    assert hits[0][0] == 101
+    assert 0.0 < hits[0][1] < 1.0
+
+
+def test_category_and_geo_filters():
+    index = LexicalIndex.build(_records())
+
+    hits = index.search("남산", limit=5, categories=["음식점"])
+    assert [pid for pid, _ in hits] == [102]
+
+    # 해운대 근처 반경 2km → 서울 문서 제외, geo 없는 문서도 제외
+    hits = index.search("서울특별시 해운대", limit=5, anchor_lat=35.16, anchor_lon=129.16, radius_m=2000)
+    assert [pid for pid, _ in hits] == [103]
+
+
+def test_idf_uses_whole_corpus():
+    index = LexicalIndex.build(_records())
+    common = index.idf[index.vocab["서울특별시"]]
+    rare = index.idf[index.vocab["해운대"]]
+    assert rare > common
+
+
+def test_save_and_mmap_load_roundtrip(tmp_path):
+    index = LexicalIndex.build(_records(), source_points_count=4)
+    index_dir = tmp_path / "lexical_index"
+    index.save(str(index_dir))
+    # 재저장(교체)도 가능해야 함
+    index.save(str(index_dir))
+
+    loaded = LexicalIndex.load(str(index_dir))
+    assert loaded.meta["source_points_count"] == 4
+    assert loaded.search("국립중앙박물관", limit=1) == index.search("국립중앙박물관", limit=1)
+    assert LexicalIndex.load(str(tmp_path / "missing")) is None
+
+
+def test_concurrent_save_keeps_the_other_workers_index(tmp_path, monkeypatch):
+    import os
+
+    index_dir = str(tmp_path / "lexical_index")
+    mine = LexicalIndex.build(_records(), source_points_count=4)
+    other = LexicalIndex.build(_records(), source_points_count=5)
+    real_rename = os.rename
+    injected = []
+
+    def rename(src, dst):
+        # 이 worker가 임시 디렉토리를 설치하기 직전에 다른 worker가 먼저 저장을 끝냄
+        if dst == index_dir and not injected:
+            injected.append(src)
+            other.save(index_dir)
+        return real_rename(src, dst)
+
+    monkeypatch.setattr(os, "rename", rename)
+    mine.save(index_dir)
+
+    assert injected and LexicalIndex.load(index_dir).meta["source_points_count"] == 5
+    # 임시 / 이전 디렉토리는 남지 않음
+    assert os.listdir(tmp_path) == ["lexical_index"]
+
+
+def test_startup_rebuilds_index_when_collection_version_changes(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+
+    from app.core.retrieval import place as place_module
+    from app.core.retrieval.place import PlaceRetriever
+
+    index_dir = str(tmp_path / "lexical")
+    LexicalIndex.build(_records(), source_points_count=4, source_version="v1").save(index_dir)
+    builds = []
+
+    def build_from_qdrant(client, collection_name):
+        builds.append(collection_name)
+        return LexicalIndex.build(_records(), source_points_count=4, source_version="v2")
+
+    retriever = PlaceRetriever.__new__(PlaceRetriever)
+    retriever.client = SimpleNamespace(count=lambda collection_name, exact: SimpleNamespace(count=4))
+    monkeypatch.setattr(place_module, "ENABLE_LEXICAL_INDEX", True)
+    monkeypatch.setattr(place_module, "LEXICAL_INDEX_BUILD_ON_STARTUP", True)
+    monkeypatch.setattr(place_module, "LEXICAL_INDEX_DIR", index_dir)
+    monkeypatch.setattr(place_module, "build_from_qdrant", build_from_qdrant)
+
+    # 문서 수는 같아도 재적재(버전 변경)되면 재빌드
+    monkeypatch.setattr(place_module, "get_collection_versions", lambda: {place_module.PLACES_COLLECTION: "v2"})
+    assert retriever._load_lexical_index().meta["source_version"] == "v2"
+    assert len(builds) == 1
+
+    # 버전 / 문서 수가 같으면 디스크 색인 그대로 사용
+    assert retriever._load_lexical_index().meta["source_version"] == "v2"
+    assert len(builds) == 1
@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+
+from app.core.retrieval.batching import MicroBatcher
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submits_are_flushed_as_one_batch():
+    calls = []
+
+    def encode(items):
+        calls.append(list(items))
+        return [f"vec:{item}" for item in items]
+
+    batcher = MicroBatcher("text", encode, max_batch_size=16, max_wait_ms=20)
+    results = await asyncio.gather(*[batcher.submit(q) for q in ["a", "b", "c"]])
+
+    assert results == ["vec:a", "vec:b", "vec:c"]
+    assert calls == [["a", "b", "c"]]
+    assert batcher.stats()["batches"] == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_is_split_by_max_batch_size():
+    calls = []
+
+    def predict(items):
+        calls.append(len(items))
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher("rerank", predict, max_batch_size=2, max_wait_ms=20)
+    results = await batcher.submit_many([1, 2, 3, 4, 5])
+
+    assert results == [2, 4, 6, 8, 10]
+    assert calls == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_propagates_to_every_waiter():
+    def broken(items):
+        raise RuntimeError("oom")
+
+    batcher = MicroBatcher("text", broken, max_batch_size=4, max_wait_ms=1)
+    results = await asyncio.gather(batcher.submit("a"), batcher.submit("b"), return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_batcher_can_be_reused_across_event_loops():
+    batcher = MicroBatcher("text", lambda items: list(items), max_batch_size=4, max_wait_ms=1)
+
+    assert asyncio.run(batcher.submit("a")) == "a"
+    assert asyncio.run(batcher.submit("b")) == "b"
+
+
+@pytest.mark.asyncio
+async def test_max_in_flight_allows_parallel_batches():
+    import threading
+    import time
+
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def query_batch(requests):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.05)
+        with lock:
+            active["now"] -= 1
+        return [f"resp:{r}" for r in requests]
+
+    batcher = MicroBatcher("qdrant:places", query_batch, max_batch_size=1, max_wait_ms=0, max_in_flight=3)
+    results = await asyncio.gather(*[batcher.submit(i) for i in range(3)])
+
+    assert results == ["resp:0", "resp:1", "resp:2"]
+    assert active["peak"] > 1
+
+
+@pytest.mark.asyncio
+async def test_async_batch_fn_is_awaited_on_event_loop():
+    calls = []
+
+    async def query(requests):
+        calls.append(list(requests))
+        await asyncio.sleep(0)
+        return [f"res:{r}" for r in requests]
+
+    batcher = MicroBatcher("qdrant", query, max_batch_size=8, max_wait_ms=10)
+    results = await asyncio.gather(*[batcher.submit(r) for r in ["q1", "q2"]])
+
+    assert results == ["res:q1", "res:q2"]
+    assert calls == [["q1", "q2"]]
+
+
+@pytest.mark.asyncio
+async def test_in_flight_batch_tasks_are_tracked_and_drained_on_close():
+    release = asyncio.Event()
+
+    async def query_batch(requests):
+        await release.wait()
+        return [f"resp:{r}" for r in requests]
+
+    batcher = MicroBatcher("qdrant:places", query_batch, max_batch_size=1, max_wait_ms=0, max_in_flight=2)
+    waiters = [asyncio.ensure_future(batcher.submit(i)) for i in range(2)]
+    await asyncio.sleep(0.01)
+    assert len(batcher._batch_tasks) == 2
+
+    asyncio.get_running_loop().call_later(0.01, release.set)
+    await batcher.aclose()
+
+    assert not batcher._batch_tasks
+    assert await asyncio.gather(*waiters) == ["resp:0", "resp:1"]
@@ -0,0 +1,32 @@
+import pytest
+
+from app.core.retrieval.photo_urls import PhotoUrlIndex, select_photo_urls
+from app.core.retrieval.place import PlaceRetriever, _fetch_photo_urls_by_contentids
+
+
+def test_select_photo_urls_dedupes_and_skips_inline_images():
+    urls = ["https://a/1.jpg", "data:image/jpeg;base64,AAAA", "https://a/1.jpg", "", "https://a/2.jpg", "https://a/3.jpg"]
+    assert select_photo_urls(urls, max_urls=2) == ["https://a/1.jpg", "https://a/2.jpg"]
+
+
+def test_index_lookup_and_payload_updates():
+    index = PhotoUrlIndex([(126508, ["https://a/1.jpg", "https://a/2.jpg", "https://a/3.jpg", "https://a/4.jpg"]), (7, [])])
+    index.update_from_payloads([(9, {"title": "새 장소", "photo_urls": ["https://b/1.jpg"]}), (10, {"title": "사진 없음"})])
+
+    assert index.get_many([126508, "9", 10, None], per_place=3) == {
+        "126508": ["https://a/1.jpg", "https://a/2.jpg", "https://a/3.jpg"],
+        "9": ["https://b/1.jpg"],
+        "10": [],
+    }
+    assert index.stats() == {"places": 2, "urls": 5}
+
+
+@pytest.mark.asyncio
+async def test_fetch_photo_urls_uses_index_without_scroll():
+    retriever = PlaceRetriever.__new__(PlaceRetriever)
+    retriever.photo_url_index = PhotoUrlIndex([(1, ["https://a/1.jpg", "https://a/2.jpg"])])
+    # aclient 미설정: photos scroll을 시도하면 AttributeError
+
+    photo_map = await _fetch_photo_urls_by_contentids(retriever, content_ids=[1, 2], per_place=1)
+
+    assert photo_map == {"1": ["https://a/1.jpg"], "2": []}
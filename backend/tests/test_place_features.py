@@ -0,0 +1,56 @@
+from app.core.retrieval.place_features import PlaceFeatureStore
+from app.core.retrieval.place_score import PlaceScorer, _extract_place_features
+
+
+class _Scorer(PlaceScorer):
+    def __init__(self, with_store: bool):
+        self.place_features = PlaceFeatureStore(_extract_place_features, max_size=2) if with_store else None
+
+
+PAYLOAD = {
+    "contentid": "126508",
+    "title": "봉피양 방이점",
+    "contenttypeid": "음식점",
+    "addr": "서울특별시 송파구 양재대로 71길 1-4",
+    "addr_tokens": ["서울특별시", "송파구", "송파", "양재대로"],
+    "geo": {"lat": 37.5123, "lon": 127.1175},
+}
+
+
+def _scores(scorer: PlaceScorer) -> tuple:
+    return (
+        scorer._keyword_match_bonus("봉피양 방이점 예약", PAYLOAD),
+        scorer._location_text_bonus("송파구", PAYLOAD),
+        scorer._geo_proximity_bonus(PAYLOAD, 37.51, 127.11),
+        scorer._addr_sparse_bonus(["송파구", "양재"], payload=PAYLOAD),
+        scorer._addr_sparse_bonus(["송파구", "양재"], scorer._payload_addr_tokens(PAYLOAD)),
+    )
+
+
+def test_scores_with_feature_store_match_plain_payload_scoring():
+    cached = _scores(_Scorer(with_store=True))
+    plain = _scores(_Scorer(with_store=False))
+
+    assert cached == plain
+    assert cached[0] > 0.0
+    assert cached[3] == cached[4] > 0.0
+
+
+def test_store_computes_once_per_place_and_refreshes_on_payload_change():
+    scorer = _Scorer(with_store=True)
+    store = scorer.place_features
+
+    first = scorer._place_features(PAYLOAD)
+    assert scorer._place_features(dict(PAYLOAD)) is first
+    assert store.stats()["misses"] == 1
+
+    # photos payload처럼 주소가 없는 payload로 바뀌면 재계산
+    slim = {"contentid": "126508", "title": "봉피양 방이점"}
+    assert scorer._place_features(slim).addr_tokens != first.addr_tokens
+
+
+def test_store_is_bounded():
+    scorer = _Scorer(with_store=True)
+    for cid in ("1", "2", "3"):
+        scorer._place_features({"contentid": cid, "title": f"장소{cid}"})
+    assert scorer.place_features.stats()["size"] == 2
@@ -0,0 +1,65 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.core.retrieval.place import HybridSearchRequest, PlaceRetriever
+from app.scripts.preprocess_data import aggregate_image_vectors
+from app.utils.config import PHOTOS_COLLECTION, PLACES_COLLECTION
+
+
+def test_aggregate_image_vectors_mean_and_medoid():
+    vectors = [np.array([2.0, 0.0]), np.array([0.0, 1.0]), np.array([1.0, 1.0])]
+
+    mean = aggregate_image_vectors(vectors, "mean")
+    assert np.linalg.norm(mean) == pytest.approx(1.0)
+    assert mean[0] == pytest.approx(mean[1])
+
+    # 나머지 사진들과 가장 가까운 실제 사진 벡터 (정규화)
+    medoid = aggregate_image_vectors(vectors, "medoid")
+    assert np.allclose(medoid, np.array([1.0, 1.0]) / np.sqrt(2.0))
+
+    assert aggregate_image_vectors([], "mean") is None
+
+
+def _retriever(collection):
+    retriever = PlaceRetriever.__new__(PlaceRetriever)
+    retriever.lexical_index = None
+    retriever.spatial_index = None
+    retriever.text_to_image_collection = collection
+    calls = []
+
+    async def query_places_image(vector, query_filter, limit):
+        calls.append(("places", limit))
+        return [SimpleNamespace(id=pid, payload={"contentid": str(pid)}, score=0.3) for pid in (3, 4)]
+
+    async def query_photos_dense(vector, query_filter, limit):
+        calls.append(("photos", limit))
+        # 같은 장소의 사진 여러 장 → 장소 단위로 합쳐짐
+        return [
+            SimpleNamespace(id=f"photo-{i}", payload={"contentid": str(pid)}, score=0.3)
+            for i, pid in enumerate((3, 3, 4))
+        ]
+
+    retriever._query_places_image = query_places_image
+    retriever._query_photos_dense = query_photos_dense
+    return retriever, calls
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "collection,expected_call",
+    [(PLACES_COLLECTION, ("places", 10)), (PHOTOS_COLLECTION, ("photos", 30))],
+)
+async def test_text_to_image_channel_uses_place_vector_when_available(collection, expected_call):
+    retriever, calls = _retriever(collection)
+    defaults = {"candidate_k": 10, "top_k": 5, "rerank_max_k": 10}
+
+    stage = await retriever._search_first_stage(
+        HybridSearchRequest(query="노을 지는 바다", limit=5), "photo_only", defaults,
+        text_emb=None, clip_text_emb=np.zeros(4),
+    )
+
+    assert calls == [expected_call]
+    assert [c["id"] for c in stage.candidates] == [3, 4]
+    assert stage.candidates[0]["match_types"] == ["text_to_image"]
@@ -0,0 +1,99 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.retrieval.fusion import CandidatePool
+from app.core.retrieval.place import PlaceRetriever
+from app.core.retrieval.place_payloads import (
+    FIRST_STAGE_PAYLOAD_FIELDS,
+    PlacePayloadCache,
+    is_place_payload,
+    slim_photo_payload,
+)
+
+
+def test_slim_photo_payload_keeps_only_lookup_fields():
+    place = {
+        "contentid": 126508,
+        "contenttypeid": "관광지",
+        "title": "경복궁",
+        "description": "조선 왕조의 법궁" * 50,
+        "addr_tokens": ["서울특별시", "종로구"],
+        "geo": {"lat": 37.5796, "lon": 126.977},
+        "image": "https://example.com/main.jpg",
+    }
+
+    slim = slim_photo_payload(place, "https://example.com/2.jpg")
+
+    assert slim == {
+        "contentid": "126508",
+        "contenttypeid": "관광지",
+        "image_url": "https://example.com/2.jpg",
+        "geo": {"lat": 37.5796, "lon": 126.977},
+    }
+    assert not is_place_payload(slim) and is_place_payload(place)
+
+
+def test_payload_cache_skips_photo_payloads_and_resets_on_version_change():
+    version = {"places": 1}
+    cache = PlacePayloadCache(max_size=2, version_fn=lambda: version["places"])
+    cache.put_many([(1, {"title": "a"}), (2, {"contentid": "2"}), (3, {"title": "c"}), (4, {"title": "d"})])
+
+    assert cache.get_many([1, 2, 3, 4]) == {3: {"title": "c"}, 4: {"title": "d"}}
+
+    version["places"] = 2
+    assert cache.get_many([3]) == {}
+
+
+@pytest.mark.asyncio
+async def test_hydration_uses_cache_then_single_retrieve():
+    retrieved = []
+
+    async def retrieve(collection_name, ids, with_payload, with_vectors):
+        retrieved.append((list(ids), with_payload))
+        return [SimpleNamespace(id=pid, payload={"contentid": str(pid), "title": f"장소{pid}"}) for pid in ids]
+
+    retriever = PlaceRetriever.__new__(PlaceRetriever)
+    retriever.place_payloads = PlacePayloadCache()
+    retriever.place_payloads.put_many([(1, {"contentid": "1", "title": "캐시 장소"})])
+    retriever._aclient = SimpleNamespace(retrieve=retrieve)
+    retriever._aclient_loop = asyncio.get_running_loop()
+
+    pool = CandidatePool()
+    pool.add_ranked([5], [{"contentid": "5", "title": "places hit"}], 1.0, "text_semantic", payload_mode="replace")
+    pool.add_ranked([1, 2, 3], [{"contentid": "1"}, {"contentid": "2"}, None], 1.0, "image_visual")
+
+    await retriever._hydrate_place_payloads(pool)
+
+    assert retrieved == [([2, 3], list(FIRST_STAGE_PAYLOAD_FIELDS))]
+    assert [p["title"] for p in pool.payloads] == ["places hit", "캐시 장소", "장소2", "장소3"]
+    # projection 조회 결과는 전체 payload 캐시에 넣지 않음
+    assert retriever.place_payloads.get_many([2, 3]) == {}
+
+
+@pytest.mark.asyncio
+async def test_final_results_get_full_payload_with_one_retrieve():
+    retrieved = []
+
+    async def retrieve(collection_name, ids, with_payload, with_vectors):
+        retrieved.append((list(ids), with_payload))
+        return [SimpleNamespace(id=pid, payload={"title": f"장소{pid}", "description": "긴 설명"}) for pid in ids]
+
+    retriever = PlaceRetriever.__new__(PlaceRetriever)
+    retriever.place_payloads = PlacePayloadCache()
+    retriever._aclient = SimpleNamespace(retrieve=retrieve)
+    retriever._aclient_loop = asyncio.get_running_loop()
+    outputs = [
+        [{"id": 1, "payload": {"title": "장소1"}}, {"id": 2, "payload": {"title": "장소2"}}],
+        ValueError("failed request"),
+        [{"id": 2, "payload": {"title": "장소2"}}],
+    ]
+
+    await retriever._hydrate_final_results(outputs)
+    await retriever._hydrate_final_results([[{"id": 1, "payload": {}}]])
+
+    # 요청 간 중복 id는 1회만, 두 번째 호출은 캐시 hit
+    assert retrieved == [([1, 2], True)]
+    assert outputs[0][1]["payload"]["description"] == "긴 설명"
+    assert outputs[2][0]["payload"] == outputs[0][1]["payload"]
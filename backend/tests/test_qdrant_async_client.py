@@ -0,0 +1,41 @@
+import asyncio
+
+from app.core.retrieval import place as place_module
+from app.core.retrieval.place import PlaceRetriever
+
+
+class FakeAsyncClient:
+    instances = []
+
+    def __init__(self, **kwargs):
+        self.closed = False
+        FakeAsyncClient.instances.append(self)
+
+    async def close(self):
+        self.closed = True
+
+
+def test_aclient_is_recreated_per_loop_and_stale_client_closed(monkeypatch):
+    FakeAsyncClient.instances = []
+    monkeypatch.setattr(place_module, "AsyncQdrantClient", FakeAsyncClient)
+    retriever = PlaceRetriever.__new__(PlaceRetriever)
+    retriever._qdrant_host, retriever._qdrant_port = "localhost", 6333
+    retriever._aclient = retriever._aclient_loop = None
+    retriever._background_tasks = set()
+    retriever._text_batcher = retriever._clip_batcher = retriever._rerank_batcher = None
+    retriever._query_batchers = {}
+
+    async def use():
+        client = retriever.aclient
+        assert retriever.aclient is client  # 같은 loop에서는 재사용
+        await asyncio.sleep(0)  # 이전 client close task 실행
+        return client
+
+    first = asyncio.run(use())
+    second = asyncio.run(use())
+
+    assert first is not second and len(FakeAsyncClient.instances) == 2
+    assert first.closed and not second.closed
+
+    asyncio.run(retriever.aclose())
+    assert second.closed and retriever._aclient is None
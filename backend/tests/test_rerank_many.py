@@ -0,0 +1,65 @@
+import pytest
+
+from app.core.retrieval.place_score import PlaceScorer
+
+
+class _FakeReranker:
+    def __init__(self):
+        self.calls = []
+
+    def predict(self, pairs, batch_size=32):
+        self.calls.append(list(pairs))
+        # 문서 텍스트 길이를 logit으로 사용 → 긴 문서가 상위
+        return [float(len(doc)) for _, doc in pairs]
+
+
+class _Scorer(PlaceScorer):
+    def __init__(self):
+        self._reranker = _FakeReranker()
+        self._reranker_load_attempted = True
+
+
+def _candidate(title: str) -> dict:
+    return {"id": title, "payload": {"title": title}}
+
+
+@pytest.mark.asyncio
+async def test_rerank_many_uses_single_predict_call():
+    scorer = _Scorer()
+    jobs = [
+        ("카페", [_candidate("a"), _candidate("ccc"), _candidate("bb")], 2),
+        ("맛집", [_candidate("dddd"), _candidate("e")], 5),
+    ]
+
+    results = await scorer._rerank_candidates_many(jobs)
+
+    assert len(scorer._reranker.calls) == 1
+    assert len(scorer._reranker.calls[0]) == 5
+    assert [c["id"] for c in results[0]] == ["ccc", "bb"]
+    assert [c["final_rank"] for c in results[0]] == [1, 2]
+    assert [c["id"] for c in results[1]] == ["dddd", "e"]
+
+
+@pytest.mark.asyncio
+async def test_rerank_many_keeps_order_for_empty_query():
+    scorer = _Scorer()
+    jobs = [
+        ("", [_candidate("a"), _candidate("ccc")], 2),
+        ("카페", [_candidate("b"), _candidate("dd")], 2),
+    ]
+
+    results = await scorer._rerank_candidates_many(jobs)
+
+    assert [c["id"] for c in results[0]] == ["a", "ccc"]
+    assert all(c["rerank_score"] is None for c in results[0])
+    assert [c["id"] for c in results[1]] == ["dd", "b"]
+    assert len(scorer._reranker.calls[0]) == 2
+
+
+@pytest.mark.asyncio
+async def test_rerank_candidates_matches_many():
+    scorer = _Scorer()
+    single = await scorer._rerank_candidates("카페", [_candidate("a"), _candidate("ccc")], 1)
+
+    assert [c["id"] for c in single] == ["ccc"]
+    assert single[0]["final_rank"] == 1
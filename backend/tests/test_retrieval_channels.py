@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from app.core.retrieval.channels import ChannelRunner
+
+
+@pytest.mark.asyncio
+async def test_channels_run_concurrently_and_keep_launch_order():
+    async def slow():
+        await asyncio.sleep(0.05)
+        return ["slow"]
+
+    async def fast():
+        await asyncio.sleep(0.0)
+        return ["fast"]
+
+    runner = ChannelRunner(default_timeout_s=1.0)
+    runner.launch("slow", slow)
+    runner.launch("fast", fast)
+
+    started = asyncio.get_running_loop().time()
+    results = await runner.gather()
+    elapsed = asyncio.get_running_loop().time() - started
+
+    assert list(results.keys()) == ["slow", "fast"]
+    assert results["slow"].points == ["slow"]
+    assert results["fast"].points == ["fast"]
+    assert elapsed < 0.1
+
+
+@pytest.mark.asyncio
+async def test_slow_channel_is_dropped_after_timeout():
+    async def hang():
+        await asyncio.sleep(1.0)
+        return ["never"]
+
+    async def ok():
+        return ["ok"]
+
+    runner = ChannelRunner(default_timeout_s=1.0)
+    runner.launch("hang", hang, timeout_s=0.01)
+    runner.launch("ok", ok)
+    results = await runner.gather()
+
+    assert results["hang"].status == "timeout"
+    assert results["hang"].points == []
+    assert results["ok"].points == ["ok"]
+
+
+@pytest.mark.asyncio
+async def test_failed_channel_returns_empty_result():
+    async def boom():
+        raise RuntimeError("qdrant down")
+
+    runner = ChannelRunner(default_timeout_s=1.0)
+    runner.launch("boom", boom)
+    results = await runner.gather()
+
+    assert results["boom"].status == "error"
+    assert results["boom"].points == []
+    assert "qdrant down" in results["boom"].error
+
+
+@pytest.mark.asyncio
+async def test_dependent_channel_waits_only_for_its_dependencies():
+    async def place():
+        return ["p1", "p2"]
+
+    async def photo():
+        await asyncio.sleep(0.2)
+        return ["photo"]
+
+    finished = {}
+
+    async def rescore(deps):
+        finished["at"] = asyncio.get_running_loop().time()
+        return list(reversed(deps["place"].points))
+
+    runner = ChannelRunner(default_timeout_s=1.0)
+    started = asyncio.get_running_loop().time()
+    runner.launch("place", place)
+    runner.launch("photo", photo)
+    runner.launch("bm25", rescore, after=["place"])
+    results = await runner.gather()
+
+    assert results["bm25"].points == ["p2", "p1"]
+    assert finished["at"] - started < 0.1
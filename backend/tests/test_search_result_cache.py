@@ -0,0 +1,83 @@
+import time
+
+import pytest
+
+from app.agents.models.output import CategoryType
+from app.core.retrieval.place import HybridSearchRequest, PlaceRetriever
+from app.core.retrieval.result_cache import SearchResultCache, build_search_key
+from app.utils.collection_version import bump_collection_version, get_collection_versions
+
+PARAMS = {"candidate_k": 30, "top_k": 10, "rerank_max_k": 30}
+
+
+def _key(**kwargs):
+    return build_search_key(HybridSearchRequest(**kwargs), "auto", PARAMS, grid_deg=0.005)
+
+
+def test_key_is_canonical_and_snaps_user_coordinates():
+    base = _key(query="홍대  카페 ", categories=[CategoryType.TOURIST_ATTRACTION, CategoryType.RESTAURANT])
+    assert base == _key(query="홍대 카페", categories=[CategoryType.RESTAURANT, CategoryType.TOURIST_ATTRACTION])
+
+    # 같은 격자 셀(약 500m) 안의 사용자 좌표는 같은 키
+    near = _key(query="카페", user_latitude=37.55612, user_longitude=126.92281)
+    assert near == _key(query="카페", user_latitude=37.55598, user_longitude=126.92349)
+    assert near != _key(query="카페", user_latitude=37.5700, user_longitude=126.9228)
+
+    assert base != _key(query="홍대 카페", categories=[CategoryType.TOURIST_ATTRACTION])
+    assert _key(query="카페") != build_search_key(
+        HybridSearchRequest(query="카페"), "auto", {**PARAMS, "top_k": 5}, grid_deg=0.005
+    )
+
+
+def test_ttl_lru_and_saved_latency():
+    cache = SearchResultCache(max_size=2, ttl_s=0.05)
+    cache.put("a", [{"id": 1}], elapsed_ms=120.0)
+    cache.put("b", [{"id": 2}], elapsed_ms=80.0)
+
+    hit = cache.get("a")
+    assert hit == [{"id": 1}]
+    hit[0]["id"] = 99  # 반환값 수정이 캐시에 영향 없음
+    assert cache.get("a") == [{"id": 1}]
+
+    cache.put("c", [{"id": 3}], elapsed_ms=10.0)  # b 퇴출 (a는 최근 사용)
+    assert cache.get("b") is None
+    time.sleep(0.06)
+    assert cache.get("a") is None
+
+    stats = cache.stats()
+    assert stats["hits"] == 2 and stats["misses"] == 2
+    assert stats["saved_ms"] == 240.0
+    assert stats["evictions"] == 1
+
+
+def test_collection_version_bump_invalidates(tmp_path):
+    path = str(tmp_path / "collection_versions.json")
+    assert get_collection_versions(path) == {}
+
+    cache = SearchResultCache(version_fn=lambda: get_collection_versions(path).get("places"))
+    cache.put("k", [{"id": 1}], elapsed_ms=1.0)
+    assert cache.get("k") is not None
+
+    bump_collection_version("places", path=path)
+    assert cache.get("k") is None
+    assert cache.stats()["invalidations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_run_hybrid_requests_serves_repeats_from_cache():
+    retriever = PlaceRetriever.__new__(PlaceRetriever)
+    retriever.search_cache = SearchResultCache()
+    retriever.semantic_cache = None
+    executed = []
+
+    async def execute(requests, scopes, defaults, partial=None):
+        executed.extend(r.query for r in requests)
+        return [[{"id": len(executed), "payload": {}}] if r.query else [] for r in requests]
+
+    retriever._execute_hybrid_requests = execute
+    first = await retriever._run_hybrid_requests([HybridSearchRequest(query="성수 카페"), HybridSearchRequest(query="")])
+    second = await retriever._run_hybrid_requests([HybridSearchRequest(query="성수  카페"), HybridSearchRequest(query="")])
+
+    assert second == first
+    # 빈 결과는 캐싱하지 않으므로 두 번째 요청에서 다시 실행
+    assert executed == ["성수 카페", "", ""]
@@ -0,0 +1,119 @@
+import time
+
+import numpy as np
+import pytest
+
+from app.core.retrieval import place as place_module
+from app.core.retrieval.place import HybridSearchRequest, PlaceRetriever
+from app.core.retrieval.semantic_cache import SemanticQueryCache
+
+
+def _vec(*values):
+    return np.asarray(values, dtype=np.float32)
+
+
+def test_lookup_requires_threshold_and_same_signature():
+    cache = SemanticQueryCache(threshold=0.9)
+    cache.put(_vec(1.0, 0.0, 0.0), "sig-a", "홍대 분위기 좋은 카페", [{"id": 1}])
+
+    hit = cache.lookup(_vec(0.95, 0.05, 0.0), "sig-a")
+    assert hit is not None and hit["query"] == "홍대 분위기 좋은 카페"
+    assert hit["similarity"] > 0.99
+    # 반환값 수정이 캐시 원본에 영향 없음
+    hit["results"].append({"id": 2})
+    assert cache.lookup(_vec(1.0, 0.0, 0.0), "sig-a")["results"] == [{"id": 1}]
+
+    assert cache.lookup(_vec(0.0, 1.0, 0.0), "sig-a") is None
+    assert cache.lookup(_vec(1.0, 0.0, 0.0), "sig-b") is None
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 2
+
+
+def test_lru_eviction_reuses_slots_and_version_change_clears():
+    version = {"places": 1}
+    cache = SemanticQueryCache(max_size=2, threshold=0.9, version_fn=lambda: version["places"])
+    cache.put(_vec(1.0, 0.0), "s", "a", [{"id": "a"}])
+    cache.put(_vec(0.0, 1.0), "s", "b", [{"id": "b"}])
+    cache.lookup(_vec(1.0, 0.0), "s")  # a를 최근 사용으로
+    cache.put(_vec(-1.0, 0.0), "s", "c", [{"id": "c"}])
+
+    assert cache.lookup(_vec(0.0, 1.0), "s") is None
+    assert cache.lookup(_vec(1.0, 0.0), "s")["query"] == "a"
+    assert cache.lookup(_vec(-1.0, 0.0), "s")["query"] == "c"
+
+    version["places"] = 2
+    assert cache.lookup(_vec(1.0, 0.0), "s") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_quality_guard_disables_cache_after_low_audits():
+    cache = SemanticQueryCache(threshold=0.5, min_quality=0.7, min_audits=3)
+    cache.put(_vec(1.0, 0.0), "s", "q", [{"id": 1}])
+
+    assert cache.record_audit(["1", "2"], ["1", "2"], k=2) == pytest.approx(1.0)
+    cache.record_audit(["9"], ["1"], k=1)
+    assert cache.enabled
+    cache.record_audit(["9"], ["1"], k=1)
+
+    assert not cache.enabled
+    assert cache.lookup(_vec(1.0, 0.0), "s") is None
+
+
+def _disable(cache):
+    for _ in range(cache.min_audits):
+        cache.record_audit(["9"], ["1"], k=1)
+    assert not cache.enabled
+
+
+def test_quality_guard_resets_on_version_change_or_cooldown(monkeypatch):
+    version = {"places": "v1"}
+    cache = SemanticQueryCache(threshold=0.5, min_audits=2, version_fn=lambda: version["places"], disable_cooldown_s=60)
+    cache.put(_vec(1.0, 0.0), "s", "q", [{"id": 1}])
+    _disable(cache)
+    assert cache.lookup(_vec(1.0, 0.0), "s") is None and not cache.enabled
+
+    # 컬렉션 버전 변경 → audit 초기화 후 재개 (이전 결과는 비워짐)
+    version["places"] = "v2"
+    assert cache.lookup(_vec(1.0, 0.0), "s") is None
+    assert cache.enabled and cache.stats()["audits"] == 0
+    cache.put(_vec(1.0, 0.0), "s", "q", [{"id": 2}])
+    assert cache.lookup(_vec(1.0, 0.0), "s")["results"] == [{"id": 2}]
+
+    # 버전이 그대로면 cooldown이 지난 뒤 재개
+    _disable(cache)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 30)
+    assert cache.lookup(_vec(1.0, 0.0), "s") is None and not cache.enabled
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+    cache.lookup(_vec(1.0, 0.0), "s")
+    assert cache.enabled and cache.stats()["audits"] == 0
+
+
+@pytest.mark.asyncio
+async def test_run_hybrid_requests_serves_paraphrase_from_semantic_cache(monkeypatch):
+    monkeypatch.setattr(place_module, "SEMANTIC_CACHE_AUDIT_RATE", 0.0)
+    vectors = {"홍대 분위기 좋은 카페": _vec(1.0, 0.0), "홍대 감성 카페 추천": _vec(0.97, 0.1), "부산 국밥": _vec(0.0, 1.0)}
+    retriever = PlaceRetriever.__new__(PlaceRetriever)
+    retriever.search_cache = None
+    retriever.semantic_cache = SemanticQueryCache(threshold=0.92)
+    retriever._background_tasks = set()
+    executed = []
+
+    async def encode(texts):
+        return [vectors[text] for text in texts]
+
+    async def execute(requests, scopes, defaults, partial=None):
+        executed.extend(r.query for r in requests)
+        return [[{"id": len(executed), "payload": {}}] for _ in requests]
+
+    retriever._aencode_texts = encode
+    retriever._execute_hybrid_requests = execute
+
+    first = await retriever._run_hybrid_requests([HybridSearchRequest(query="홍대 분위기 좋은 카페")])
+    second = await retriever._run_hybrid_requests([HybridSearchRequest(query="홍대 감성 카페 추천")])
+    # 필터 서명이 다르면(limit) 재사용하지 않음
+    third = await retriever._run_hybrid_requests([HybridSearchRequest(query="홍대 감성 카페 추천", limit=10)])
+    await retriever._run_hybrid_requests([HybridSearchRequest(query="부산 국밥")])
+
+    assert second == first
+    assert third != first
+    assert executed == ["홍대 분위기 좋은 카페", "홍대 감성 카페 추천", "부산 국밥"]
@@ -0,0 +1,91 @@
+import math
+import random
+
+from app.core.retrieval.spatial_index import SpatialIndex
+
+
+def _haversine(lat1, lon1, lat2, lon2):
+    dlat = math.radians(lat2 - lat1)
+    dlon = math.radians(lon2 - lon1)
+    a = math.sin(dlat / 2) ** 2 + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(dlon / 2) ** 2
+    return 6371 * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+def _records(n=500, seed=3):
+    rng = random.Random(seed)
+    records = []
+    for pid in range(1, n + 1):
+        payload = {
+            "contentid": str(pid),
+            "contenttypeid": rng.choice(["관광지", "음식점", "카페"]),
+            "geo": {"lat": 37.5 + rng.uniform(-0.3, 0.3), "lon": 127.0 + rng.uniform(-0.3, 0.3)},
+        }
+        records.append((pid, payload))
+    # 좌표 없는 장소는 색인 제외
+    records.append((n + 1, {"contentid": str(n + 1), "title": "좌표 없음"}))
+    return records
+
+
+def _brute_force(records, lat, lng, k, radius_km=None, category=None):
+    rows = []
+    for pid, payload in records:
+        geo = payload.get("geo")
+        if not geo or (category and payload["contenttypeid"] != category):
+            continue
+        dist = _haversine(lat, lng, geo["lat"], geo["lon"])
+        if radius_km is None or dist <= radius_km:
+            rows.append((dist, pid))
+    return [pid for _, pid in sorted(rows)[:k]]
+
+
+def test_knn_and_radius_match_brute_force():
+    records = _records()
+    index = SpatialIndex.from_payloads(records)
+    assert len(index) == 500
+
+    hits = index.search(37.55, 126.98, k=10)
+    assert [pid for pid, _ in hits] == _brute_force(records, 37.55, 126.98, 10)
+    distances = [dist for _, dist in hits]
+    assert distances == sorted(distances)
+
+    hits = index.search(37.55, 126.98, k=50, radius_km=5.0, categories=["음식점"])
+    assert [pid for pid, _ in hits] == _brute_force(records, 37.55, 126.98, 50, radius_km=5.0, category="음식점")
+    assert all(dist <= 5.0 for _, dist in hits)
+
+
+def test_retriever_rebuilds_index_when_places_version_changes(monkeypatch):
+    import threading
+    import time
+
+    from app.core.retrieval import place as place_module
+    from app.core.retrieval.place import PlaceRetriever
+
+    versions = {place_module.PLACES_COLLECTION: "v1"}
+    builds = []
+
+    def build(client, collection_name):
+        builds.append(collection_name)
+        return SpatialIndex.from_payloads(_records(n=10))
+
+    monkeypatch.setattr(place_module, "get_collection_versions", lambda: versions)
+    monkeypatch.setattr(place_module, "build_spatial_index", build)
+    monkeypatch.setattr(place_module, "SPATIAL_INDEX_REFRESH_S", 0)
+    retriever = PlaceRetriever.__new__(PlaceRetriever)
+    retriever.client = None
+    retriever.spatial_index = SpatialIndex.from_payloads(_records(n=5))
+    retriever._spatial_version = "v1"
+    retriever._spatial_checked_at = time.monotonic()
+    retriever._spatial_refresh_lock = threading.Lock()
+
+    # 버전이 같으면 재생성하지 않음
+    retriever._maybe_refresh_spatial_index()
+    assert builds == []
+
+    versions[place_module.PLACES_COLLECTION] = "v2"
+    retriever._maybe_refresh_spatial_index()
+    with retriever._spatial_refresh_lock:  # 백그라운드 재생성 종료 대기
+        pass
+    assert len(builds) == 1 and len(retriever.spatial_index) == 10 and retriever._spatial_version == "v2"
+
+    retriever._maybe_refresh_spatial_index()
+    assert len(builds) == 1
@@ -0,0 +1,120 @@
+import asyncio
+import time
+
+import pytest
+
+from app.agents import speculative
+from app.agents.models.output import CategoryType, IntentLocation, IntentSlots
+from app.agents.retriever import _search_for_general, build_speculative_request
+from app.core.retrieval.place import PlaceRetriever
+
+
+class FakeRetriever:
+    def __init__(self, delay_s=0.0):
+        self.delay_s = delay_s
+        self.queries = []
+
+    async def search_hybrid_many(self, requests):
+        self.queries.extend((r.query, tuple(r.categories or ()), r.preferred_location) for r in requests)
+        await asyncio.sleep(self.delay_s)
+        return [[{"id": len(self.queries), "payload": {}}] for _ in requests]
+
+
+def _state(user_input, slots=None, update_user_input=None):
+    return {"user_input": user_input, "update_user_input": update_user_input, "slots": slots}
+
+
+def test_guess_slots_matches_landmark_alias_and_category_keywords():
+    slots = speculative.guess_slots("홍대입구 근처 분위기 좋은 카페 추천해줘")
+    assert slots.location.name == "홍대"
+    assert slots.categories == [CategoryType.RESTAURANT]
+
+    # 한 글자 키워드("궁")는 추정에 쓰지 않음
+    assert speculative.guess_slots("궁금한 게 있어").categories is None
+
+
+@pytest.mark.asyncio
+async def test_speculative_pool_is_reused_when_intent_slots_match(monkeypatch):
+    fake = FakeRetriever()
+    monkeypatch.setattr(PlaceRetriever, "_instance", fake)
+    state = _state("홍대 카페 추천")
+    spec_id = speculative.start_speculative_search(lambda: build_speculative_request(state))
+    await asyncio.sleep(0.05)
+
+    intent_slots = IntentSlots(location=IntentLocation(name="홍대"), categories=[CategoryType.RESTAURANT])
+    results = await _search_for_general(
+        {**state, "speculative_search_id": spec_id, "slots": intent_slots},
+        candidate_k=20, rerank_max_k=8, search_scope="auto",
+    )
+
+    assert results == [{"id": 1, "payload": {}}]
+    assert fake.queries == [("홍대 카페 추천", (CategoryType.RESTAURANT,), "홍대")]
+
+
+@pytest.mark.asyncio
+async def test_speculative_search_is_cancelled_when_intent_rewrites_query(monkeypatch):
+    fake = FakeRetriever(delay_s=10)
+    monkeypatch.setattr(PlaceRetriever, "_instance", fake)
+    state = _state("거기 근처 맛집")
+    spec_id = speculative.start_speculative_search(lambda: build_speculative_request(state))
+    await asyncio.sleep(0.05)
+    task = speculative._pending[spec_id].task
+    fake.delay_s = 0
+
+    results = await _search_for_general(
+        {**state, "speculative_search_id": spec_id, "update_user_input": "홍대 근처 맛집",
+         "slots": IntentSlots(location=IntentLocation(name="홍대"), categories=[CategoryType.RESTAURANT])},
+        candidate_k=20, rerank_max_k=8, search_scope="auto",
+    )
+    await asyncio.sleep(0)
+
+    assert task.cancelled()
+    assert [q[0] for q in fake.queries] == ["거기 근처 맛집", "홍대 근처 맛집"]
+    assert results == [{"id": 2, "payload": {}}]
+    assert spec_id not in speculative._pending
+
+
+@pytest.mark.asyncio
+async def test_fast_intent_waits_for_speculative_request_build(monkeypatch):
+    fake = FakeRetriever()
+    monkeypatch.setattr(PlaceRetriever, "_instance", fake)
+    state = _state("홍대 카페 추천")
+
+    def slow_build():
+        time.sleep(0.1)  # 역지오코딩 HTTP 등
+        return build_speculative_request(state)
+
+    spec_id = speculative.start_speculative_search(slow_build)
+    hits_before = speculative.speculation_stats()["hits"]
+
+    # intent fast path처럼 요청 생성 완료 전에 바로 소비
+    intent_slots = IntentSlots(location=IntentLocation(name="홍대"), categories=[CategoryType.RESTAURANT])
+    results = await _search_for_general(
+        {**state, "speculative_search_id": spec_id, "slots": intent_slots},
+        candidate_k=20, rerank_max_k=8, search_scope="auto",
+    )
+
+    assert results == [{"id": 1, "payload": {}}]
+    assert len(fake.queries) == 1
+    assert speculative.speculation_stats()["hits"] == hits_before + 1
+
+
+def test_reverse_geocode_cache_snaps_coordinates_and_skips_failures(monkeypatch):
+    from app.agents import retriever as retriever_module
+
+    calls = []
+    responses = [None, {"road_address": "서울 마포구 양화로 160"}]
+
+    def reverse_geocoder(self, latitude, longitude):
+        calls.append((latitude, longitude))
+        return responses[min(len(calls), len(responses)) - 1]
+
+    monkeypatch.setattr(retriever_module.GeoCoder, "reverse_geocoder", reverse_geocoder)
+    monkeypatch.setattr(retriever_module, "_road_cache", retriever_module.OrderedDict())
+
+    # 일시 오류(None)는 캐싱하지 않고 다음 호출에서 재시도
+    assert retriever_module._reverse_geocode_road(37.55612, 126.92281) == ""
+    assert retriever_module._reverse_geocode_road(37.55612, 126.92281) == "서울 마포구 양화로 160"
+    # 같은 격자 셀 안의 이동 좌표는 캐시 hit
+    assert retriever_module._reverse_geocode_road(37.55598, 126.92261) == "서울 마포구 양화로 160"
+    assert calls == [(37.556, 126.923), (37.556, 126.923)]